@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+#
+# Compare two runs of the benchmark suite
+#
+# Reads the JSON written by pytest-benchmark (`--benchmark-json` or
+# `--benchmark-save`) for a baseline and a current run and prints a markdown
+# table of the mean time and peak memory of every benchmark present in both,
+# marking the ones that got slower or allocate more than the threshold.
+#
+# Baselines can be given as a path or as the name passed to
+# `--benchmark-save`, in which case the latest matching file in the
+# benchmark storage directory is used.
+from __future__ import annotations
+
+import json
+import math
+import sys
+from pathlib import Path
+from typing import Any, Mapping
+
+import click
+
+STORAGE = Path(".benchmarks")
+
+
+def resolve_run(path_or_name: str, storage: Path = STORAGE) -> Path:
+    path = Path(path_or_name)
+    if path.is_file():
+        return path
+
+    candidates = sorted(
+        storage.glob(f"*/*_{path_or_name}.json"), key=lambda p: p.stat().st_mtime
+    )
+    if not candidates:
+        raise click.BadParameter(
+            f"{path_or_name!r} is neither a file nor a benchmark saved in {storage}"
+        )
+    return candidates[-1]
+
+
+def load_run(path: Path) -> dict[str, Mapping[str, Any]]:
+    with path.open() as f:
+        data = json.load(f)
+    return {
+        bench["fullname"]: {
+            "group": bench["group"],
+            "mean": bench["stats"]["mean"],
+            "peak_memory": bench.get("extra_info", {}).get("peak_memory"),
+        }
+        for bench in data["benchmarks"]
+    }
+
+
+def ratio(current: float | None, baseline: float | None) -> float:
+    if not current or not baseline:
+        return math.nan
+    return current / baseline
+
+
+def format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e3), ("us", 1e6)):
+        if seconds * scale >= 1:
+            return f"{seconds * scale:.2f}{unit}"
+    return f"{seconds * 1e9:.0f}ns"
+
+
+def format_bytes(num_bytes: int | None) -> str:
+    if num_bytes is None:
+        return ""
+    for unit in ("B", "KiB", "MiB"):
+        if num_bytes < 1024:
+            return f"{num_bytes:.1f}{unit}"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f}GiB"
+
+
+def format_ratio(value: float) -> str:
+    return "" if math.isnan(value) else f"{value:.2f}x"
+
+
+def compare_runs(
+    baseline: Mapping[str, Mapping[str, Any]],
+    current: Mapping[str, Mapping[str, Any]],
+    threshold: float,
+) -> tuple[list[list[str]], int]:
+    rows = []
+    regressions = 0
+    for name in sorted(baseline.keys() & current.keys()):
+        old, new = baseline[name], current[name]
+        time_ratio = ratio(new["mean"], old["mean"])
+        memory_ratio = ratio(new["peak_memory"], old["peak_memory"])
+        regressed = time_ratio > 1 + threshold or memory_ratio > 1 + threshold
+        regressions += regressed
+        rows.append(
+            [
+                name,
+                format_time(old["mean"]),
+                format_time(new["mean"]),
+                format_ratio(time_ratio),
+                format_bytes(old["peak_memory"]),
+                format_bytes(new["peak_memory"]),
+                format_ratio(memory_ratio),
+                "regression" if regressed else "",
+            ]
+        )
+    return rows, regressions
+
+
+@click.command(help="Report benchmark regressions between two runs")
+@click.argument("baseline")
+@click.argument("current")
+@click.option(
+    "-t",
+    "--threshold",
+    default=0.1,
+    type=float,
+    help="Relative slowdown or memory growth reported as a regression",
+    show_default=True,
+)
+@click.option(
+    "--fail/--no-fail",
+    default=False,
+    help="Exit with an error when any benchmark regressed",
+    show_default=True,
+)
+def main(baseline: str, current: str, threshold: float, fail: bool) -> None:
+    baseline_path = resolve_run(baseline)
+    current_path = resolve_run(current)
+    rows, regressions = compare_runs(
+        load_run(baseline_path), load_run(current_path), threshold
+    )
+
+    header = [
+        "benchmark",
+        "baseline mean",
+        "current mean",
+        "time",
+        "baseline peak memory",
+        "current peak memory",
+        "memory",
+        "",
+    ]
+    click.echo(f"Comparing {current_path} against {baseline_path}\n")
+    click.echo("| " + " | ".join(header) + " |")
+    click.echo("|" + "---|" * len(header))
+    for row in rows:
+        click.echo("| " + " | ".join(row) + " |")
+    click.echo(f"\n{regressions:d} of {len(rows):d} benchmarks regressed")
+
+    if fail and regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
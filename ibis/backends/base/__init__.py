@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import abc
+import asyncio
 import collections.abc
+import concurrent.futures
 import functools
 import importlib.metadata
 import keyword
 import re
 import sys
+import threading
 import urllib.parse
+import weakref
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -573,6 +577,168 @@ class BaseBackend(abc.ABC, ResultHandler):
     def execute(self, expr: ir.Expr) -> Any:
         """Execute an expression."""
 
+    def execute_many(
+        self,
+        exprs: Iterable[ir.Expr],
+        *,
+        max_workers: int | None = None,
+        **kwargs: Any,
+    ) -> list[Any]:
+        """Execute independent expressions concurrently.
+
+        Parameters
+        ----------
+        exprs
+            Expressions to execute
+        max_workers
+            Maximum number of expressions executed at the same time. Defaults
+            to the number of connections the backend can use concurrently.
+        kwargs
+            Keyword arguments passed to `execute` for every expression
+
+        Returns
+        -------
+        list[Any]
+            The results of the expressions, in the order of `exprs`
+
+        Examples
+        --------
+        >>> import ibis
+        >>> con = ibis.duckdb.connect(pool_size=4)
+        >>> t = ibis.memtable({"x": [1, 2, 3]})
+        >>> con.execute_many([t.x.sum(), t.x.max()])
+        [6, 3]
+        """
+        exprs = list(exprs)
+        execute = functools.partial(self.execute, **kwargs)
+        if len(exprs) < 2 or max_workers == 1 or self._max_concurrency() == 1:
+            return list(map(execute, exprs))
+
+        if max_workers is None:
+            return list(self._executor.map(execute, exprs))
+
+        # bound the number of expressions in flight without resizing the
+        # shared executor
+        semaphore = threading.BoundedSemaphore(max_workers)
+        futures = []
+        try:
+            for expr in exprs:
+                semaphore.acquire()
+                future = self._executor.submit(execute, expr)
+                future.add_done_callback(lambda _: semaphore.release())
+                futures.append(future)
+            return [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+
+    async def execute_async(self, expr: ir.Expr, **kwargs: Any) -> Any:
+        """Execute an expression without blocking the running event loop.
+
+        Parameters
+        ----------
+        expr
+            Expression to execute
+        kwargs
+            Keyword arguments passed to `execute`
+
+        Returns
+        -------
+        Any
+            The result of the expression
+        """
+        loop = asyncio.get_running_loop()
+        execute = functools.partial(self.execute, expr, **kwargs)
+        return await loop.run_in_executor(self._executor, execute)
+
+    def _max_concurrency(self) -> int | None:
+        """Return the number of expressions the backend can run at once.
+
+        `None` means there is no limit imposed by the backend.
+        """
+        return None
+
+    @functools.cached_property
+    def _executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        # the executor lives as long as the backend, so that its threads keep
+        # reusing the connections they checked out of thread-local pools
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_concurrency(),
+            thread_name_prefix=f"ibis-{self.name}",
+        )
+
+    @functools.cached_property
+    def _cached_tables(self) -> weakref.WeakValueDictionary:
+        # mapping from the cached table nodes to the nodes referencing the
+        # materialized results, entries vanish once no expression refers to the
+        # materialized node anymore
+        return weakref.WeakValueDictionary()
+
+    @functools.cached_property
+    def _cache_finalizers(self) -> dict[str, weakref.finalize]:
+        return {}
+
+    def _cached(self, expr: ir.Table) -> ir.CachedTable:
+        """Materialize `expr` and return a table expression referencing it.
+
+        Parameters
+        ----------
+        expr
+            Table expression to cache
+
+        Returns
+        -------
+        CachedTable
+            Table expression referencing the materialized results
+        """
+        op = expr.op()
+        if (cached := self._cached_tables.get(op)) is None:
+            name = f"_ibis_cache_{util.guid()}"
+            cached = self._load_into_cache(name, expr)
+            self._cached_tables[op] = cached
+
+            finalizer = weakref.finalize(cached, self._finalize_cached, name)
+            # the session scoped resources are gone by the time the interpreter
+            # exits, so there is nothing to clean up
+            finalizer.atexit = False
+            self._cache_finalizers[name] = finalizer
+
+        return ir.CachedTable(cached)
+
+    def _finalize_cached(self, name: str) -> None:
+        self._cache_finalizers.pop(name, None)
+        self._clean_up_cached_table(name)
+
+    def _release_cached(self, expr: ir.CachedTable) -> None:
+        """Release the materialized results referenced by `expr`.
+
+        Parameters
+        ----------
+        expr
+            Cached table expression returned by `Table.cache()`
+        """
+        op = expr.op()
+        for original, cached in list(self._cached_tables.items()):
+            if cached is op:
+                del self._cached_tables[original]
+
+        if (finalizer := self._cache_finalizers.get(op.name)) is not None:
+            finalizer()
+
+    def _substitute_cached(self, expr: ir.Expr) -> ir.Expr:
+        """Replace the cached subtrees of `expr` with their materializations."""
+        if not (subs := dict(self._cached_tables)):
+            return expr
+        return expr.op().replace(subs).to_expr()
+
+    def _load_into_cache(self, name: str, expr: ir.Table) -> ops.TableNode:
+        """Materialize `expr` as `name` and return a node referencing it."""
+        raise NotImplementedError(f"{self.name} backend does not support caching")
+
+    def _clean_up_cached_table(self, name: str) -> None:
+        """Release the resources of the materialized table `name`."""
+        raise NotImplementedError(f"{self.name} backend does not support caching")
+
     def add_operation(self, operation: ops.Node) -> Callable:
         """Add a translation function to the backend for a specific operation.
 
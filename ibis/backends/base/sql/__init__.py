@@ -2,19 +2,25 @@ from __future__ import annotations
 
 import abc
 import contextlib
+import functools
+import hashlib
 import os
+import pickle
+import tempfile
 from functools import lru_cache
-from typing import TYPE_CHECKING, Any, Iterable, Mapping
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, Mapping, Sequence
 
 import sqlalchemy as sa
 
 import ibis.common.graph as graph
+import ibis.config
 import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
 import ibis.util as util
 from ibis.backends.base import BaseBackend
 from ibis.backends.base.sql.compiler import Compiler
+from ibis.common.caching import ArrowFileCache, CacheInfo, LRUCache, PersistentCache
 
 if TYPE_CHECKING:
     import pyarrow as pa
@@ -30,6 +36,121 @@ def _find_memtables(op):
     return graph.proceed, op if isinstance(op, ops.InMemoryTable) else None
 
 
+def _find_sources(op):
+    is_source = isinstance(op, (ops.PhysicalTable, ops.SQLQueryResult))
+    return graph.proceed, op if is_source else None
+
+
+def _file_version(path: str | os.PathLike) -> tuple[int, ...] | None:
+    """Return the modification time and size of a database file.
+
+    Write-ahead logs next to the file are taken into account since writes
+    only reach the database file itself on checkpoints.
+    """
+    version = []
+    for suffix in ("", ".wal", "-wal"):
+        try:
+            stat = os.stat(f"{os.fspath(path)}{suffix}")
+        except FileNotFoundError:
+            if not suffix:
+                return None
+        else:
+            version.extend((stat.st_mtime_ns, stat.st_size))
+    return tuple(version)
+
+
+@lru_cache(maxsize=None)
+def _compile_store(path: str, ttl: float | None) -> PersistentCache:
+    # shared by every backend so that the database file is opened once
+    return PersistentCache(path, ttl=ttl)
+
+
+@lru_cache(maxsize=None)
+def _result_store(path: str, max_bytes: int) -> ArrowFileCache:
+    # shared by every backend so that the size limit applies to the directory
+    return ArrowFileCache(path, max_bytes=max_bytes)
+
+
+def _has_flat_types(expr: ir.Expr) -> bool:
+    if isinstance(expr, ir.Table):
+        types = expr.schema().types
+    else:
+        types = [expr.type()]
+    return all(
+        dtype.is_primitive()
+        or dtype.is_string()
+        or dtype.is_timestamp()
+        or dtype.is_decimal()
+        for dtype in types
+    )
+
+
+def _pandas_to_arrow(expr: ir.Expr, result) -> pa.Table | None:
+    import pandas as pd
+    import pyarrow as pa
+
+    if isinstance(expr, ir.Column):
+        result = result.to_frame()
+    elif isinstance(expr, ir.Scalar):
+        result = pd.DataFrame({expr.get_name(): [result]})
+    try:
+        return pa.Table.from_pandas(result, preserve_index=False)
+    except pa.ArrowException:
+        return None
+
+
+def _pandas_from_arrow(expr: ir.Expr, table: pa.Table):
+    df = table.to_pandas()
+    if isinstance(expr, ir.Column):
+        return df.iloc[:, 0]
+    elif isinstance(expr, ir.Scalar):
+        return df.iat[0, 0]
+    return df
+
+
+def _arrow_to_table(expr: ir.Expr, result) -> pa.Table:
+    import pyarrow as pa
+
+    if isinstance(expr, ir.Column):
+        return pa.table({expr.get_name(): result})
+    elif isinstance(expr, ir.Scalar):
+        return pa.table({expr.get_name(): pa.array([result.as_py()], result.type)})
+    return result
+
+
+def _arrow_from_table(expr: ir.Expr, table: pa.Table):
+    if isinstance(expr, ir.Column):
+        return table.column(0).combine_chunks()
+    elif isinstance(expr, ir.Scalar):
+        return table.column(0)[0]
+    return table
+
+
+def _stable_token(value):
+    if isinstance(value, BaseBackend):
+        return value.db_identity
+    elif isinstance(value, tuple):
+        return tuple(map(_stable_token, value))
+    elif isinstance(value, dict):
+        return {k: _stable_token(v) for k, v in value.items()}
+    return value
+
+
+def _structural_digest(node: ops.Node) -> str:
+    """Return a digest of `node` which is stable across interpreter processes.
+
+    Unlike the precomputed hash of the nodes, the digest doesn't depend on
+    hash randomization so it is suitable as a key for on-disk stores.
+    """
+
+    def fn(node, **kwargs):
+        kind = f"{type(node).__module__}.{type(node).__qualname__}"
+        token = f"{kind}{_stable_token(kwargs)!r}"
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    return node.map(fn)[node]
+
+
 class BaseSQLBackend(BaseBackend):
     """Base backend class for backends that compile to SQL."""
 
@@ -91,6 +212,233 @@ class BaseSQLBackend(BaseBackend):
         # XXX
         return name
 
+    @functools.cached_property
+    def _compiled_queries(self) -> LRUCache:
+        return LRUCache(maxsize=0)
+
+    @property
+    def _compile_cache(self) -> LRUCache:
+        # the options are read on every access so that changing them applies
+        # to existing connections, the cached queries are dropped then
+        config = ibis.config.options.sql.compile_cache
+        cache = self._compiled_queries
+        if (cache.maxsize, cache.ttl) != (config.maxsize, config.ttl):
+            cache.clear()
+            cache.maxsize, cache.ttl = config.maxsize, config.ttl
+        return cache
+
+    @property
+    def _compile_store(self) -> PersistentCache | None:
+        config = ibis.config.options.sql.compile_cache
+        if config.path is None:
+            return None
+        return _compile_store(config.path, config.ttl)
+
+    def _compile_cache_key(self, expr, limit, params):
+        if limit == 'default':
+            limit = ibis.config.options.sql.default_limit
+        params = frozenset(
+            (param.op(), value) for param, value in (params or {}).items()
+        )
+        key = (expr.op(), limit, params, self.compiler)
+        try:
+            hash(key)
+        except TypeError:
+            # unhashable parameter values, the query cannot be cached
+            return None
+        return key
+
+    def _to_compiled_query(
+        self,
+        expr: ir.Expr,
+        limit: int | str | None = None,
+        params: Mapping[ir.Scalar, Any] | None = None,
+    ):
+        """Compile `expr` returning both the query AST and its compiled form.
+
+        Results are memoized in the compiled query cache if it is enabled
+        through `ibis.options.sql.compile_cache`.
+        """
+        expr = self._substitute_cached(expr)
+        if not self._compile_cache.maxsize:
+            key = None
+        else:
+            key = self._compile_cache_key(expr, limit, params)
+
+        if key is not None:
+            try:
+                query_ast, compiled = self._compile_cache[key]
+            except KeyError:
+                pass
+            else:
+                if query_ast is not None:
+                    return query_ast, compiled
+                # entries read from the on-disk store only hold the compiled
+                # query, so the AST is rebuilt without compiling it again
+                query_ast = self.compiler.to_ast_ensure_limit(
+                    expr, limit, params=params
+                )
+                self._compile_cache[key] = query_ast, compiled
+                return query_ast, compiled
+
+        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
+        result = query_ast, query_ast.compile()
+
+        if key is not None:
+            self._compile_cache[key] = result
+        return result
+
+    def _compile_store_key(self, key) -> str:
+        node, limit, params, compiler = key
+        params = sorted(
+            (_structural_digest(param), repr(value)) for param, value in params
+        )
+        token = (
+            f"{compiler.__module__}.{compiler.__qualname__}"
+            f"|{limit!r}|{params!r}|{_structural_digest(node)}"
+        )
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def compile_cache_info(self) -> CacheInfo:
+        """Return the statistics of the compiled query cache.
+
+        Returns
+        -------
+        CacheInfo
+            Named tuple of cache `hits`, `misses`, `maxsize` and `currsize`.
+        """
+        return self._compile_cache.info()
+
+    def clear_compile_cache(self) -> None:
+        """Remove all entries from the compiled query cache."""
+        self._compile_cache.clear()
+        if (store := self._compile_store) is not None:
+            store.clear()
+
+    @property
+    def _result_cache(self) -> ArrowFileCache:
+        config = ibis.config.options.sql.result_cache
+        path = config.path or os.path.join(tempfile.gettempdir(), "ibis-results")
+        return _result_store(path, config.max_bytes)
+
+    def _table_versions(self, tables: Sequence[ops.PhysicalTable]) -> Hashable | None:
+        """Return a token that changes whenever the data of `tables` changes.
+
+        The token is part of the key of cached query results. `None` means the
+        backend can't tell when data changes, results aren't cached then.
+        """
+        return None
+
+    def _result_cache_key(self, expr, limit, params, kind: str) -> str | None:
+        if not ibis.config.options.sql.result_cache.enabled:
+            return None
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return None
+
+        tables = list(graph.traverse(_find_sources, expr.op()))
+        if not all(isinstance(table, ops.DatabaseTable) for table in tables):
+            # the data of in-memory tables and SQL queries isn't versioned
+            return None
+        if (version := self._table_versions(tables)) is None:
+            return None
+        if (key := self._compile_cache_key(expr, limit, params)) is None:
+            return None
+
+        token = f"{kind}|{self.db_identity}|{self._compile_store_key(key)}|{version!r}"
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def _cached_result(
+        self,
+        expr: ir.Expr,
+        limit,
+        params,
+        kind: str,
+        compute: Callable[[], Any],
+        to_arrow: Callable[[ir.Expr, Any], pa.Table | None],
+        from_arrow: Callable[[ir.Expr, pa.Table], Any],
+    ):
+        """Return the cached result of `expr` or compute and cache it."""
+        key = self._result_cache_key(expr, limit, params, kind)
+        if key is None:
+            return compute()
+
+        cache = self._result_cache
+        try:
+            return from_arrow(expr, cache[key])
+        except KeyError:
+            pass
+
+        result = compute()
+        if (table := to_arrow(expr, result)) is not None:
+            cache[key] = table
+        return result
+
+    def result_cache_info(self) -> CacheInfo:
+        """Return the statistics of the query result cache.
+
+        Returns
+        -------
+        CacheInfo
+            Named tuple of cache `hits`, `misses`, `maxsize` and `currsize`,
+            sizes are in bytes.
+        """
+        return self._result_cache.info()
+
+    def clear_result_cache(self) -> None:
+        """Remove all entries from the query result cache."""
+        self._result_cache.clear()
+
+    def to_pyarrow(
+        self,
+        expr: ir.Expr,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        cache: bool = True,
+        **kwargs: Any,
+    ) -> pa.Table:
+        """Execute expression and return results in as a pyarrow table.
+
+        This method is eager and will execute the associated expression
+        immediately.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit". The default is in `ibis/config.py`.
+        cache
+            Whether to use the query result cache, if it is enabled through
+            `ibis.options.sql.result_cache`.
+        kwargs
+            Keyword arguments
+
+        Returns
+        -------
+        Table
+            A pyarrow table holding the results of the executed expression.
+        """
+        if not cache or kwargs:
+            return self._to_pyarrow_uncached(expr, params=params, limit=limit, **kwargs)
+        return self._cached_result(
+            expr,
+            limit,
+            params,
+            "arrow",
+            lambda: self._to_pyarrow_uncached(expr, params=params, limit=limit),
+            _arrow_to_table,
+            _arrow_from_table,
+        )
+
+    def _to_pyarrow_uncached(self, expr, *, params=None, limit=None, **kwargs):
+        return super().to_pyarrow(expr, params=params, limit=limit, **kwargs)
+
     def sql(self, query: str, schema: sch.Schema | None = None) -> ir.Table:
         """Convert a SQL query to an Ibis table expression.
 
@@ -144,19 +492,38 @@ class BaseSQLBackend(BaseBackend):
     def _safe_raw_sql(self, *args, **kwargs):
         yield self.raw_sql(*args, **kwargs)
 
-    def _cursor_batches(
-        self,
-        expr: ir.Expr,
-        params: Mapping[ir.Scalar, Any] | None = None,
-        limit: int | str | None = None,
-        chunk_size: int = 1_000_000,
-    ) -> Iterable[list]:
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+    @contextlib.contextmanager
+    def _safe_streaming_sql(self, *args, **kwargs):
+        """Execute a query, preferring an unbuffered cursor.
 
-        with self._safe_raw_sql(sql) as cursor:
-            while batch := cursor.fetchmany(chunk_size):
-                yield batch
+        Backends whose driver can stream results from the server should
+        override this so that fetching a chunk doesn't materialize the whole
+        result set on the client.
+        """
+        with self._safe_raw_sql(*args, **kwargs) as cursor:
+            yield cursor
+
+    def _fetch_record_batches(
+        self, cursor, schema: sch.Schema, chunk_size: int
+    ) -> Iterable[pa.RecordBatch]:
+        """Fetch record batches of at most `chunk_size` rows from `cursor`.
+
+        Rows are transposed to columns and converted to arrow column by
+        column, so only the current chunk is held in memory. Backends with
+        drivers that are able to produce arrow data natively should override
+        this method.
+        """
+        import pyarrow as pa
+
+        arrow_schema = schema.to_pyarrow()
+        while rows := cursor.fetchmany(chunk_size):
+            arrays = [
+                pa.array(column, type=field.type)
+                for column, field in zip(zip(*rows), arrow_schema)
+            ]
+            # release the rows before handing out the batch
+            del rows
+            yield pa.RecordBatch.from_arrays(arrays, schema=arrow_schema)
 
     @util.experimental
     def to_pyarrow_batches(
@@ -193,19 +560,13 @@ class BaseSQLBackend(BaseBackend):
         """
         pa = self._import_pyarrow()
 
-        from ibis.backends.pyarrow.datatypes import ibis_to_pyarrow_struct
-
         schema = self._table_or_column_schema(expr)
+        _, sql = self._to_compiled_query(expr, limit, params=params)
+        self._register_in_memory_tables(expr)
 
         def _batches():
-            for batch in self._cursor_batches(
-                expr, params=params, limit=limit, chunk_size=chunk_size
-            ):
-                struct_array = pa.array(
-                    map(tuple, batch),
-                    type=ibis_to_pyarrow_struct(schema),
-                )
-                yield pa.RecordBatch.from_struct_array(struct_array)
+            with self._safe_streaming_sql(sql) as cursor:
+                yield from self._fetch_record_batches(cursor, schema, chunk_size)
 
         return pa.RecordBatchReader.from_batches(schema.to_pyarrow(), _batches())
 
@@ -214,6 +575,7 @@ class BaseSQLBackend(BaseBackend):
         expr: ir.Expr,
         params: Mapping[ir.Scalar, Any] | None = None,
         limit: str = 'default',
+        cache: bool = True,
         **kwargs: Any,
     ):
         """Compile and execute an Ibis expression.
@@ -230,6 +592,9 @@ class BaseSQLBackend(BaseBackend):
             of values/rows. Overrides any limit already set on the expression.
         params
             Named unbound parameters
+        cache
+            Whether to use the query result cache, if it is enabled through
+            `ibis.options.sql.result_cache`.
         kwargs
             Backend specific arguments. For example, the clickhouse backend
             uses this to receive `external_tables` as a dictionary of pandas
@@ -247,8 +612,21 @@ class BaseSQLBackend(BaseBackend):
         # feature than all this magic.
         # we don't want to pass `timecontext` to `raw_sql`
         kwargs.pop('timecontext', None)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        if not cache or kwargs or not _has_flat_types(expr):
+            # nested values don't round trip through arrow unchanged
+            return self._execute_uncached(expr, params=params, limit=limit, **kwargs)
+        return self._cached_result(
+            expr,
+            limit,
+            params,
+            "pandas",
+            lambda: self._execute_uncached(expr, params=params, limit=limit),
+            _pandas_to_arrow,
+            _pandas_from_arrow,
+        )
+
+    def _execute_uncached(self, expr, params=None, limit='default', **kwargs):
+        query_ast, sql = self._to_compiled_query(expr, limit, params=params)
         self._log(sql)
 
         schema = self.ast_schema(query_ast, **kwargs)
@@ -345,7 +723,36 @@ class BaseSQLBackend(BaseBackend):
             The output of compilation. The type of this value depends on the
             backend.
         """
-        return self.compiler.to_ast_ensure_limit(expr, limit, params=params).compile()
+        store = self._compile_store
+        if store is None or not self._compile_cache.maxsize:
+            return self._to_compiled_query(expr, limit, params=params)[1]
+
+        # compiled queries missing from memory are looked up in the on-disk
+        # store which may have been populated by other processes
+        expr = self._substitute_cached(expr)
+        key = self._compile_cache_key(expr, limit, params)
+        if key is None:
+            return self._to_compiled_query(expr, limit, params=params)[1]
+        try:
+            _, result = self._compile_cache[key]
+        except KeyError:
+            pass
+        else:
+            return result
+
+        store_key = self._compile_store_key(key)
+        try:
+            result = store[store_key]
+        except KeyError:
+            query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
+            result = query_ast.compile()
+            self._compile_cache[key] = query_ast, result
+            # queries referencing unpicklable objects aren't spilled
+            with contextlib.suppress(pickle.PicklingError, TypeError, AttributeError):
+                store[store_key] = result
+        else:
+            self._compile_cache[key] = None, result
+        return result
 
     def explain(
         self,
@@ -389,6 +796,11 @@ class BaseSQLBackend(BaseBackend):
     def has_operation(cls, operation: type[ops.Value]) -> bool:
         return operation in cls._get_operations()
 
+    def add_operation(self, operation: ops.Node) -> Callable:
+        # previously compiled queries may not reflect the new translation rule
+        self.clear_compile_cache()
+        return super().add_operation(operation)
+
     def _create_temp_view(self, view, definition):
         raise NotImplementedError(
             f"The {self.name} backend does not implement temporary view creation"
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import contextlib
+import functools
 import getpass
+import itertools
+import warnings
 from operator import methodcaller
-from typing import TYPE_CHECKING, Any, Literal
+from typing import TYPE_CHECKING, Any, Iterable, Literal
 
 import sqlalchemy as sa
 
@@ -35,9 +38,11 @@ from ibis.backends.base.sql.alchemy.translator import (
     AlchemyContext,
     AlchemyExprTranslator,
 )
+from ibis.common.caching import CacheInfo, LRUCache
 
 if TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
 
 
 __all__ = (
@@ -63,6 +68,87 @@ __all__ = (
 )
 
 
+def _table_key(name: str, schema: str | None) -> str:
+    # the key of a table in `sa.MetaData.tables`
+    return name if schema is None else f"{schema}.{name}"
+
+
+def _pyarrow_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _is_arrow_data(obj: Any) -> bool:
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return False
+    return isinstance(obj, (pa.Table, pa.RecordBatch, pa.RecordBatchReader))
+
+
+def _record_batch_reader(data: Any, chunk_size: int) -> pa.RecordBatchReader:
+    """Convert `data` to a reader of record batches of at most `chunk_size` rows.
+
+    Parameters
+    ----------
+    data
+        A pandas DataFrame, a pyarrow Table or RecordBatch, a
+        RecordBatchReader or an iterable of RecordBatches.
+    chunk_size
+        Maximum number of rows in each record batch.
+
+    Returns
+    -------
+    RecordBatchReader
+        Lazily converted record batches, only a single chunk of the input is
+        converted at a time.
+    """
+    import pandas as pd
+    import pyarrow as pa
+
+    def split(batches):
+        for batch in batches:
+            for offset in range(0, batch.num_rows, chunk_size):
+                yield batch.slice(offset, chunk_size)
+
+    if isinstance(data, pd.DataFrame):
+        # register the schema inference rules for pandas
+        import ibis.backends.pandas.client  # noqa: F401
+
+        schema = sch.infer(data).to_pyarrow()
+        batches = (
+            pa.RecordBatch.from_pandas(
+                data.iloc[offset : offset + chunk_size],
+                schema=schema,
+                preserve_index=False,
+            )
+            for offset in range(0, len(data), chunk_size)
+        )
+        return pa.RecordBatchReader.from_batches(schema, batches)
+    elif isinstance(data, pa.Table):
+        return pa.RecordBatchReader.from_batches(
+            data.schema, data.to_batches(max_chunksize=chunk_size)
+        )
+    elif isinstance(data, pa.RecordBatch):
+        return pa.RecordBatchReader.from_batches(data.schema, split([data]))
+    elif isinstance(data, pa.RecordBatchReader):
+        return pa.RecordBatchReader.from_batches(data.schema, split(data))
+    elif isinstance(data, Iterable):
+        batches = iter(data)
+        try:
+            first = next(batches)
+        except StopIteration:
+            raise ValueError("Cannot load data from an empty iterable of batches")
+        return pa.RecordBatchReader.from_batches(
+            first.schema, split(itertools.chain([first], batches))
+        )
+    else:
+        raise TypeError(f"Unable to load data of type {type(data).__name__}")
+
+
 class BaseAlchemyBackend(BaseSQLBackend):
     """Backend class for backends that compile to SQLAlchemy expressions."""
 
@@ -70,6 +156,10 @@ class BaseAlchemyBackend(BaseSQLBackend):
     table_class = AlchemyTable
     compiler = AlchemyCompiler
 
+    # number of rows converted and sent to the database at once by the bulk
+    # loading methods
+    bulk_insert_chunk_size = 100_000
+
     def _build_alchemy_url(self, url, host, port, user, password, database, driver):
         if url is not None:
             return sa.engine.url.make_url(url)
@@ -95,6 +185,18 @@ class BaseAlchemyBackend(BaseSQLBackend):
         self._schemas: dict[str, sch.Schema] = {}
         self._temp_views: set[str] = set()
 
+    def _max_concurrency(self) -> int | None:
+        pool = self.con.pool
+        if isinstance(pool, sa.pool.QueuePool):
+            return pool.size()
+        elif isinstance(pool, sa.pool.SingletonThreadPool):
+            # one of the thread-local connections belongs to the calling
+            # thread, exceeding the pool size closes connections in use
+            return max(pool.size - 1, 1)
+        elif isinstance(pool, (sa.pool.StaticPool, sa.pool.AssertionPool)):
+            return 1
+        return None
+
     @property
     def version(self):
         return '.'.join(map(str, self.con.dialect.server_version_info))
@@ -119,6 +221,13 @@ class BaseAlchemyBackend(BaseSQLBackend):
         with self.begin() as con:
             yield con.execute(*args, **kwargs)
 
+    @contextlib.contextmanager
+    def _safe_streaming_sql(self, *args, **kwargs):
+        # server side cursors for the dialects supporting them (postgres,
+        # mysql, mssql, ...), other dialects silently ignore the option
+        with self.begin() as con:
+            yield con.execution_options(stream_results=True).execute(*args, **kwargs)
+
     @staticmethod
     def _to_geodataframe(df, schema):
         """Convert `df` to a `GeoDataFrame`.
@@ -204,6 +313,7 @@ class BaseAlchemyBackend(BaseSQLBackend):
         if schema is None:
             schema = expr.schema()
 
+        self.invalidate_metadata(name)
         self._schemas[self._fully_qualified_name(name, database)] = schema
         table = self._table_from_schema(
             name, schema, database=database or self.current_database
@@ -220,6 +330,34 @@ class BaseAlchemyBackend(BaseSQLBackend):
                 method = self._get_insert_method(expr)
                 bind.execute(method(table.insert()))
 
+    def _load_into_cache(self, name: str, expr: ir.Table) -> ops.TableNode:
+        schema = expr.schema()
+        table = sa.Table(
+            name,
+            self.meta,
+            *self._columns_from_schema(name, schema),
+            prefixes=["TEMPORARY"],
+        )
+        self._schemas[name] = schema
+
+        # this has to happen outside the `begin` block, so that in-memory
+        # tables are visible inside the transaction created by it
+        self._register_in_memory_tables(expr)
+
+        with self.begin() as bind:
+            table.create(bind=bind)
+            method = self._get_insert_method(expr)
+            bind.execute(method(table.insert()))
+
+        return self._sqla_table_to_expr(table).op()
+
+    def _clean_up_cached_table(self, name: str) -> None:
+        table = self.meta.tables[name]
+        with self.begin() as bind:
+            table.drop(bind=bind, checkfirst=True)
+        self.meta.remove(table)
+        self._schemas.pop(name, None)
+
     def _get_insert_method(self, expr):
         compiled = self.compile(expr)
 
@@ -281,6 +419,7 @@ class BaseAlchemyBackend(BaseSQLBackend):
         ), f"Something went wrong during DROP of table {table_name!r}"
 
         self.meta.remove(t)
+        self.invalidate_metadata(table_name)
 
         qualified_name = self._fully_qualified_name(table_name, database)
 
@@ -292,18 +431,23 @@ class BaseAlchemyBackend(BaseSQLBackend):
     def load_data(
         self,
         table_name: str,
-        data: pd.DataFrame,
+        data: pd.DataFrame | pa.Table | Iterable[pa.RecordBatch],
         database: str | None = None,
         if_exists: Literal['fail', 'replace', 'append'] = 'fail',
     ) -> None:
         """Load data from a dataframe to the backend.
 
+        The data is converted to arrow record batches and sent to the
+        database in chunks of `bulk_insert_chunk_size` rows using the fastest
+        loading mechanism available for the backend.
+
         Parameters
         ----------
         table_name
             Name of the table in which to load data
         data
-            Pandas DataFrame
+            Pandas DataFrame, pyarrow Table, RecordBatchReader or an iterable
+            of pyarrow RecordBatches
         database
             Database in which the table exists
         if_exists
@@ -325,13 +469,66 @@ class BaseAlchemyBackend(BaseSQLBackend):
                 'yet implemented'
             )
 
-        data.to_sql(
-            table_name,
-            con=self.con,
-            index=False,
-            if_exists=if_exists,
-            schema=self._current_schema,
-        )
+        if if_exists not in ('fail', 'replace', 'append'):
+            raise ValueError(f"{if_exists!r} is not valid for if_exists")
+
+        if not _pyarrow_available():
+            # the bulk loader requires pyarrow
+            data.to_sql(
+                table_name,
+                con=self.con,
+                index=False,
+                if_exists=if_exists,
+                schema=self._current_schema,
+            )
+            return
+
+        from ibis.backends.pyarrow.datatypes import from_pyarrow_schema
+
+        reader = _record_batch_reader(data, self.bulk_insert_chunk_size)
+
+        if exists := self.inspector.has_table(table_name, schema=self._current_schema):
+            if if_exists == 'fail':
+                raise ValueError(f"Table {table_name!r} already exists")
+            elif if_exists == 'replace':
+                self.drop_table(table_name)
+                exists = False
+
+        if exists:
+            table = self._get_sqla_table(table_name, schema=self._current_schema)
+        else:
+            schema = from_pyarrow_schema(reader.schema)
+            table = self._table_from_schema(
+                table_name, schema, database=self._current_schema
+            )
+
+        with self.begin() as bind:
+            if not exists:
+                table.create(bind=bind)
+            self._insert_record_batches(bind, table, reader)
+
+    def _insert_record_batches(
+        self, bind, table: sa.Table, reader: pa.RecordBatchReader
+    ) -> None:
+        """Insert record batches into an existing table.
+
+        The default implementation issues one `executemany` per batch inside
+        the transaction of `bind`. Backends with a native bulk loading
+        facility should override this method.
+
+        Parameters
+        ----------
+        bind
+            Connection with an open transaction
+        table
+            The table to insert the data into
+        reader
+            Record batches with column names matching the columns of `table`
+        """
+        insert = table.insert()
+        for batch in reader:
+            if batch.num_rows:
+                bind.execute(insert, batch.to_pylist())
 
     def truncate_table(
         self,
@@ -378,6 +575,140 @@ class BaseAlchemyBackend(BaseSQLBackend):
     ) -> sa.Table:
         return sa.Table(name, self.meta, schema=schema, autoload=autoload)
 
+    @functools.cached_property
+    def _table_definitions(self) -> LRUCache:
+        return LRUCache(maxsize=None)
+
+    @property
+    def _table_cache(self) -> LRUCache:
+        # the ttl is read on every access so that changing it applies to
+        # existing connections, the cached definitions are dropped then
+        ttl = ibis.config.options.sql.metadata_cache.ttl
+        cache = self._table_definitions
+        if cache.ttl != ttl:
+            cache.clear()
+            cache.ttl = ttl
+        return cache
+
+    @functools.cached_property
+    def _reflected_tables(
+        self,
+    ) -> dict[tuple[str | None, str | None, str], sa.Table]:
+        # every table definition handed out by the cache, used to remove
+        # expired definitions from the metadata so they are reflected again
+        return {}
+
+    def _cached_sqla_table(
+        self, name: str, schema: str | None = None, **kwargs: Any
+    ) -> sa.Table:
+        key = kwargs.get("database"), schema, name
+        try:
+            return self._table_cache[key]
+        except KeyError:
+            pass
+
+        self._forget_sqla_table(key)
+        table = self._get_sqla_table(name, schema=schema, **kwargs)
+        self._table_cache[key] = self._reflected_tables[key] = table
+        return table
+
+    def _forget_sqla_table(self, key: tuple[str | None, str | None, str]) -> None:
+        with contextlib.suppress(KeyError):
+            del self._table_cache[key]
+        table = self._reflected_tables.pop(key, None)
+        if table is not None and self.meta.tables.get(table.key) is table:
+            self.meta.remove(table)
+
+    def _get_table_schemas(self, schema: str | None = None) -> dict[str, sch.Schema]:
+        """Return the schemas of all tables in `schema` using one query.
+
+        Backends without a catalog query to do so raise `NotImplementedError`.
+        """
+        raise NotImplementedError
+
+    def prefetch_metadata(self, schema: str | None = None) -> list[str]:
+        """Load the definitions of all tables in `schema` into the cache.
+
+        Backends able to do so fetch every definition with a single catalog
+        query, the others reflect the tables one by one.
+
+        Parameters
+        ----------
+        schema
+            The schema whose tables are loaded, defaults to the current one.
+
+        Returns
+        -------
+        list[str]
+            Names of the loaded tables
+        """
+        try:
+            schemas = self._get_table_schemas(schema)
+        except NotImplementedError:
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore", category=sa.exc.SAWarning)
+                self.meta.reflect(schema=schema, views=True)
+            tables = {
+                table.name: table
+                for table in self.meta.tables.values()
+                if table.schema == schema
+            }
+        else:
+            tables = {}
+            for name, table_schema in schemas.items():
+                self.invalidate_metadata(name, schema=schema)
+                if (
+                    existing := self.meta.tables.get(_table_key(name, schema))
+                ) is not None:
+                    self.meta.remove(existing)
+                if schema is None:
+                    # types parsed from the catalog are more precise than the
+                    # ones derived from the SQLAlchemy columns
+                    self._schemas[name] = table_schema
+                tables[name] = sa.Table(
+                    name,
+                    self.meta,
+                    *self._columns_from_schema(name, table_schema),
+                    schema=schema,
+                )
+
+        for name, table in tables.items():
+            key = None, schema, name
+            self._table_cache[key] = self._reflected_tables[key] = table
+        return sorted(tables)
+
+    def invalidate_metadata(
+        self, name: str | None = None, schema: str | None = None
+    ) -> None:
+        """Remove table definitions from the metadata cache.
+
+        The next call to `table` reflects them from the database again.
+
+        Parameters
+        ----------
+        name
+            Name of the table, `None` means all tables.
+        schema
+            Schema of the table, `None` means any schema.
+        """
+        for key in list(self._reflected_tables):
+            _, cached_schema, cached_name = key
+            if (name is None or cached_name == name) and (
+                schema is None or cached_schema == schema
+            ):
+                self._forget_sqla_table(key)
+
+    def metadata_cache_info(self) -> CacheInfo:
+        """Return the statistics of the table metadata cache.
+
+        Returns
+        -------
+        CacheInfo
+            Named tuple of cache `hits`, `misses`, `maxsize` and `currsize`.
+            Every hit is a table reflection that didn't hit the database.
+        """
+        return self._table_cache.info()
+
     def _sqla_table_to_expr(self, table: sa.Table) -> ir.Table:
         schema = self._schemas.get(table.name)
         node = self.table_class(
@@ -421,17 +752,13 @@ class BaseAlchemyBackend(BaseSQLBackend):
                 database=database,
                 schema=schema,
             )
-        sqla_table = self._get_sqla_table(
-            name,
-            database=database,
-            schema=schema,
-        )
+        sqla_table = self._cached_sqla_table(name, schema=schema, database=database)
         return self._sqla_table_to_expr(sqla_table)
 
     def insert(
         self,
         table_name: str,
-        obj: pd.DataFrame | ir.Table | list | dict,
+        obj: pd.DataFrame | pa.Table | ir.Table | list | dict,
         database: str | None = None,
         overwrite: bool = False,
     ) -> None:
@@ -442,7 +769,8 @@ class BaseAlchemyBackend(BaseSQLBackend):
         table_name
             The name of the table to which data needs will be inserted
         obj
-            The source data or expression to insert
+            The source data or expression to insert. DataFrames and pyarrow
+            tables, record batches or readers are loaded in bulk.
         database
             Name of the attached database that the table is located in.
         overwrite
@@ -474,7 +802,7 @@ class BaseAlchemyBackend(BaseSQLBackend):
         ):
             obj = in_mem_table.data.to_frame()
 
-        if isinstance(obj, pd.DataFrame):
+        if isinstance(obj, pd.DataFrame) and not _pyarrow_available():
             obj.to_sql(
                 table_name,
                 self.con,
@@ -482,6 +810,14 @@ class BaseAlchemyBackend(BaseSQLBackend):
                 if_exists='replace' if overwrite else 'append',
                 schema=self._current_schema,
             )
+        elif isinstance(obj, pd.DataFrame) or _is_arrow_data(obj):
+            reader = _record_batch_reader(obj, self.bulk_insert_chunk_size)
+            to_table = self._get_sqla_table(table_name, schema=database)
+
+            with self.begin() as bind:
+                if overwrite:
+                    bind.execute(to_table.delete())
+                self._insert_record_batches(bind, to_table, reader)
         elif isinstance(obj, ir.Table):
             to_table_expr = self.table(table_name)
             to_table_schema = to_table_expr.schema()
@@ -295,8 +295,7 @@ class Backend(BaseSQLBackend):
         """
         # TODO: upstream needs to pass params to raw_sql, I think.
         kwargs.pop("timecontext", None)
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        query_ast, sql = self._to_compiled_query(expr, limit, params=params)
         self._log(sql)
         cursor = self.raw_sql(sql, params=params, **kwargs)
         schema = self.ast_schema(query_ast, **kwargs)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import json
 from typing import TYPE_CHECKING, Any, Literal, Mapping
 
@@ -28,6 +29,10 @@ try:
 except ImportError:
     _default_compression = False
 
+# exchange data with the server as numpy arrays instead of python objects,
+# columns without numpy support fall back to python objects in the driver
+_COLUMNAR_SETTINGS = {"use_numpy": True}
+
 
 class Backend(BaseSQLBackend):
     name = 'clickhouse'
@@ -140,6 +145,28 @@ class Backend(BaseSQLBackend):
         databases = list(data[0])
         return self._filter_with_like(databases, like)
 
+    def _external_tables_list(
+        self, external_tables: Mapping[str, pd.DataFrame] | None = None
+    ) -> list[dict[str, Any]]:
+        import pandas as pd
+
+        external_tables_list = []
+        if external_tables is None:
+            external_tables = {}
+        for name, df in toolz.merge(self._external_tables, external_tables).items():
+            if not isinstance(df, pd.DataFrame):
+                raise TypeError('External table is not an instance of pandas dataframe')
+            schema = sch.infer(df)
+            external_tables_list.append(
+                {
+                    'name': name,
+                    # sent column by column in native format
+                    'data': df,
+                    'structure': list(zip(schema.names, map(serialize, schema.types))),
+                }
+            )
+        return external_tables_list
+
     def raw_sql(
         self,
         query: str,
@@ -160,22 +187,7 @@ class Backend(BaseSQLBackend):
         Any
             The resutls of executing the query
         """
-        import pandas as pd
-
-        external_tables_list = []
-        if external_tables is None:
-            external_tables = {}
-        for name, df in toolz.merge(self._external_tables, external_tables).items():
-            if not isinstance(df, pd.DataFrame):
-                raise TypeError('External table is not an instance of pandas dataframe')
-            schema = sch.infer(df)
-            external_tables_list.append(
-                {
-                    'name': name,
-                    'data': df.to_dict('records'),
-                    'structure': list(zip(schema.names, map(serialize, schema.types))),
-                }
-            )
+        external_tables_list = self._external_tables_list(external_tables)
 
         ibis.util.log(query)
         with self.con as con:
@@ -184,8 +196,44 @@ class Backend(BaseSQLBackend):
                 columnar=True,
                 with_column_types=True,
                 external_tables=external_tables_list,
+                settings=_COLUMNAR_SETTINGS,
+            )
+
+    @contextlib.contextmanager
+    def _safe_streaming_sql(
+        self,
+        query: str,
+        external_tables: Mapping[str, pd.DataFrame] | None = None,
+    ):
+        external_tables_list = self._external_tables_list(external_tables)
+
+        ibis.util.log(query)
+        with self.con as con:
+            # rows are yielded block by block as the server sends them, the
+            # first row holds the names and types of the columns
+            yield con.execute_iter(
+                query,
+                with_column_types=True,
+                external_tables=external_tables_list,
+                settings=_COLUMNAR_SETTINGS,
             )
 
+    def _fetch_record_batches(self, cursor, schema: sch.Schema, chunk_size: int):
+        import pyarrow as pa
+
+        arrow_schema = schema.to_pyarrow()
+        rows = iter(cursor)
+        # skip the column names and types
+        next(rows, None)
+        for chunk in toolz.partition_all(chunk_size, rows):
+            arrays = [
+                pa.array(column, type=field.type, from_pandas=True)
+                for column, field in zip(zip(*chunk), arrow_schema)
+            ]
+            # release the rows before handing out the batch
+            del chunk
+            yield pa.RecordBatch.from_arrays(arrays, schema=arrow_schema)
+
     def fetch_from_cursor(self, cursor, schema):
         import pandas as pd
 
@@ -194,7 +242,8 @@ class Backend(BaseSQLBackend):
         if not data:
             df = pd.DataFrame([], columns=names)
         else:
-            df = pd.DataFrame.from_dict(dict(zip(names, data)))
+            # columns are numpy arrays, so no copy to python lists is needed
+            df = pd.DataFrame(dict(zip(names, data)), copy=False)
         return schema.apply_to(df)
 
     def close(self):
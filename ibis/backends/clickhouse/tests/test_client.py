@@ -9,6 +9,7 @@ import ibis.expr.types as ir
 from ibis import util
 
 pytest.importorskip("clickhouse_driver")
+pa = pytest.importorskip("pyarrow")
 
 
 def test_run_sql(con):
@@ -183,3 +184,29 @@ def test_list_tables_empty(con, worker_id):
     finally:
         con.raw_sql(f"USE {db}")
         con.raw_sql(f"DROP DATABASE IF EXISTS {dbname}")
+
+
+def test_raw_sql_columnar_external_table(con):
+    external = pd.DataFrame({'a': ['x', 'y', 'z'], 'b': [1, 2, 3]})
+    (a, b), _ = con.raw_sql(
+        'SELECT a, b * 2 AS b FROM external ORDER BY a',
+        external_tables={'external': external},
+    )
+    assert list(a) == ['x', 'y', 'z']
+    assert list(b) == [2, 4, 6]
+
+
+def test_to_pyarrow_batches(con, alltypes):
+    expr = alltypes[['id', 'string_col', 'double_col']].limit(25)
+    reader = con.to_pyarrow_batches(expr, chunk_size=10)
+    assert reader.schema == expr.schema().to_pyarrow()
+
+    batches = list(reader)
+    assert [batch.num_rows for batch in batches] == [10, 10, 5]
+
+    result = pa.Table.from_batches(batches).to_pandas()
+    expected = expr.execute()
+    tm.assert_frame_equal(
+        result.sort_values('id').reset_index(drop=True),
+        expected.sort_values('id').reset_index(drop=True),
+    )
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Mapping, MutableMapping
+import collections
+import warnings
+import weakref
+from typing import TYPE_CHECKING, Any, Mapping, MutableMapping, Optional
 
 import dask
 import dask.dataframe as dd
@@ -10,23 +13,134 @@ from dask.base import DaskMethodsMixin
 # import the pandas execution module to register dispatched implementations of
 # execute_node that the dask backend will later override
 import ibis.backends.pandas.execution  # noqa: F401
+import ibis.common.graph as g
 import ibis.config
+import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
-from ibis.backends.dask.client import DaskDatabase, DaskTable, ibis_schema_to_dask
+import ibis.util as util
+from ibis.backends.dask.client import (
+    DaskDatabase,
+    DaskFileScan,
+    DaskPersistedTable,
+    DaskTable,
+    ibis_schema_to_dask,
+)
 from ibis.backends.dask.core import execute_and_reset
 from ibis.backends.pandas import BasePandasBackend
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 # Make sure that the pandas backend options have been loaded
 ibis.pandas
 
 
+def _split_limit(node, limit):
+    """Split a top level `Limit` off `node`, returning the node that is
+    limited, the offset and the number of rows to return."""
+    if limit == 'default':
+        limit = None
+    offset = 0
+    if isinstance(node, ops.Limit):
+        offset = node.offset
+        limit = node.n if limit is None else min(limit, node.n)
+        node = node.table
+    return node, offset, limit
+
+
+def _iter_partitions(data, batch_growth=1):
+    """Compute the partitions of `data` in order, yielding them one at a
+    time.
+
+    Every round computes `batch_growth` times as many partitions as the
+    previous one, starting from a single partition.
+    """
+    start = 0
+    npartitions = 1
+    while start < data.npartitions:
+        stop = min(start + npartitions, data.npartitions)
+        yield from dask.compute(*data.partitions[start:stop].to_delayed())
+        start = stop
+        npartitions *= batch_growth
+
+
+def _iter_rows(data, offset, limit, batch_growth=1):
+    """Yield the computed partitions of `data`, sliced to the rows between
+    `offset` and `offset + limit`, and stop computing partitions once they
+    are all produced."""
+    if limit == 0:
+        return
+    stop = None if limit is None else offset + limit
+    num_rows = 0
+    for part in _iter_partitions(data, batch_growth):
+        start = num_rows
+        num_rows += len(part)
+        if num_rows > offset:
+            end = None if stop is None else stop - start
+            yield part.iloc[max(offset - start, 0) : end]
+        if stop is not None and num_rows >= stop:
+            return
+
+
+def _head(data, offset, limit):
+    """Compute the rows of `data` between `offset` and `offset + limit`."""
+    # grow the number of partitions computed at once, so results that
+    # shuffle their input shuffle it a logarithmic number of times
+    parts = list(_iter_rows(data, offset, limit, batch_growth=2))
+    if not parts:
+        parts = [data._meta]
+    return pd.concat(parts).reset_index(drop=True)
+
+
 class Backend(BasePandasBackend):
     name = 'dask'
     database_class = DaskDatabase
     table_class = DaskTable
+    file_scan_class = DaskFileScan
     backend_table_type = dd.DataFrame
 
+    class Options(BasePandasBackend.Options):
+        """dask options.
+
+        Attributes
+        ----------
+        enable_trace : bool
+            Log the call stack and timing of each executed operation.
+        broadcast_join_max_partitions : int
+            Inner and left joins without a hint send the right table to
+            every partition of the left table, instead of shuffling both
+            tables by the join keys, when it has at most this many
+            partitions.
+        persist_reused : int | None
+            Persist the partitions of an intermediate table once this many
+            executed expressions have used it, as if it was marked with
+            [`persist`][ibis.backends.dask.Backend.persist]. [`None`][None]
+            only persists marked tables.
+        persist_max_bytes : int
+            Maximum total size in bytes of the persisted tables, the least
+            recently used tables are dropped first.
+        """
+
+        broadcast_join_max_partitions: int = 4
+        persist_reused: Optional[int] = None
+        persist_max_bytes: int = 1 << 30
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # mapping from persisted table nodes to the tables holding their
+        # partitions and their size, in least recently used order
+        self._persisted: collections.OrderedDict[
+            ops.TableNode, tuple[ops.TableNode, int]
+        ] = collections.OrderedDict()
+        # persisted partitions by the name of the table holding them
+        self._persisted_frames: dict[str, dd.DataFrame] = {}
+        # tables to persist the next time an expression using them is executed
+        self._persist_marked: set[ops.TableNode] = set()
+        # number of executed expressions each intermediate table appeared in,
+        # entries vanish along with the expressions
+        self._persist_uses: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
     def do_connect(
         self,
         dictionary: MutableMapping[str, dd.DataFrame],
@@ -67,15 +181,14 @@ class Backend(BasePandasBackend):
         self,
         query: ir.Expr,
         params: Mapping[ir.Expr, object] = None,
-        limit: str = 'default',
+        limit: int | str | None = 'default',
         **kwargs,
     ):
-        if limit != 'default' and limit is not None:
-            raise ValueError(
-                'limit parameter to execute is not yet implemented in the '
-                'dask backend'
-            )
+        """Execute `query` and return its result as a pandas object.
 
+        Tables limited with `limit`, or with the `limit` parameter, only
+        compute the leading partitions that hold the requested rows.
+        """
         if not isinstance(query, ir.Expr):
             raise TypeError(
                 "`query` has type {!r}, expected ibis.expr.types.Expr".format(
@@ -83,8 +196,12 @@ class Backend(BasePandasBackend):
                 )
             )
 
-        result = self.compile(query, params, **kwargs)
-        if isinstance(result, DaskMethodsMixin):
+        node, params = self._prepare(query, params, persist=True)
+        node, offset, limit = _split_limit(node, limit)
+        result = execute_and_reset(node, params=params, **kwargs)
+        if limit is not None and isinstance(result, (dd.DataFrame, dd.Series)):
+            return _head(result, offset, limit)
+        elif isinstance(result, DaskMethodsMixin):
             return result.compute()
         else:
             return result
@@ -99,14 +216,256 @@ class Backend(BasePandasBackend):
         For the dask backend returns a dask graph that you can run ``.compute``
         on to get a pandas object.
         """
-        node = query.op()
+        node, params = self._prepare(query, params)
+        return execute_and_reset(node, params=params, **kwargs)
+
+    def persist(self, expr: ir.Table) -> ir.Table:
+        """Keep the partitions of `expr` in memory across executions.
+
+        The partitions are computed and persisted, on the workers of a
+        distributed scheduler or in the local process otherwise, the next time
+        an expression using `expr` is executed. Later executions then read
+        the persisted partitions instead of computing `expr` again, until
+        they are dropped with [`unpersist`][ibis.backends.dask.Backend.unpersist]
+        or evicted to stay below `ibis.options.dask.persist_max_bytes`.
+
+        Tables depending on scalar parameters are never persisted.
+
+        Parameters
+        ----------
+        expr
+            Table expression to persist
+
+        Returns
+        -------
+        Table
+            `expr`, unchanged
+        """
+        self._persist_marked.add(expr.op())
+        return expr
+
+    def persisted(self) -> dict[ir.Table, int]:
+        """Return the persisted tables and their size in bytes.
+
+        Returns
+        -------
+        dict[Table, int]
+            Mapping from the persisted table expressions to the size of their
+            partitions, least recently used first
+        """
+        return {node.to_expr(): nbytes for node, (_, nbytes) in self._persisted.items()}
+
+    def unpersist(self, expr: ir.Table | None = None) -> None:
+        """Drop the persisted partitions of `expr` and stop persisting it.
+
+        Parameters
+        ----------
+        expr
+            Table expression to drop, [`None`][None] drops every persisted
+            table
+        """
+        nodes = list(self._persisted) if expr is None else [expr.op()]
+        for node in nodes:
+            self._drop_persisted(node)
+            self._persist_marked.discard(node)
+        if expr is None:
+            self._persist_marked.clear()
+            self._persist_uses.clear()
+
+    def _drop_persisted(self, node: ops.TableNode) -> None:
+        self._persist_uses.pop(node, None)
+        if (entry := self._persisted.pop(node, None)) is not None:
+            table, _ = entry
+            del self._persisted_frames[table.name]
+
+    def _find_persist_candidates(
+        self, node: ops.Node
+    ) -> tuple[list[ops.TableNode], list[ops.TableNode]]:
+        """Return the persisted tables used by `node` and the tables to
+        persist before executing it, counting the uses of the others."""
+        threshold = ibis.options.dask.persist_reused
+        hits = []
+
+        def fn(op):
+            if op in self._persisted:
+                # nothing below a persisted table is executed
+                hits.append(op)
+                return g.halt, None
+            elif op in self._persist_marked:
+                return g.proceed, op
+            elif (
+                threshold is None
+                or not isinstance(op, ops.TableNode)
+                or isinstance(op, ops.PhysicalTable)
+            ):
+                return g.proceed, None
+
+            uses = self._persist_uses[op] = self._persist_uses.get(op, 0) + 1
+            if uses >= threshold:
+                # the tables below are only used through this one from now on
+                return g.halt, op
+            return g.proceed, None
+
+        candidates = [
+            table
+            for table in g.traverse(fn, node)
+            if not any(
+                isinstance(dep, ops.ScalarParameter)
+                for dep in g.Graph.from_bfs(table).nodes()
+            )
+        ]
+        return hits, candidates
+
+    def _substitute_persisted(self, node: ops.Node) -> ops.Node:
+        """Persist the tables `node` reuses and replace them with the tables
+        holding their partitions."""
+        if not (
+            self._persisted
+            or self._persist_marked
+            or ibis.options.dask.persist_reused is not None
+        ):
+            return node
+
+        hits, candidates = self._find_persist_candidates(node)
+        if candidates:
+            # persist the dependencies first, so their dependents reuse them
+            order = {table: i for i, table in enumerate(g.toposort(node))}
+            for table in sorted(candidates, key=order.__getitem__):
+                self._persist_node(table)
+                hits.append(table)
+
+        for table in hits:
+            self._persisted.move_to_end(table)
+        self._evict_persisted(keep=hits)
+        return node.replace({table: self._persisted[table][0] for table in hits})
+
+    def _persist_node(self, node: ops.TableNode) -> None:
+        subs = {table: persisted for table, (persisted, _) in self._persisted.items()}
+        prepared = self._push_down_scans(node.replace(subs))
+        df = execute_and_reset(prepared).persist()
+        name = f"_ibis_persist_{util.guid()}"
+        self._persisted_frames[name] = df
+        nbytes = int(df.memory_usage(deep=True).sum().compute())
+        self._persisted[node] = DaskPersistedTable(name, node.schema, self), nbytes
+
+    def _evict_persisted(self, keep: list[ops.TableNode]) -> None:
+        # tables used by the expression being executed are kept even when
+        # they exceed the budget on their own
+        max_bytes = ibis.options.dask.persist_max_bytes
+        total = sum(nbytes for _, nbytes in self._persisted.values())
+        for node, (_, nbytes) in list(self._persisted.items()):
+            if total <= max_bytes:
+                break
+            if node not in keep:
+                self._drop_persisted(node)
+                total -= nbytes
+
+    def _prepare(self, query, params, persist: bool = False):
+        node = self._substitute_cached(query).op()
+        if persist:
+            # only executions persist tables and count their uses
+            node = self._substitute_persisted(node)
+        node = self._push_down_scans(node)
 
         if params is None:
             params = {}
         else:
             params = {k.op() if hasattr(k, 'op') else k: v for k, v in params.items()}
 
-        return execute_and_reset(node, params=params, **kwargs)
+        return node, params
+
+    def to_pyarrow_batches(
+        self,
+        expr: ir.Expr,
+        *,
+        params: Mapping[ir.Scalar, Any] | None = None,
+        limit: int | str | None = None,
+        chunk_size: int = 1_000_000,
+        **kwargs: Any,
+    ) -> pa.RecordBatchReader:
+        """Execute expression and return a RecordBatchReader.
+
+        The partitions of the result are computed one at a time as batches
+        are read, so only one partition is held in memory. Results that
+        shuffle their input, like sorted tables, shuffle it again for every
+        partition; cache the expression first to avoid that.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit. A value of `None` means
+            "no limit".
+        chunk_size
+            Number of rows in each returned record batch.
+        kwargs
+            Keyword arguments
+
+        Returns
+        -------
+        RecordBatchReader
+            Collection of pyarrow `RecordBatch`s.
+        """
+        pa = self._import_pyarrow()
+
+        schema = self._table_or_column_schema(expr).to_pyarrow()
+        node, params = self._prepare(expr, params, persist=True)
+        node, offset, limit = _split_limit(node, limit)
+        result = execute_and_reset(node, params=params, **kwargs)
+        if isinstance(result, dd.Series):
+            result = result.to_frame(name=schema.names[0])
+
+        if isinstance(result, dd.DataFrame):
+            parts = _iter_rows(result, offset, limit)
+        else:
+            if isinstance(result, DaskMethodsMixin):
+                result = result.compute()
+            parts = [pd.DataFrame({schema.names[0]: [result]})]
+
+        def _batches():
+            pending = []
+            num_pending = 0
+            for df in parts:
+                pending.append(
+                    pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+                )
+                num_pending += len(df)
+                if num_pending < chunk_size:
+                    continue
+                # only hand out full batches until the last partition
+                table = pa.concat_tables(pending).combine_chunks()
+                num_ready = num_pending - num_pending % chunk_size
+                yield from table.slice(0, num_ready).to_batches(chunk_size)
+                pending = [table.slice(num_ready)]
+                num_pending -= num_ready
+            if num_pending:
+                yield from pa.concat_tables(pending).combine_chunks().to_batches(
+                    chunk_size
+                )
+
+        return pa.RecordBatchReader.from_batches(schema, _batches())
+
+    def _open_files(self, path, **kwargs):
+        df = dd.read_parquet(path, **kwargs)
+        return (path, kwargs), sch.infer(df)
+
+    def _scan_files(self, name, columns, filters):
+        path, kwargs = self._file_sources[name]
+        with warnings.catch_warnings():
+            # filtering collects statistics, which makes dask suggest using
+            # sorted columns as the index
+            warnings.filterwarnings("ignore", message="Sorted columns detected")
+            return dd.read_parquet(
+                path, columns=list(columns), filters=list(filters) or None, **kwargs
+            )
+
+    def _load_into_cache(self, name, expr):
+        # keep the computed partitions in memory instead of collecting them
+        self.dictionary[name] = self.compile(expr).persist()
+        return self.table(name).op()
 
     @classmethod
     def _supports_conversion(cls, obj: Any) -> bool:
@@ -6,6 +6,7 @@ from pandas.api.types import DatetimeTZDtype
 
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
+import ibis.expr.rules as rlz
 import ibis.expr.schema as sch
 from ibis.backends.base import Database
 from ibis.backends.pandas.client import (
@@ -97,5 +98,23 @@ class DaskTable(ops.DatabaseTable):
     pass
 
 
+class DaskFileScan(DaskTable):
+    """Scan of a table registered from files.
+
+    Only the columns in `schema` are read, and partitions and row groups that
+    can't satisfy the conjunction of `filters` are skipped.
+    """
+
+    filters = rlz.optional(rlz.tuple_of(rlz.instance_of(tuple)), default=())
+
+
+class DaskPersistedTable(DaskTable):
+    """Persisted partitions of another table.
+
+    The partitions are held by the backend apart from its tables, so they
+    aren't listed along with them.
+    """
+
+
 class DaskDatabase(Database):
     pass
@@ -20,7 +20,7 @@ import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 import ibis.expr.types as ir
 from ibis.backends.dask import Backend as DaskBackend
-from ibis.backends.dask.client import DaskTable
+from ibis.backends.dask.client import DaskFileScan, DaskPersistedTable, DaskTable
 from ibis.backends.dask.core import execute
 from ibis.backends.dask.dispatch import execute_node
 from ibis.backends.dask.execution.util import (
@@ -38,6 +38,7 @@ from ibis.backends.pandas.core import (
 from ibis.backends.pandas.execution import constants
 from ibis.backends.pandas.execution.generic import (
     _execute_binary_op_impl,
+    _filter_timecontext,
     coalesce,
     compute_row_reduction,
     execute_between,
@@ -49,6 +50,7 @@ from ibis.backends.pandas.execution.generic import (
     execute_database_table_client,
     execute_difference_dataframe_dataframe,
     execute_distinct_dataframe,
+    execute_file_scan,
     execute_intersection_dataframe_dataframe,
     execute_isinf,
     execute_isnan,
@@ -167,6 +169,13 @@ DASK_DISPATCH_TYPES: TypeRegistrationDict = {
 register_types_to_dispatcher(execute_node, DASK_DISPATCH_TYPES)
 
 execute_node.register(DaskTable, DaskBackend)(execute_database_table_client)
+execute_node.register(DaskFileScan, DaskBackend, tuple)(execute_file_scan)
+
+
+@execute_node.register(DaskPersistedTable, DaskBackend)
+def execute_persisted_table(op, client, timecontext=None, **kwargs):
+    df = client._persisted_frames[op.name]
+    return _filter_timecontext(op, df, timecontext)
 
 
 @execute_node.register(ops.Alias, object)
@@ -337,8 +346,17 @@ def execute_cast_series_date(op, data, type, **kwargs):
 
 @execute_node.register(ops.Limit, dd.DataFrame, integer_types, integer_types)
 def execute_limit_frame(op, data, nrows, offset, **kwargs):
-    # NOTE: Dask Dataframes do not support iloc row based indexing
-    return data.loc[offset : (offset + nrows) - 1]
+    # NOTE: Dask Dataframes do not support iloc row based indexing, so take
+    # the first rows of every partition and slice their concatenation
+    nrows += offset
+    head = data.map_partitions(methodcaller("head", nrows), meta=data._meta)
+    return head.repartition(npartitions=1).map_partitions(
+        _slice_rows, offset, nrows, meta=data._meta
+    )
+
+
+def _slice_rows(df, start, stop):
+    return df.iloc[start:stop]
 
 
 @execute_node.register(ops.Not, (dd.core.Scalar, dd.Series))
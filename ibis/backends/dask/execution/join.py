@@ -1,6 +1,8 @@
 import dask.dataframe as dd
 from pandas import Timedelta
 
+import ibis
+import ibis.common.exceptions as com
 import ibis.expr.operations as ops
 import ibis.util
 from ibis.backends.dask.dispatch import execute_node
@@ -46,6 +48,48 @@ def execute_asof_join(op, left, right, by, tolerance, predicates, **kwargs):
     )
 
 
+# the sides of every join type whose unmatched rows are dropped, which can be
+# sent whole to every partition of the other side
+_BROADCASTABLE_SIDES = {
+    'inner': ('left', 'right'),
+    'left': ('right',),
+    'right': ('left',),
+    'outer': (),
+}
+
+
+def _broadcast_side(how, left, right, hint):
+    """Return the side of a join to broadcast or `None` to shuffle both."""
+    if hint == 'shuffle':
+        return None
+
+    candidates = _BROADCASTABLE_SIDES[how]
+    if hint == 'broadcast':
+        if not candidates:
+            raise com.UnsupportedOperationError(
+                f'{how} joins cannot be broadcast in the dask backend'
+            )
+        sides = {'left': left, 'right': right}
+        return min(candidates, key=lambda name: sides[name].npartitions)
+
+    # only the right side is broadcast without a hint, so the result keeps
+    # the partitions of the left side and the index it gets from them
+    max_partitions = ibis.options.dask.broadcast_join_max_partitions
+    if 'right' in candidates and right.npartitions <= max_partitions:
+        return 'right'
+    return None
+
+
+def _broadcast(left, right, side):
+    # dask merges every partition of one side with a side made of a single
+    # partition without shuffling either
+    if side == 'left':
+        left = left.repartition(npartitions=1)
+    elif side == 'right':
+        right = right.repartition(npartitions=1)
+    return left, right
+
+
 @execute_node.register(ops.CrossJoin, dd.DataFrame, dd.DataFrame, tuple)
 def execute_cross_join(op, left, right, predicates, **kwargs):
     """Execute a cross join in dask.
@@ -60,8 +104,12 @@ def execute_cross_join(op, left, right, predicates, **kwargs):
     # generate a unique name for the temporary join key
     key = f"cross_join_{ibis.util.guid()}"
     join_key = {key: True}
-    new_left = left.assign(**join_key)
-    new_right = right.assign(**join_key)
+    # every row has the same key, so shuffling would move all of them into
+    # one partition, broadcast the side with fewer partitions instead
+    side = 'left' if left.npartitions < right.npartitions else 'right'
+    new_left, new_right = _broadcast(
+        left.assign(**join_key), right.assign(**join_key), side
+    )
 
     # inner/outer doesn't matter because every row matches every other row
     result = dd.merge(
@@ -100,6 +148,8 @@ def execute_join(op, left, right, predicates, **kwargs):
         )
         on[right_pred_root].append(new_right_column)
 
+    side = _broadcast_side(how, left, right, op.hint)
+    left, right = _broadcast(left, right, side)
     df = dd.merge(
         left,
         right,
@@ -107,5 +157,6 @@ def execute_join(op, left, right, predicates, **kwargs):
         left_on=on[op.left],
         right_on=on[op.right],
         suffixes=constants.JOIN_SUFFIXES,
+        broadcast=False if op.hint == 'shuffle' else None,
     )
     return df
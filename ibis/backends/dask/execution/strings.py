@@ -5,7 +5,6 @@ import operator
 import dask.dataframe as dd
 import dask.dataframe.groupby as ddgb
 import numpy as np
-import pandas
 import toolz
 from pandas import isnull
 
@@ -15,6 +14,7 @@ from ibis.backends.dask.core import execute
 from ibis.backends.dask.dispatch import execute_node
 from ibis.backends.dask.execution.util import (
     TypeRegistrationDict,
+    make_meta_series,
     make_selected_obj,
     register_types_to_dispatcher,
 )
@@ -31,6 +31,11 @@ from ibis.backends.pandas.execution.strings import (
     execute_series_translate_scalar_series,
     execute_series_translate_series_scalar,
     execute_series_translate_series_series,
+)
+from ibis.backends.pandas.execution.strings import (
+    execute_string_ascii as pandas_execute_string_ascii,
+)
+from ibis.backends.pandas.execution.strings import (
     execute_string_capitalize,
     execute_string_contains,
     execute_string_find,
@@ -117,41 +122,12 @@ DASK_DISPATCH_TYPES: TypeRegistrationDict = {
             execute_string_contains,
         )
     ],
-    ops.StringSQLLike: [
-        (
-            (
-                dd.Series,
-                str,
-                (str, type(None)),
-            ),
-            execute_string_like_series_string,
-        ),
-    ],
-    ops.RegexSearch: [
-        (
-            (
-                dd.Series,
-                str,
-            ),
-            execute_series_regex_search,
-        )
-    ],
     ops.RegexExtract: [
         (
-            (dd.Series, (dd.Series, str), integer_types),
+            (dd.Series, dd.Series, integer_types),
             execute_series_regex_extract,
         ),
     ],
-    ops.RegexReplace: [
-        (
-            (
-                dd.Series,
-                str,
-                str,
-            ),
-            execute_series_regex_replace,
-        ),
-    ],
     ops.Translate: [
         (
             (dd.Series, dd.Series, dd.Series),
@@ -170,6 +146,39 @@ DASK_DISPATCH_TYPES: TypeRegistrationDict = {
 register_types_to_dispatcher(execute_node, DASK_DISPATCH_TYPES)
 
 
+def map_string_partitions(func, dtype):
+    """Run the pandas implementation `func` of a string operation on each
+    partition, so that it can use Arrow string kernels on whole partitions
+    instead of mapping a python function over every element."""
+
+    @functools.wraps(func)
+    def execute_partitions(op, data, *args, **kwargs):
+        def execute_partition(partition):
+            return func(op, partition, *args)
+
+        meta = make_meta_series(dtype, name=data.name, meta_index=data._meta.index)
+        return data.map_partitions(execute_partition, meta=meta)
+
+    return execute_partitions
+
+
+execute_node.register(ops.StringSQLLike, dd.Series, str, (str, type(None)))(
+    map_string_partitions(execute_string_like_series_string, np.dtype(bool))
+)
+execute_node.register(ops.RegexSearch, dd.Series, str)(
+    map_string_partitions(execute_series_regex_search, np.dtype(bool))
+)
+execute_node.register(ops.RegexExtract, dd.Series, str, integer_types)(
+    map_string_partitions(execute_series_regex_extract, np.dtype(object))
+)
+execute_node.register(ops.RegexReplace, dd.Series, str, str)(
+    map_string_partitions(execute_series_regex_replace, np.dtype(object))
+)
+execute_node.register(ops.StringAscii, dd.Series)(
+    map_string_partitions(pandas_execute_string_ascii, np.dtype('int32'))
+)
+
+
 @execute_node.register(ops.Substring, dd.Series, dd.Series, integer_types)
 def execute_substring_series_int(op, data, start, length, **kwargs):
     return execute_substring_series_series(
@@ -212,9 +221,9 @@ def execute_node_string_concat(op, values, **kwargs):
 
 @execute_node.register(ops.StringSQLLike, ddgb.SeriesGroupBy, str, str)
 def execute_string_like_series_groupby_string(op, data, pattern, escape, **kwargs):
-    return execute_string_like_series_string(
-        op, make_selected_obj(data), pattern, escape, **kwargs
-    ).groupby(data.grouper.groupings)
+    return execute_node(op, make_selected_obj(data), pattern, escape, **kwargs).groupby(
+        data.grouper.groupings
+    )
 
 
 # TODO - aggregations - #2553
@@ -252,22 +261,14 @@ def execute_group_concat_series_gb_mask(op, data, sep, mask, aggcontext=None, **
     )
 
 
-@execute_node.register(ops.StringAscii, dd.Series)
-def execute_string_ascii(op, data, **kwargs):
-    output_meta = pandas.Series([], dtype=np.dtype('int32'), name=data.name)
-    return data.map(ord, meta=output_meta)
-
-
 @execute_node.register(ops.StringAscii, ddgb.SeriesGroupBy)
 def execute_string_ascii_group_by(op, data, **kwargs):
-    return execute_string_ascii(op, make_selected_obj(data), **kwargs).groupby(
-        data.index
-    )
+    return execute_node(op, make_selected_obj(data), **kwargs).groupby(data.index)
 
 
 @execute_node.register(ops.RegexSearch, ddgb.SeriesGroupBy, str)
 def execute_series_regex_search_gb(op, data, pattern, **kwargs):
-    return execute_series_regex_search(
+    return execute_node(
         op,
         make_selected_obj(data),
         getattr(pattern, 'obj', pattern),
@@ -277,15 +278,15 @@ def execute_series_regex_search_gb(op, data, pattern, **kwargs):
 
 @execute_node.register(ops.RegexExtract, ddgb.SeriesGroupBy, str, integer_types)
 def execute_series_regex_extract_gb(op, data, pattern, index, **kwargs):
-    return execute_series_regex_extract(
-        op, make_selected_obj(data), pattern, index, **kwargs
-    ).groupby(data.index)
+    return execute_node(op, make_selected_obj(data), pattern, index, **kwargs).groupby(
+        data.index
+    )
 
 
 @execute_node.register(ops.RegexReplace, ddgb.SeriesGroupBy, str, str)
 def execute_series_regex_replace_gb(op, data, pattern, replacement, **kwargs):
-    return execute_series_regex_replace(
-        make_selected_obj(data), pattern, replacement, **kwargs
+    return execute_node(
+        op, make_selected_obj(data), pattern, replacement, **kwargs
     ).groupby(data.index)
 
 
@@ -5,7 +5,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 import dask.dataframe as dd
+import pandas as pd
 
+import ibis.backends.pandas.core as pandas_core
 import ibis.expr.analysis as an
 import ibis.expr.operations as ops
 import ibis.expr.window as win
@@ -17,6 +19,8 @@ from ibis.backends.dask.execution.util import (
     add_partitioned_sorted_column,
     make_meta_series,
 )
+from ibis.backends.pandas.aggcontext import compute_window_spec
+from ibis.backends.pandas.execution.util import coerce_to_output
 from ibis.expr.scope import Scope
 
 if TYPE_CHECKING:
@@ -66,8 +70,6 @@ def execute_window_op(
     clients=None,
     **kwargs,
 ):
-    # Currently this acts as an "unwrapper" for trivial windows (i.e. those
-    # with no ordering/grouping/preceding/following functionality).
     if not all(
         [
             window.preceding is None,
@@ -75,8 +77,14 @@ def execute_window_op(
             not window._order_by,
         ]
     ):
-        raise NotImplementedError(
-            "Window operations are unsupported in the dask backend"
+        return execute_partitioned_window_op(
+            op,
+            window,
+            scope,
+            timecontext,
+            aggcontext,
+            clients,
+            **kwargs,
         )
 
     if window._group_by:
@@ -158,3 +166,158 @@ def execute_grouped_window_op(
         result.divisions = root_data.divisions
 
     return result
+
+
+# column holding the position of every row in the window's input, used to
+# restore the input's partitioning and order after computing the window
+_ROW_ID = "_ibis_window_row_id"
+
+
+def _add_row_ids(df: pd.DataFrame, partition_info: dict[str, Any]) -> pd.DataFrame:
+    base = partition_info["number"] << 32
+    return df.assign(**{_ROW_ID: range(base, base + len(df))})
+
+
+def _compute_window_partition(df: pd.DataFrame, op, root) -> pd.Series:
+    """Compute a window over one partition with the pandas backend."""
+    row_ids = df[_ROW_ID].to_numpy()
+    df = df.drop(columns=_ROW_ID).reset_index(drop=True)
+
+    result = pandas_core.execute(op, scope=Scope({root: df}, None), clients=[])
+    result = coerce_to_output(result, op, df.index)
+    if result.index.nlevels > 1:
+        result = result.reset_index(
+            level=list(range(1, result.index.nlevels)), drop=True
+        )
+    return pd.Series(
+        result.sort_index().to_numpy(),
+        index=pd.Index(row_ids, name=_ROW_ID),
+        name=op.name,
+    )
+
+
+def _window_overlap(op, window) -> tuple[Any, Any] | None:
+    """Return how many neighbouring rows, or how much time, every row's
+    window reaches before and after it in the ordering.
+
+    `None` is returned for windows with an unbounded frame.
+    """
+    if isinstance(op.expr, ops.ShiftBase):
+        offset = op.expr.offset
+        if offset is None:
+            offset = 1
+        elif isinstance(offset, ops.Literal) and isinstance(offset.value, int):
+            offset = offset.value
+        else:
+            return None
+        return (offset, 0) if isinstance(op.expr, ops.Lag) else (0, offset)
+
+    preceding, following = window.preceding, window.following
+    if following != 0 or window.max_lookback is not None:
+        return None
+    elif window.how == "rows" and isinstance(preceding, int):
+        return preceding, 0
+    elif window.how == "range" and isinstance(preceding, ops.Literal):
+        spec = compute_window_spec(preceding.output_dtype, preceding)
+        try:
+            before = pd.Timedelta(spec)
+        except ValueError:
+            # calendar offsets like months have no fixed length
+            return None
+        # pandas computes range windows closed on both ends, while dask
+        # only shares rows strictly inside the overlap
+        return before + pd.Timedelta(1, unit="ns"), 0
+    return None
+
+
+def execute_partitioned_window_op(
+    op,
+    window,
+    scope,
+    timecontext,
+    aggcontext,
+    clients,
+    **kwargs,
+):
+    """Compute an ordered or framed window partition by partition.
+
+    Grouped windows shuffle the rows so that every group ends up in a single
+    partition. Ordered windows with a bounded frame sort the rows and share
+    the rows each window reaches with the neighbouring partition using
+    `map_overlap`. Any other window is computed in a single partition. Every
+    partition is computed with the pandas backend's window implementation.
+    """
+    root = an.find_first_base_table(op)
+    if any(table != root for table in an.find_immediate_parent_tables(op.expr)):
+        raise NotImplementedError(
+            "Window functions over multiple tables are not supported in the "
+            "dask backend"
+        )
+
+    root_data = execute(
+        root,
+        scope=scope,
+        timecontext=timecontext,
+        aggcontext=aggcontext,
+        clients=clients,
+        **kwargs,
+    )
+    meta = root_data._meta.assign(**{_ROW_ID: pd.Series(dtype="int64")})
+    data = root_data.map_partitions(_add_row_ids, meta=meta)
+
+    group_by = window._group_by
+    order_by = window._order_by
+    if all(isinstance(key, ops.TableColumn) for key in group_by) and group_by:
+        data = data.shuffle([key.name for key in group_by])
+        result = _map_window(data.map_partitions, op, root, data)
+    elif (
+        not group_by
+        and len(order_by) == 1
+        and isinstance(key := order_by[0], ops.SortKey)
+        and key.ascending
+        and isinstance(key.expr, ops.TableColumn)
+        and (overlap := _window_overlap(op, window)) is not None
+    ):
+        result = _execute_overlapping_window(op, root, data, key, overlap)
+    else:
+        data = data.repartition(npartitions=1)
+        result = _map_window(data.map_partitions, op, root, data)
+
+    # move every value back to the partition and position of its input row
+    name = result.name
+    divisions = tuple(i << 32 for i in range(root_data.npartitions + 1))
+    result = result.to_frame().reset_index()
+    result = result.set_index(_ROW_ID, divisions=divisions)[name]
+    return root_data.map_partitions(
+        _align_to_partition,
+        result,
+        align_dataframes=False,
+        meta=result._meta.reset_index(drop=True),
+    )
+
+
+def _align_to_partition(df: pd.DataFrame, result: pd.Series) -> pd.Series:
+    return pd.Series(result.to_numpy(), index=df.index, name=result.name)
+
+
+def _map_window(map_partitions, op, root, data):
+    # computing the window over the fake non-empty metadata raises errors,
+    # like unsupported frames, before any work is scheduled
+    meta = _compute_window_partition(data._meta_nonempty, op, root).iloc[:0]
+    return map_partitions(_compute_window_partition, op=op, root=root, meta=meta)
+
+
+def _execute_overlapping_window(op, root, data, key, overlap):
+    before, after = overlap
+    data = data.set_index(key.expr.name, drop=False)
+
+    # overlapping rows are only read from the adjacent partitions
+    rows = max((size for size in overlap if isinstance(size, int)), default=0)
+    if rows and data.npartitions > 1:
+        if data.map_partitions(len).compute().min() < rows:
+            data = data.repartition(npartitions=1)
+
+    def map_overlap(func, **kwargs):
+        return data.map_overlap(func, before, after, **kwargs)
+
+    return _map_window(map_overlap, op, root, data)
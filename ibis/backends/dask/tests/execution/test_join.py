@@ -4,6 +4,7 @@ from pandas import Timedelta, date_range
 from pytest import param
 
 import ibis
+import ibis.common.exceptions as com
 
 dd = pytest.importorskip("dask.dataframe")
 from dask.dataframe.utils import tm  # noqa: E402
@@ -496,3 +497,79 @@ def test_outer_join(npartitions):
         result.compute(scheduler='single-threaded'),
         expected.compute(scheduler='single-threaded'),
     )
+
+
+@pytest.fixture
+def keyed_frames():
+    left = pd.DataFrame({"key": range(100), "value": range(100)})
+    right = pd.DataFrame({"key_2": range(0, 200, 4), "other": range(50)})
+    return left, right
+
+
+def _shuffles(result):
+    return any(name.startswith("shuffle") for name in result.dask.layers)
+
+
+@pytest.mark.parametrize(
+    ("how", "hint", "right_npartitions", "shuffles"),
+    [
+        param("inner", None, 2, False, id="inner-small"),
+        param("inner", None, 6, True, id="inner-large"),
+        param("left", None, 2, False, id="left-small"),
+        param("right", None, 2, True, id="right-small"),
+        param("inner", "broadcast", 6, False, id="inner-broadcast"),
+        param("left", "broadcast", 6, False, id="left-broadcast"),
+        param("inner", "shuffle", 2, True, id="inner-shuffle"),
+        param("outer", None, 2, True, id="outer"),
+    ],
+)
+def test_join_strategy(keyed_frames, how, hint, right_npartitions, shuffles):
+    left_df, right_df = keyed_frames
+    con = ibis.dask.connect(
+        {
+            "left": dd.from_pandas(left_df, npartitions=8),
+            "right": dd.from_pandas(right_df, npartitions=right_npartitions),
+        }
+    )
+    left, right = con.table("left"), con.table("right")
+    expr = left.join(right, left.key == right.key_2, how=how, hint=hint)
+
+    with ibis.config.option_context("dask.broadcast_join_max_partitions", 2):
+        result = expr.compile()
+    assert _shuffles(result) == shuffles
+
+    expected = left_df.merge(right_df, how=how, left_on="key", right_on="key_2")
+    tm.assert_frame_equal(
+        result.compute().sort_values(["key", "key_2"]).reset_index(drop=True),
+        expected.sort_values(["key", "key_2"]).reset_index(drop=True),
+        check_dtype=False,
+    )
+
+
+def test_outer_join_cannot_be_broadcast(keyed_frames):
+    left_df, right_df = keyed_frames
+    con = ibis.dask.connect(
+        {
+            "left": dd.from_pandas(left_df, npartitions=2),
+            "right": dd.from_pandas(right_df, npartitions=2),
+        }
+    )
+    left, right = con.table("left"), con.table("right")
+    expr = left.outer_join(right, left.key == right.key_2, hint="broadcast")
+    with pytest.raises(com.UnsupportedOperationError):
+        expr.compile()
+
+
+def test_cross_join_broadcasts_smaller_side(keyed_frames):
+    left_df, right_df = keyed_frames
+    con = ibis.dask.connect(
+        {
+            "left": dd.from_pandas(left_df, npartitions=2),
+            "right": dd.from_pandas(right_df, npartitions=5),
+        }
+    )
+    expr = con.table("left").cross_join(con.table("right"))
+    result = expr.compile()
+    assert not _shuffles(result)
+    assert result.npartitions == 5
+    assert len(result.compute()) == len(left_df) * len(right_df)
@@ -427,8 +427,8 @@ def test_frame_limit(t, df, offset):
     n = 5
     df_expr = t.limit(n, offset=offset)
     result = df_expr.compile()
-    expected = df.loc[offset : offset + n].reset_index(drop=True)
-    tm.assert_frame_equal(result[expected.columns].compute(), expected.compute())
+    expected = df.compute().iloc[offset : offset + n].reset_index(drop=True)
+    tm.assert_frame_equal(result[expected.columns].compute(), expected)
 
 
 @pytest.mark.xfail(raises=AttributeError, reason='TableColumn does not implement limit')
@@ -1,8 +1,11 @@
 from warnings import catch_warnings
 
+import pandas as pd
 import pytest
 from pytest import param
 
+import ibis
+
 dd = pytest.importorskip("dask.dataframe")
 from dask.dataframe.utils import tm  # noqa: E402
 
@@ -121,3 +124,25 @@ def test_grouped_string_re_search(t, df):
     )
 
     tm.assert_frame_equal(result.compute(), expected.compute())
+
+
+@pytest.mark.parametrize(
+    'case_func',
+    [
+        param(lambda s: s.like('%a_c%'), id='like'),
+        param(lambda s: s.re_search(r'\s'), id='re_search'),
+        param(lambda s: s.re_search('c$'), id='re_search_end'),
+        param(lambda s: s.re_extract(r'(\w+) (\w+)', 1), id='re_extract'),
+        param(lambda s: s.re_replace(r'(\w)(\w)', r'\2\1'), id='re_replace'),
+    ],
+)
+def test_arrow_string_ops_match_python(case_func):
+    df = pd.DataFrame({'s': ['abc', 'b c', 'a bc d', 'éa b', 'Straße x', 'abc\n']})
+    con = ibis.dask.connect({'df': dd.from_pandas(df, npartitions=2)})
+    expr = case_func(con.table('df').s)
+
+    with ibis.config.option_context('pandas.arrow_strings', False):
+        expected = expr.execute()
+    result = expr.execute()
+
+    tm.assert_series_equal(result, expected, check_names=False)
@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pytest import param
+
+import ibis
+
+dd = pytest.importorskip("dask.dataframe")
+from dask.dataframe.utils import tm  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def pandas_df():
+    rng = np.random.default_rng(42)
+    n = 200
+    # every ordering key is unique so that the windows are deterministic
+    return pd.DataFrame(
+        {
+            "key": rng.permutation(n),
+            "time": pd.date_range("2020-01-01", periods=n, freq="6H")[
+                rng.permutation(n)
+            ],
+            "value": rng.random(n),
+            "group": rng.choice(list("abcde"), n),
+        }
+    )
+
+
+@pytest.fixture(scope="module", params=[1, 3, 7])
+def partitioned_df(request, pandas_df):
+    return dd.from_pandas(pandas_df, npartitions=request.param)
+
+
+@pytest.fixture
+def dask_t(partitioned_df):
+    return ibis.dask.connect({"t": partitioned_df}).table("t")
+
+
+@pytest.fixture(scope="module")
+def pandas_t(pandas_df):
+    return ibis.pandas.connect({"t": pandas_df}).table("t")
+
+
+@pytest.mark.parametrize(
+    "window_fn",
+    [
+        param(
+            lambda t: t.value.sum().over(ibis.trailing_window(3, order_by=t.key)),
+            id="rows",
+        ),
+        param(
+            lambda t: t.value.mean().over(
+                ibis.trailing_window(3, order_by=t.key, group_by=t.group)
+            ),
+            id="grouped_rows",
+        ),
+        param(
+            lambda t: t.value.sum().over(
+                ibis.range_window(
+                    preceding=ibis.interval(days=2), following=0, order_by=t.time
+                )
+            ),
+            id="range",
+        ),
+        param(
+            lambda t: t.value.sum().over(ibis.cumulative_window(order_by=t.key)),
+            id="cumulative",
+        ),
+        param(
+            lambda t: t.value.max().over(
+                ibis.cumulative_window(order_by=t.key, group_by=t.group)
+            ),
+            id="grouped_cumulative",
+        ),
+        param(
+            lambda t: t.value.sum().over(
+                ibis.trailing_window(3, order_by=ibis.desc(t.key))
+            ),
+            id="descending",
+        ),
+        param(lambda t: t.value.lag().over(ibis.window(order_by=t.key)), id="lag"),
+        param(lambda t: t.value.lead(2).over(ibis.window(order_by=t.key)), id="lead"),
+        param(
+            lambda t: t.value.lag().over(ibis.window(order_by=t.key, group_by=t.group)),
+            id="grouped_lag",
+        ),
+    ],
+)
+def test_partitioned_window(dask_t, pandas_t, window_fn):
+    result = dask_t.mutate(result=window_fn(dask_t)).execute()
+    expected = pandas_t.mutate(result=window_fn(pandas_t)).execute()
+    tm.assert_frame_equal(result.reset_index(drop=True), expected)
+
+
+def test_partitioned_window_preserves_partitioning(dask_t, partitioned_df):
+    expr = dask_t.mutate(
+        result=dask_t.value.sum().over(ibis.trailing_window(3, order_by=dask_t.key))
+    )
+    result = expr.compile()
+    assert result.npartitions == partitioned_df.npartitions
+
+
+def test_partitioned_window_overlap_larger_than_partition(pandas_t, pandas_df):
+    dask_t = ibis.dask.connect({"t": dd.from_pandas(pandas_df, npartitions=50)}).table(
+        "t"
+    )
+
+    def window_fn(t):
+        return t.value.sum().over(ibis.trailing_window(10, order_by=t.key))
+
+    result = dask_t.mutate(result=window_fn(dask_t)).execute()
+    expected = pandas_t.mutate(result=window_fn(pandas_t)).execute()
+    tm.assert_frame_equal(result.reset_index(drop=True), expected)
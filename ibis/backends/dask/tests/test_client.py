@@ -8,7 +8,8 @@ from dask.dataframe.utils import tm
 from pytest import param
 
 import ibis
-from ibis.backends.dask.client import DaskTable
+import ibis.expr.analysis as an
+from ibis.backends.dask.client import DaskFileScan, DaskTable
 
 
 def make_dask_data_frame(npartitions):
@@ -129,3 +130,183 @@ def test_invalid_connection_parameter_types(npartitions):
     )
     with pytest.raises(TypeError, match=expeced_msg):
         ibis.dask.from_dataframe("file.csv")
+
+
+def test_register_parquet(tmp_path):
+    df = pd.DataFrame({"a": range(100), "b": list("xy") * 50, "k": [0, 1] * 50})
+    df.to_parquet(tmp_path / "data.parquet", row_group_size=10)
+    df.to_parquet(tmp_path / "dataset", partition_cols=["k"])
+
+    client = ibis.dask.connect({})
+    t = client.register(tmp_path / "data.parquet")
+    expr = t.filter(t.a > 50).b.value_counts()
+    (scan,) = an.find_immediate_parent_tables(client._push_down_scans(expr.op()))
+    scan = scan.table
+    assert isinstance(scan, DaskFileScan)
+    assert scan.schema.names == ("a", "b")
+    assert scan.filters == (("a", ">", 50),)
+
+    result = expr.execute().set_index("b")["count"].sort_index()
+    expected = df.b[df.a > 50].value_counts().sort_index()
+    assert result.tolist() == expected.tolist()
+
+    t = client.register(tmp_path / "dataset")
+    assert t.filter(t.k == 0).a.sum().execute() == sum(range(0, 100, 2))
+
+
+def test_register_parquet_reduction_over_unfiltered_rows(tmp_path):
+    df = pd.DataFrame({"a": range(100)})
+    df.to_parquet(tmp_path / "data.parquet", row_group_size=10)
+
+    client = ibis.dask.connect({"mem": dd.from_pandas(df, npartitions=2)})
+    t = client.register(tmp_path / "data.parquet")
+    expr = t.mutate(s=t.a.sum()).filter(t.a > 95)
+
+    (scan,) = an.find_immediate_parent_tables(client._push_down_scans(expr.op()))
+    assert scan.table.filters == ()
+
+    mem = client.table("mem")
+    expected = mem.mutate(s=mem.a.sum()).filter(mem.a > 95).execute()
+    tm.assert_frame_equal(expr.execute(), expected)
+
+
+@pytest.fixture
+def counted_table():
+    computed = []
+
+    def load(i):
+        computed.append(i)
+        return pd.DataFrame({"a": range(i * 10, (i + 1) * 10)})
+
+    meta = pd.DataFrame({"a": pd.Series(dtype="int64")})
+    data = dd.from_map(load, range(10), meta=meta, divisions=[None] * 11)
+    return ibis.dask.connect({"t": data}).table("t"), computed
+
+
+@pytest.mark.parametrize(
+    ("expr_fn", "limit", "expected"),
+    [
+        param(lambda t: t.limit(5), "default", list(range(5)), id="limit"),
+        param(lambda t: t, 5, list(range(5)), id="limit_param"),
+        param(lambda t: t.limit(5, offset=8), None, list(range(8, 13)), id="offset"),
+        param(lambda t: t.limit(20), 5, list(range(5)), id="both"),
+        param(
+            lambda t: t.filter(t.a % 7 == 0).limit(2, offset=1),
+            None,
+            [7, 14],
+            id="filter",
+        ),
+        param(lambda t: t.limit(0), None, [], id="empty"),
+    ],
+)
+def test_limit_computes_leading_partitions(counted_table, expr_fn, limit, expected):
+    t, computed = counted_table
+    result = expr_fn(t).execute(limit=limit)
+    assert result.a.tolist() == expected
+    assert result.index.tolist() == list(range(len(expected)))
+    assert len(computed) < 10
+
+
+def test_nested_limit(counted_table):
+    t, _ = counted_table
+    expr = t.filter(t.a >= 25).limit(3, offset=2)
+    assert expr.a.sum().execute() == 27 + 28 + 29
+    assert expr.compile().compute().a.tolist() == [27, 28, 29]
+
+
+def test_to_pyarrow_batches(counted_table):
+    t, computed = counted_table
+    reader = t.to_pyarrow_batches(chunk_size=15)
+    assert not computed
+
+    batch = reader.read_next_batch()
+    assert batch.column("a").to_pylist() == list(range(15))
+    assert computed == [0, 1]
+
+    assert [len(batch) for batch in reader] == [15] * 5 + [10]
+    assert computed == list(range(10))
+
+
+def test_column_to_pyarrow_batches_with_limit(counted_table):
+    t, computed = counted_table
+    reader = t.a.to_pyarrow_batches(limit=25, chunk_size=10)
+    assert [batch.column(0).to_pylist() for batch in reader] == [
+        list(range(10)),
+        list(range(10, 20)),
+        list(range(20, 25)),
+    ]
+    assert computed == [0, 1, 2]
+
+
+def test_persist(counted_table):
+    t, computed = counted_table
+    client = t.op().source
+    filtered = t.filter(t.a % 2 == 0)
+
+    assert filtered.count().execute() == 50
+    computed_per_run = len(computed)
+    computed.clear()
+
+    client.persist(filtered)
+    assert filtered.a.sum().execute() == sum(range(0, 100, 2))
+    computed_persisted = len(computed)
+    assert filtered.count().execute() == 50
+    # later executions read the persisted partitions
+    assert len(computed) == computed_persisted
+
+    ((expr, nbytes),) = client.persisted().items()
+    assert expr.equals(filtered)
+    assert nbytes > 0
+    assert client.list_tables() == ["t"]
+
+    client.unpersist(filtered)
+    assert not client.persisted()
+    computed.clear()
+    assert filtered.count().execute() == 50
+    assert len(computed) == computed_per_run
+
+
+def test_persist_reused(counted_table):
+    t, computed = counted_table
+    client = t.op().source
+    filtered = t.filter(t.a > 50)
+
+    with ibis.config.option_context("dask.persist_reused", 2):
+        # the first execution counts the use, the second one persists the table
+        for _ in range(2):
+            assert filtered.a.max().execute() == 99
+        computed_before = len(computed)
+        assert filtered.a.max().execute() == 99
+
+    assert len(computed) == computed_before
+    ((expr, _),) = client.persisted().items()
+    assert expr.equals(filtered)
+
+
+def test_compile_doesnt_persist(counted_table):
+    t, _ = counted_table
+    client = t.op().source
+    filtered = client.persist(t.filter(t.a > 50))
+
+    with ibis.config.option_context("dask.persist_reused", 1):
+        filtered.a.max().compile()
+        t.filter(t.a < 50).a.max().compile()
+
+    assert not client.persisted()
+    assert not client._persist_uses
+
+
+def test_persist_evicts_least_recently_used(counted_table):
+    t, _ = counted_table
+    client = t.op().source
+    low = client.persist(t.filter(t.a < 50))
+    high = client.persist(t.filter(t.a >= 50))
+
+    with ibis.config.option_context("dask.persist_max_bytes", 0):
+        assert low.count().execute() == 50
+        ((expr, _),) = client.persisted().items()
+        assert expr.equals(low)
+
+        assert high.count().execute() == 50
+        ((expr, _),) = client.persisted().items()
+        assert expr.equals(high)
@@ -9,6 +9,7 @@ from typing import Any, Mapping
 import pyarrow as pa
 
 import ibis.common.exceptions as com
+import ibis.common.graph as graph
 import ibis.expr.analysis as an
 import ibis.expr.operations as ops
 import ibis.expr.schema as sch
@@ -60,6 +61,10 @@ def _file(raw, path, table_name=None, **kwargs):
     return _register_file(f"{extension}://{path}", table_name=table_name, **kwargs)
 
 
+def _find_memtables(op):
+    return graph.proceed, op if isinstance(op, ops.InMemoryTable) else None
+
+
 def _to_pyarrow_table(frame):
     batches = frame.collect()
     if batches:
@@ -84,6 +89,8 @@ class Backend(BaseBackend):
     def do_connect(
         self,
         config: Mapping[str, str | Path] | SessionContext | None = None,
+        target_partitions: int | None = None,
+        batch_size: int | None = None,
     ) -> None:
         """Create a Datafusion backend for use with Ibis.
 
@@ -91,17 +98,34 @@ class Backend(BaseBackend):
         ----------
         config
             Mapping of table names to files.
+        target_partitions
+            Number of partitions DataFusion splits scans and operators into
+            when executing a query. Defaults to the number of CPU cores.
+        batch_size
+            Target number of rows in the record batches DataFusion produces
+            while executing a query.
 
         Examples
         --------
         >>> import ibis
         >>> config = {"t": "path/to/file.parquet", "s": "path/to/file.csv"}
         >>> ibis.datafusion.connect(config)
+        >>> ibis.datafusion.connect(config, target_partitions=4, batch_size=8192)
         """
         if isinstance(config, SessionContext):
+            if target_partitions is not None or batch_size is not None:
+                raise com.IbisError(
+                    "`target_partitions` and `batch_size` cannot be used with an "
+                    "existing SessionContext"
+                )
             self._context = config
         else:
-            self._context = SessionContext()
+            self._context = _make_context(
+                target_partitions=target_partitions, batch_size=batch_size
+            )
+
+        # fingerprints of the in-memory tables registered with the context
+        self._memtables = {}
 
         config = config or {}
 
@@ -214,9 +238,37 @@ class Backend(BaseBackend):
         chunk_size: int = 1_000_000,
         **kwargs: Any,
     ) -> pa.RecordBatchReader:
+        """Execute expression and return a RecordBatchReader.
+
+        When the installed version of DataFusion supports it, record batches
+        are pulled from the query's output stream as they are produced instead
+        of after every partition has been computed.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit.
+        chunk_size
+            Maximum number of rows in each returned record batch.
+        kwargs
+            Keyword arguments
+
+        Returns
+        -------
+        RecordBatchReader
+            Collection of pyarrow `RecordBatch`s.
+        """
         pa = self._import_pyarrow()
         frame = self._get_frame(expr, params, limit, **kwargs)
-        return pa.RecordBatchReader.from_batches(frame.schema(), frame.collect())
+        if isinstance(limit, int):
+            frame = frame.limit(limit)
+        return pa.RecordBatchReader.from_batches(
+            frame.schema(), _stream_batches(frame, chunk_size)
+        )
 
     def execute(
         self,
@@ -243,7 +295,31 @@ class Backend(BaseBackend):
         params: Mapping[ir.Expr, object] = None,
         **kwargs: Any,
     ):
-        return translate(expr.op())
+        return translate(self._register_in_memory_tables(expr).op())
+
+    def _register_in_memory_tables(self, expr: ir.Expr) -> ir.Expr:
+        # in-memory tables are registered with the context once per content
+        # and referenced like any other table
+        subs = {}
+        for memtable in graph.traverse(_find_memtables, expr.op()):
+            self._register_in_memory_table(memtable)
+            subs[memtable] = ops.DatabaseTable(memtable.name, memtable.schema, self)
+        return expr.op().replace(subs).to_expr() if subs else expr
+
+    def _register_in_memory_table(self, table_op: ops.InMemoryTable) -> None:
+        name = table_op.name
+        fingerprint = table_op.data.fingerprint
+        if self._memtables.get(name) == fingerprint:
+            return
+        if name in self._memtables:
+            self._context.deregister_table(name)
+
+        table = table_op.data.to_pyarrow()
+        batches = table.to_batches() or [
+            pa.RecordBatch.from_pylist([], schema=table.schema)
+        ]
+        self._context.register_record_batches(name, [batches])
+        self._memtables[name] = fingerprint
 
     @classmethod
     @lru_cache
@@ -258,3 +334,41 @@ class Backend(BaseBackend):
         return operation in op_classes or any(
             issubclass(operation, op_impl) for op_impl in op_classes
         )
+
+
+def _make_context(
+    target_partitions: int | None = None, batch_size: int | None = None
+) -> SessionContext:
+    if target_partitions is None and batch_size is None:
+        return SessionContext()
+
+    try:
+        from datafusion import SessionConfig
+    except ImportError:
+        raise com.IbisError(
+            "`target_partitions` and `batch_size` require datafusion >= 0.7"
+        )
+
+    config = SessionConfig()
+    if target_partitions is not None:
+        config = config.with_target_partitions(target_partitions)
+    if batch_size is not None:
+        config = config.with_batch_size(batch_size)
+    return SessionContext(config)
+
+
+def _stream_batches(frame: datafusion.DataFrame, chunk_size: int):
+    """Yield the record batches of `frame` with at most `chunk_size` rows.
+
+    Older versions of DataFusion can only collect the whole result, in which
+    case all of the batches are computed before the first is yielded.
+    """
+    execute_stream = getattr(frame, "execute_stream", None)
+    if execute_stream is not None:
+        batches = (batch.to_pyarrow() for batch in execute_stream())
+    else:
+        batches = frame.collect()
+
+    for batch in batches:
+        for offset in range(0, batch.num_rows, chunk_size):
+            yield batch.slice(offset, chunk_size)
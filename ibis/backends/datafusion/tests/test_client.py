@@ -0,0 +1,47 @@
+import pytest
+
+import ibis
+import ibis.common.exceptions as com
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+datafusion = pytest.importorskip("datafusion")
+
+
+@pytest.fixture
+def parquet_path(tmp_path):
+    path = tmp_path / "data.parquet"
+    table = pa.table({"key": [i % 3 for i in range(100)], "value": range(100)})
+    pq.write_table(table, path)
+    return path
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        pytest.param({}, id="default"),
+        pytest.param({"target_partitions": 2, "batch_size": 16}, id="configured"),
+    ],
+)
+def test_to_pyarrow_batches(parquet_path, kwargs):
+    con = ibis.datafusion.connect({"t": parquet_path}, **kwargs)
+    t = con.table("t")
+    expr = t.filter(t.value >= 10)
+
+    reader = con.to_pyarrow_batches(expr, chunk_size=7)
+    batches = list(reader)
+    assert all(batch.num_rows <= 7 for batch in batches)
+
+    result = pa.Table.from_batches(batches, schema=reader.schema)
+    assert sorted(result["value"].to_pylist()) == list(range(10, 100))
+
+
+def test_to_pyarrow_batches_limit(parquet_path):
+    con = ibis.datafusion.connect({"t": parquet_path})
+    reader = con.to_pyarrow_batches(con.table("t"), limit=15, chunk_size=4)
+    assert sum(batch.num_rows for batch in reader) == 15
+
+
+def test_connect_options_with_existing_context():
+    with pytest.raises(com.IbisError, match="existing SessionContext"):
+        ibis.datafusion.connect(datafusion.SessionContext(), target_partitions=2)
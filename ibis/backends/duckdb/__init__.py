@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import ast
 import itertools
+import operator
 import os
 import warnings
 from pathlib import Path
@@ -14,6 +15,9 @@ import pyarrow.types as pat
 import sqlalchemy as sa
 import toolz
 
+import ibis
+import ibis.common.exceptions as com
+import ibis.config
 import ibis.expr.datatypes as dt
 from ibis.backends.base.sql.alchemy.datatypes import to_sqla_type
 
@@ -22,9 +26,12 @@ if TYPE_CHECKING:
 
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
+import ibis.util as util
+from ibis.backends.base.sql import _file_version
 from ibis.backends.base.sql.alchemy import BaseAlchemyBackend
 from ibis.backends.duckdb.compiler import DuckDBSQLCompiler
 from ibis.backends.duckdb.datatypes import parse
+from ibis.backends.pyarrow import PyArrowInMemoryTable
 from ibis.common.dispatch import RegexDispatcher
 
 _generate_view_code = RegexDispatcher("_register")
@@ -142,10 +149,67 @@ Supported file extensions are parquet, csv, tsv, txt, csv.gz, tsv.gz, and txt.gz
     )
 
 
+def _column_to_pandas(column: pa.ChunkedArray):
+    if pat.is_nested(column.type):
+        return column.to_pylist()
+    elif pat.is_timestamp(column.type):
+        # keep the native datetime64 representation unless the values don't
+        # fit into nanosecond resolution
+        try:
+            return column.to_pandas()
+        except pa.ArrowInvalid:
+            return column.to_pandas(timestamp_as_object=True)
+    else:
+        return column.to_pandas()
+
+
+def _cast_column(column: pa.ChunkedArray, dtype: dt.DataType) -> pa.ChunkedArray:
+    # columns already having the expected type are passed through without
+    # copying, the rest are cast on a best effort basis
+    try:
+        typ = dtype.to_pyarrow()
+    except (KeyError, com.IbisTypeError):
+        return column
+    if column.type == typ:
+        return column
+    elif pat.is_timestamp(column.type) and pat.is_timestamp(typ):
+        # the arrow types generated from ibis types don't carry the timezone
+        return column
+    try:
+        return column.cast(typ)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+        return column
+
+
+def _matches_schema(df, schema: sch.Schema) -> bool:
+    for column, dtype in zip(df.columns, schema.types):
+        if not dtype.is_primitive():
+            return False
+        try:
+            if dtype.to_pandas() != df[column].dtype:
+                return False
+        except TypeError:
+            return False
+    return True
+
+
 class Backend(BaseAlchemyBackend):
     name = "duckdb"
     compiler = DuckDBSQLCompiler
 
+    class Options(ibis.config.Config):
+        """DuckDB options.
+
+        Attributes
+        ----------
+        arrow_dtypes : bool
+            Return query results as pandas objects backed by the fetched
+            arrow memory (`pandas.ArrowDtype`) instead of converting them to
+            numpy and python objects. Requires pandas 1.5 or later.
+        """
+
+        arrow_dtypes: bool = False
+
     def current_database(self) -> str:
         return "main"
 
@@ -172,6 +236,7 @@ class Backend(BaseAlchemyBackend):
         path: str | Path = None,
         read_only: bool = False,
         temp_directory: Path | str | None = None,
+        pool_size: int = 5,
         **config: Any,
     ) -> None:
         """Create an Ibis client connected to a DuckDB database.
@@ -185,6 +250,10 @@ class Backend(BaseAlchemyBackend):
         temp_directory
             Directory to use for spilling to disk. Only set by default for
             in-memory connections.
+        pool_size
+            Number of connections kept open for concurrent execution with
+            `execute_many` and `execute_async`. Every thread uses its own
+            connection, all of them share the same database.
         config
             DuckDB configuration parameters. See the [DuckDB configuration
             documentation](https://duckdb.org/docs/sql/configuration) for
@@ -201,7 +270,7 @@ class Backend(BaseAlchemyBackend):
                 "instead."
             )
             database = path
-        if not (in_memory := database == ":memory:"):
+        if database != ":memory:":
             database = Path(database).absolute()
         else:
             if temp_directory is None:
@@ -213,13 +282,50 @@ class Backend(BaseAlchemyBackend):
         if temp_directory is not None:
             config["temp_directory"] = str(temp_directory)
 
-        super().do_connect(
-            sa.create_engine(
-                f"duckdb:///{database}",
-                connect_args=dict(read_only=read_only, config=config),
-                poolclass=sa.pool.SingletonThreadPool if in_memory else None,
-            )
+        engine = sa.create_engine(
+            f"duckdb:///{database}",
+            connect_args=dict(read_only=read_only, config=config),
+            poolclass=sa.pool.SingletonThreadPool,
+            pool_size=pool_size,
         )
+        # python objects registered as tables are only visible to the
+        # connection they were registered with
+        self._registered_objects = {}
+        root = None
+
+        @sa.event.listens_for(engine, "do_connect")
+        def share_database(dialect, connection_record, cargs, cparams):
+            # the pooled connections are cursors of a connection that is
+            # never closed by the pool, so threads share the database instead
+            # of opening a new one, which would be empty for in-memory
+            # databases
+            nonlocal root
+            if root is None:
+                root = dialect.connect(*cargs, **cparams)
+            return type(root)(root.duplicate())
+
+        @sa.event.listens_for(engine, "engine_disposed")
+        def close_database(engine):
+            # the pooled cursors are closed by now, closing the connection
+            # they were created from releases the database
+            nonlocal root
+            if root is not None:
+                root.close()
+                root = None
+
+        @sa.event.listens_for(engine, "checkout")
+        def register_objects(dbapi_connection, connection_record, connection_proxy):
+            registered = connection_record.info.setdefault("ibis_registered", {})
+            for name in registered.keys() - self._registered_objects.keys():
+                # dropped since the connection was last used
+                dbapi_connection.unregister(name)
+                del registered[name]
+            for name, obj in self._registered_objects.items():
+                if registered.get(name) is not obj:
+                    dbapi_connection.register(name, obj)
+                    registered[name] = obj
+
+        super().do_connect(engine)
         self._meta = sa.MetaData(bind=self.con)
         self._extensions = set()
 
@@ -273,6 +379,7 @@ class Backend(BaseAlchemyBackend):
                 # by the time we execute against this so we register it
                 # explicitly.
                 cursor.cursor.c.register(table_name, dataset)
+            self._registered_objects[table_name] = dataset
         elif isinstance(source, (str, Path)):
             sql, table_name, extensions_required = _generate_view_code(
                 str(source), table_name=table_name, **kwargs
@@ -283,6 +390,7 @@ class Backend(BaseAlchemyBackend):
             if table_name is None:
                 table_name = next(_gen_table_names)
             self.con.execute("register", (table_name, source))
+            self._registered_objects[table_name] = source
 
         _table = self.table(table_name)
         with warnings.catch_warnings():
@@ -301,6 +409,25 @@ class Backend(BaseAlchemyBackend):
             self.inspector.reflect_table(_table.op().sqla_table, _table.columns)
         return self.table(table_name)
 
+    def drop_table(
+        self,
+        table_name: str,
+        database: str | None = None,
+        force: bool = False,
+    ) -> None:
+        if table_name not in self._registered_objects:
+            return super().drop_table(table_name, database=database, force=force)
+
+        # registered objects are views local to each connection, checking
+        # out a connection unregisters the objects it no longer needs
+        del self._registered_objects[table_name]
+        with self.begin():
+            pass
+        self.invalidate_metadata(table_name)
+        if (table := self.meta.tables.get(table_name)) is not None:
+            self.meta.remove(table)
+        self._schemas.pop(table_name, None)
+
     def to_pyarrow_batches(
         self,
         expr: ir.Expr,
@@ -310,8 +437,7 @@ class Backend(BaseAlchemyBackend):
         chunk_size: int = 1_000_000,
     ) -> IbisRecordBatchReader:
         _ = self._import_pyarrow()
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        _, sql = self._to_compiled_query(expr, limit, params=params)
 
         cursor = self.raw_sql(sql)
 
@@ -323,7 +449,7 @@ class Backend(BaseAlchemyBackend):
         # TODO: duckdb seems to not care about the `chunk_size` argument
         # and returns batches in 1024 row chunks
 
-    def to_pyarrow(
+    def _to_pyarrow_uncached(
         self,
         expr: ir.Expr,
         *,
@@ -331,8 +457,7 @@ class Backend(BaseAlchemyBackend):
         limit: int | str | None = None,
     ) -> pa.Table:
         _ = self._import_pyarrow()
-        query_ast = self.compiler.to_ast_ensure_limit(expr, limit, params=params)
-        sql = query_ast.compile()
+        _, sql = self._to_compiled_query(expr, limit, params=params)
 
         cursor = self.raw_sql(sql)
         table = cursor.cursor.fetch_arrow_table()
@@ -351,6 +476,22 @@ class Backend(BaseAlchemyBackend):
         else:
             raise ValueError
 
+    def _table_versions(self, tables):
+        database = self.con.url.database
+        if not database or database == ":memory:":
+            return None
+        # views and registered objects can read files and python objects
+        # whose changes don't show in the database file
+        names = {(table.sqla_table.schema or "main", table.name) for table in tables}
+        with self.begin() as con:
+            stored = con.execute(
+                "SELECT schema_name, table_name FROM duckdb_tables() "
+                "WHERE NOT temporary"
+            ).fetchall()
+        if not names.issubset(map(tuple, stored)):
+            return None
+        return _file_version(database)
+
     def fetch_from_cursor(
         self,
         cursor: duckdb.DuckDBPyConnection,
@@ -360,16 +501,25 @@ class Backend(BaseAlchemyBackend):
 
         table = cursor.cursor.fetch_arrow_table()
 
+        if ibis.options.duckdb.arrow_dtypes:
+            if not hasattr(pd, "ArrowDtype"):
+                raise com.IbisError(
+                    "`ibis.options.duckdb.arrow_dtypes` requires pandas 1.5 or later"
+                )
+            columns = list(map(_cast_column, table.columns, schema.types))
+            table = pa.Table.from_arrays(columns, names=schema.names)
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+
         df = pd.DataFrame(
             {
-                name: (
-                    col.to_pylist()
-                    if pat.is_nested(col.type)
-                    else col.to_pandas(timestamp_as_object=True)
-                )
+                name: _column_to_pandas(col)
                 for name, col in zip(table.column_names, table.columns)
             }
         )
+        if _matches_schema(df, schema):
+            # nothing to convert, avoid reassigning every column
+            df.columns = schema.names
+            return df
         return schema.apply_to(df)
 
     def _metadata(self, query: str) -> Iterator[tuple[str, dt.DataType]]:
@@ -384,9 +534,57 @@ class Backend(BaseAlchemyBackend):
         """Return an ibis Schema from a DuckDB SQL string."""
         return sch.Schema.from_tuples(self._metadata(query))
 
+    def _get_table_schemas(self, schema: str | None = None) -> dict[str, sch.Schema]:
+        query = sa.text(
+            "SELECT table_name, column_name, data_type, is_nullable "
+            "FROM information_schema.columns "
+            "WHERE table_schema = coalesce(:schema, current_schema()) "
+            "ORDER BY table_name, ordinal_position"
+        )
+        with self.begin() as con:
+            rows = con.execute(query, schema=schema).fetchall()
+        return {
+            name: sch.Schema.from_tuples(
+                (column, parse(type)(nullable=nullable == "YES"))
+                for _, column, type, nullable in columns
+            )
+            for name, columns in itertools.groupby(rows, key=operator.itemgetter(0))
+        }
+
     def _register_in_memory_table(self, table_op):
-        df = table_op.data.to_frame()
-        self.con.execute("register", (table_op.name, df))
+        data = table_op.data
+        with self.con.connect() as con:
+            # registrations are local to the connection, remember what each
+            # connection has already seen
+            raw = con.connection
+            registered = raw.info.setdefault("ibis_memtables", {})
+            if registered.get(table_op.name) != data.fingerprint:
+                # duckdb scans both pandas and arrow data in place
+                obj = (
+                    data.to_pyarrow()
+                    if isinstance(table_op, PyArrowInMemoryTable)
+                    else data.to_frame()
+                )
+                raw.register(table_op.name, obj)
+                registered[table_op.name] = data.fingerprint
+
+    def _insert_record_batches(
+        self, bind, table: sa.Table, reader: pa.RecordBatchReader
+    ) -> None:
+        # duckdb scans the registered reader batch by batch, so the whole
+        # input is inserted with a single statement without materializing it
+        name = f"_ibis_insert_{util.guid()}"
+        columns = ", ".join(map(_quote, reader.schema.names))
+        target = bind.dialect.identifier_preparer.format_table(table)
+
+        raw = bind.connection
+        raw.register(name, reader)
+        try:
+            bind.execute(
+                f"INSERT INTO {target} ({columns}) SELECT {columns} FROM {_quote(name)}"
+            )
+        finally:
+            raw.unregister(name)
 
     def _get_sqla_table(
         self,
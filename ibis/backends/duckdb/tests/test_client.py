@@ -0,0 +1,456 @@
+import asyncio
+import gc
+import subprocess
+import sys
+import threading
+import weakref
+
+import pandas as pd
+import pandas.testing as tm
+import pyarrow as pa
+import pytest
+
+import ibis
+import ibis.common.exceptions as com
+import ibis.expr.datatypes as dt
+
+
+@pytest.fixture
+def con():
+    return ibis.duckdb.connect()
+
+
+@pytest.fixture
+def compile_cache():
+    with ibis.config.option_context("sql.compile_cache.maxsize", 8):
+        yield
+
+
+def test_compile_cache(con, compile_cache):
+    t = ibis.table(dict(a="int64", b="string"), name="t")
+
+    def make_expr():
+        return t.group_by("b").aggregate(total=t.a.sum())
+
+    first = con.compile(make_expr())
+    second = con.compile(make_expr())
+    assert first is second
+
+    info = con.compile_cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.currsize == 1
+
+    con.compile(make_expr(), limit=10)
+    assert con.compile_cache_info().currsize == 2
+
+    con.clear_compile_cache()
+    assert con.compile_cache_info().currsize == 0
+
+
+def test_compile_cache_disabled(con):
+    t = ibis.table(dict(a="int64"), name="t")
+    assert con.compile(t) is not con.compile(t)
+    assert con.compile_cache_info().currsize == 0
+
+
+def test_compile_cache_execute(con, compile_cache):
+    t = ibis.memtable({"a": [1, 2, 3]})
+    expr = t.a.sum()
+
+    assert con.execute(expr) == 6
+    assert con.execute(expr) == 6
+    assert con.compile_cache_info().hits == 1
+
+
+def test_compile_cache_on_disk(tmp_path, mocker):
+    path = str(tmp_path / "queries.db")
+    code = f"""
+import ibis
+t = ibis.table(dict(a="int64", b="string"), name="t")
+options = {{"sql.compile_cache.maxsize": 8, "sql.compile_cache.path": {path!r}}}
+with ibis.config.options(options):
+    print(ibis.duckdb.connect().compile(t.filter(t.a > 1)))
+"""
+    # another process compiles the query and spills it to the store
+    sql = subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, text=True
+    ).stdout
+
+    t = ibis.table(dict(a="int64", b="string"), name="t")
+    options = {"sql.compile_cache.maxsize": 8, "sql.compile_cache.path": path}
+    with ibis.config.options(options):
+        con = ibis.duckdb.connect()
+        to_ast = mocker.spy(con.compiler, "to_ast_ensure_limit")
+        assert f"{con.compile(t.filter(t.a > 1))}\n" == sql
+        assert to_ast.call_count == 0
+        assert con.compile_cache_info().currsize == 1
+
+
+def _temp_tables(con):
+    query = "SELECT table_name FROM duckdb_tables() WHERE temporary"
+    return [name for (name,) in con.raw_sql(query).fetchall()]
+
+
+def test_cache(con, mocker):
+    con.register(pd.DataFrame({"a": [1, 2, 3], "b": list("xyz")}), "t")
+    t = con.table("t")
+    expr = t[t.a > 1]
+
+    with expr.cache() as cached:
+        name = cached.op().name
+        assert name in _temp_tables(con)
+        tm.assert_frame_equal(cached.execute(), expr.execute())
+
+        spy = mocker.spy(con, "_substitute_cached")
+        assert con.execute(expr.a.sum()) == 5
+        assert name in str(con.compile(spy.spy_return))
+
+    assert name not in _temp_tables(con)
+
+
+def test_load_data(con, monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+
+    monkeypatch.setattr(con, "bulk_insert_chunk_size", 2)
+    df = pd.DataFrame({"a": [1, 2, 3, 4, 5], "b": ["x", None, "z", "", "w"]})
+
+    con.load_data("t", df)
+    tm.assert_frame_equal(con.table("t").execute(), df)
+
+    with pytest.raises(ValueError, match="already exists"):
+        con.load_data("t", df)
+
+    batches = pa.Table.from_pandas(df).to_batches(max_chunksize=3)
+    con.load_data("t", iter(batches), if_exists="append")
+    assert con.table("t").count().execute() == 10
+
+    con.load_data("t", df.head(2), if_exists="replace")
+    tm.assert_frame_equal(con.table("t").execute(), df.head(2))
+
+
+def test_insert_arrow(con):
+    pa = pytest.importorskip("pyarrow")
+
+    df = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+    con.load_data("t", df)
+
+    con.insert("t", pa.Table.from_pandas(df))
+    assert con.table("t").count().execute() == 6
+
+    con.insert("t", df.tail(1), overwrite=True)
+    tm.assert_frame_equal(con.table("t").execute(), df.tail(1).reset_index(drop=True))
+
+
+def test_fetch_native_timestamps(con):
+    expr = con.sql(
+        "SELECT TIMESTAMP '2020-01-01 01:02:03' AS ts, "
+        "TIMESTAMP '3000-01-01 00:00:00' AS far, 1::BIGINT AS a"
+    )
+    result = expr.execute()
+
+    assert result.ts.dtype.kind == "M"
+    assert result.a.dtype == "int64"
+    # out of bounds of nanosecond resolution, falls back to python objects
+    assert result.far.dtype == object
+
+
+@pytest.mark.skipif(
+    not hasattr(pd, "ArrowDtype"), reason="pandas.ArrowDtype requires pandas>=1.5"
+)
+def test_fetch_arrow_dtypes(con):
+    expr = con.sql("SELECT 1::BIGINT AS a, [1, 2] AS arr, 'x' AS s")
+    with ibis.config.option_context("duckdb.arrow_dtypes", True):
+        result = expr.execute()
+        assert expr.a.sum().execute() == 1
+
+    assert isinstance(result.a.dtype, pd.ArrowDtype)
+    assert isinstance(result.arr.dtype, pd.ArrowDtype)
+    assert result.columns.tolist() == ["a", "arr", "s"]
+    assert result.arr.tolist() == [[1, 2]]
+
+
+@pytest.mark.skipif(hasattr(pd, "ArrowDtype"), reason="pandas.ArrowDtype exists")
+def test_fetch_arrow_dtypes_unavailable(con):
+    expr = con.sql("SELECT 1::BIGINT AS a")
+    with ibis.config.option_context("duckdb.arrow_dtypes", True):
+        with pytest.raises(com.IbisError, match="pandas 1.5"):
+            expr.execute()
+
+
+@pytest.fixture
+def result_cache(tmp_path):
+    options = {
+        "sql.result_cache.enabled": True,
+        "sql.result_cache.path": str(tmp_path / "results"),
+    }
+    with ibis.config.options(options):
+        yield
+
+
+@pytest.fixture
+def file_con(tmp_path):
+    con = ibis.duckdb.connect(tmp_path / "test.ddb")
+    con.raw_sql("CREATE TABLE t AS SELECT * FROM range(10) _(a)")
+    return con
+
+
+def test_result_cache(file_con, result_cache):
+    t = file_con.table("t")
+    expr = t.filter(t.a > 4)
+
+    first = file_con.execute(expr)
+    second = file_con.execute(expr)
+    tm.assert_frame_equal(first, second)
+
+    info = file_con.result_cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+    assert file_con.execute(t.a.sum()) == 45
+    assert file_con.execute(t.a.sum()) == 45
+    tm.assert_series_equal(file_con.execute(t.a), file_con.execute(t.a))
+    assert file_con.result_cache_info().hits == 3
+
+
+def test_result_cache_invalidation(file_con, result_cache):
+    t = file_con.table("t")
+    expr = t.a.sum()
+
+    assert file_con.execute(expr) == 45
+    file_con.raw_sql("INSERT INTO t VALUES (100)")
+    assert file_con.execute(expr) == 145
+    assert file_con.result_cache_info().hits == 0
+
+
+def test_result_cache_bypass(file_con, result_cache):
+    t = file_con.table("t")
+    file_con.execute(t, cache=False)
+    file_con.execute(t, cache=False)
+    assert file_con.result_cache_info() == (0, 0, 1 << 30, 0)
+
+
+def test_result_cache_to_pyarrow(file_con, result_cache):
+    t = file_con.table("t")
+    expr = t.filter(t.a < 3)
+
+    assert file_con.to_pyarrow(expr).equals(file_con.to_pyarrow(expr))
+    assert file_con.to_pyarrow(expr.a).equals(file_con.to_pyarrow(expr.a))
+    assert file_con.to_pyarrow(expr.a.sum()).as_py() == 3
+    assert file_con.to_pyarrow(expr.a.sum()).as_py() == 3
+    assert file_con.result_cache_info().hits == 3
+
+
+def test_result_cache_registered_files(file_con, result_cache, tmp_path):
+    # registered files are views whose data doesn't live in the database file
+    path = tmp_path / "data.parquet"
+    pd.DataFrame({"a": range(6)}).to_parquet(path)
+    t = file_con.register(path, table_name="data")
+    assert file_con.execute(t.count()) == 6
+
+    pd.DataFrame({"a": range(60)}).to_parquet(path)
+    assert file_con.execute(t.count()) == 60
+    assert file_con.result_cache_info().currsize == 0
+
+
+def test_result_cache_info_disabled(con, tmp_path):
+    path = tmp_path / "results"
+    with ibis.config.option_context("sql.result_cache.path", str(path)):
+        assert con.result_cache_info().currsize == 0
+    assert not path.exists()
+
+
+def test_result_cache_unversioned(con, result_cache):
+    # neither in-memory databases nor in-memory tables can tell when their
+    # data changes
+    con.raw_sql("CREATE TABLE t AS SELECT * FROM range(10) _(a)")
+    t = con.table("t")
+    con.execute(t)
+    con.execute(ibis.memtable({"a": [1, 2]}))
+    assert con.result_cache_info().currsize == 0
+
+
+@pytest.fixture
+def statements(con):
+    import sqlalchemy as sa
+
+    executed = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        executed.append(statement)
+
+    sa.event.listen(con.con, "before_cursor_execute", before_cursor_execute)
+    yield executed
+    sa.event.remove(con.con, "before_cursor_execute", before_cursor_execute)
+
+
+def test_metadata_cache(con, statements):
+    con.raw_sql("CREATE TABLE t (a INTEGER)")
+
+    con.table("t")
+    assert statements
+    statements.clear()
+
+    assert con.table("t").schema() == ibis.schema(dict(a="int32"))
+    assert not statements
+    assert con.metadata_cache_info()[:2] == (1, 1)
+
+
+def test_metadata_cache_invalidation(con):
+    con.raw_sql("CREATE TABLE t (a INTEGER)")
+    con.table("t")
+
+    con.raw_sql("ALTER TABLE t ADD COLUMN b VARCHAR")
+    assert con.table("t").columns == ["a"]
+
+    con.invalidate_metadata("t")
+    assert con.table("t").columns == ["a", "b"]
+
+
+def test_metadata_cache_ttl(mocker):
+    monotonic = mocker.patch("time.monotonic", return_value=0.0)
+
+    con = ibis.duckdb.connect()
+    con.raw_sql("CREATE TABLE t (a INTEGER)")
+
+    with ibis.config.option_context("sql.metadata_cache.ttl", 10.0):
+        con.table("t")
+
+        con.raw_sql("ALTER TABLE t ADD COLUMN b VARCHAR")
+        assert con.table("t").columns == ["a"]
+
+        monotonic.return_value = 11.0
+        assert con.table("t").columns == ["a", "b"]
+
+    # changing the ttl drops the cached definitions
+    con.raw_sql("ALTER TABLE t ADD COLUMN c VARCHAR")
+    assert con.table("t").columns == ["a", "b", "c"]
+
+
+def test_metadata_cache_database(con, mocker):
+    con.raw_sql("CREATE TABLE t (a INTEGER)")
+    spy = mocker.spy(con, "_get_sqla_table")
+
+    con._cached_sqla_table("t", database="main")
+    con._cached_sqla_table("t", database=None)
+    con._cached_sqla_table("t", database=None)
+    assert spy.call_count == 2
+
+
+def test_prefetch_metadata(con, statements):
+    con.raw_sql("CREATE TABLE t (a INTEGER NOT NULL, b DECIMAL(10, 2))")
+    con.raw_sql("CREATE VIEW v AS SELECT a FROM t")
+    statements.clear()
+
+    assert con.prefetch_metadata() == ["t", "v"]
+    assert len(statements) == 1
+    statements.clear()
+
+    t = con.table("t")
+    assert t.schema() == ibis.schema(
+        dict(a=dt.Int32(nullable=False), b=dt.Decimal(10, 2))
+    )
+    assert con.table("v").columns == ["a"]
+    assert not statements
+
+    assert t.count().execute() == 0
+
+
+def test_drop_registered_table(con):
+    df = pd.DataFrame({"a": [1, 2]})
+    ref = weakref.ref(df)
+    t = con.register(df, table_name="df")
+    assert con.execute(t.a.sum()) == 3
+
+    con.drop_table("df")
+    assert "df" not in con.list_tables()
+
+    del df, t
+    gc.collect()
+    assert ref() is None
+
+
+def test_dispose_releases_database(file_con, tmp_path):
+    assert file_con.table("t").count().execute() == 10
+    file_con.con.dispose()
+
+    # another process can only open the file once it's released
+    code = f"import duckdb; duckdb.connect({str(tmp_path / 'test.ddb')!r})"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_execute_many(con):
+    con.raw_sql("CREATE TABLE t AS SELECT range AS x FROM range(10)")
+    df = con.register(pd.DataFrame({"y": [1, 2, 3]}), table_name="df")
+    mem = ibis.memtable({"z": [4, 5]})
+    t = con.table("t")
+
+    threads = set()
+    execute = con.execute
+
+    def record_thread(*args, **kwargs):
+        threads.add(threading.get_ident())
+        return execute(*args, **kwargs)
+
+    con.execute = record_thread
+
+    exprs = [t.x.sum(), df.y.max(), mem.z.min(), t.count()] * 3
+    assert con.execute_many(exprs) == [45, 3, 4, 10] * 3
+    # the expressions are executed by the worker threads, sharing the
+    # in-memory database and the registered objects of the calling thread
+    assert threading.get_ident() not in threads
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_execute_many_max_workers(con, max_workers):
+    t = ibis.memtable({"x": [1, 2, 3]})
+    result = con.execute_many([t.x.sum(), t, t.x.max()], max_workers=max_workers)
+    assert result[0] == 6
+    tm.assert_frame_equal(result[1], pd.DataFrame({"x": [1, 2, 3]}))
+    assert result[2] == 3
+
+
+def test_execute_many_pool_size():
+    con = ibis.duckdb.connect(pool_size=3)
+    assert con._max_concurrency() == 2
+
+    t = ibis.memtable({"x": range(5)})
+    assert con.execute_many([t.x.sum() + i for i in range(10)]) == list(range(10, 20))
+
+
+def test_execute_async(con):
+    con.raw_sql("CREATE TABLE t AS SELECT range AS x FROM range(10)")
+    t = con.table("t")
+
+    async def run():
+        return await asyncio.gather(
+            con.execute_async(t.x.sum()), con.execute_async(t, limit=2)
+        )
+
+    total, head = asyncio.run(run())
+    assert total == 45
+    assert len(head) == 2
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        pytest.param(pd.DataFrame({"x": [1, 2, 3]}), id="pandas"),
+        pytest.param(pa.table({"x": [1, 2, 3]}), id="pyarrow"),
+    ],
+)
+def test_memtable_registered_once(con, mocker, data):
+    raw = con.con.raw_connection()
+    dbapi = raw.connection
+    raw.close()
+    register = mocker.patch.object(dbapi, "register", wraps=dbapi.register)
+
+    t = ibis.memtable(data)
+    assert con.execute(t.x.sum()) == 6
+    assert con.execute(t.x.max()) == 3
+    assert register.call_count == 1
+
+    # the same contents under another name are a different table
+    other = ibis.memtable(data)
+    assert con.execute(other.x.sum()) == 6
+    assert register.call_count == 2
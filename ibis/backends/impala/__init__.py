@@ -77,6 +77,10 @@ def _split_signature(x):
 
 _arg_type = re.compile(r'(.*)\.\.\.|([^\.]*)')
 
+_READ_ONLY_STATEMENT = re.compile(
+    r"^\s*(?:select|with|values|show|describe|explain)\b", re.IGNORECASE
+)
+
 
 class _type_parser:
 
@@ -266,6 +270,9 @@ class Backend(BaseSQLBackend):
         """
         self._temp_objects = set()
         self._hdfs = hdfs_client
+        # versions the data of tables for the result cache
+        self._session = util.guid()
+        self._data_epoch = 0
 
         params = {
             'host': host,
@@ -1245,6 +1252,18 @@ class Backend(BaseSQLBackend):
         stmt = self._table_command('REFRESH', name, database=database)
         self.raw_sql(stmt)
 
+    def raw_sql(self, query):
+        if not _READ_ONLY_STATEMENT.match(str(query)):
+            # statements issued through ibis, including `REFRESH` and
+            # `INVALIDATE METADATA`, may change what queries return
+            self._data_epoch += 1
+        return super().raw_sql(query)
+
+    def _table_versions(self, tables):
+        # Impala only sees data written by other clients after its metadata
+        # has been reloaded, so results are reused until then
+        return self._session, self._data_epoch
+
     def describe_formatted(
         self,
         name: str,
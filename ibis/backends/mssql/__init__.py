@@ -23,6 +23,7 @@ class Backend(BaseAlchemyBackend):
         database: str | None = None,
         url: str | None = None,
         driver: Literal["pymssql"] = "pymssql",
+        pool_size: int = 5,
     ) -> None:
         if driver != "pymssql":
             raise NotImplementedError("pymssql is currently the only supported driver")
@@ -36,4 +37,4 @@ class Backend(BaseAlchemyBackend):
             driver=f'mssql+{driver}',
         )
         self.database_name = alchemy_url.database
-        super().do_connect(sa.create_engine(alchemy_url))
+        super().do_connect(sa.create_engine(alchemy_url, pool_size=pool_size))
@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import atexit
 import contextlib
+import datetime
+import os
+import tempfile
 import warnings
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import sqlalchemy as sa
 import sqlalchemy.dialects.mysql as mysql
@@ -16,6 +19,44 @@ from ibis.backends.base.sql.alchemy import BaseAlchemyBackend
 from ibis.backends.mysql.compiler import MySQLCompiler
 from ibis.backends.mysql.datatypes import _type_from_cursor_info
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# escape sequences of the default `LOAD DATA` text format
+_LOAD_DATA_ESCAPES = str.maketrans(
+    {"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r", "\0": "\\0"}
+)
+
+
+def _is_text_encodable(typ: pa.DataType) -> bool:
+    import pyarrow.types as pat
+
+    return (
+        pat.is_integer(typ)
+        or pat.is_floating(typ)
+        or pat.is_boolean(typ)
+        or pat.is_string(typ)
+        or pat.is_large_string(typ)
+        or pat.is_decimal(typ)
+        or pat.is_date(typ)
+        or pat.is_timestamp(typ)
+    )
+
+
+def _to_load_data_field(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    elif isinstance(value, bool):
+        return str(int(value))
+    elif isinstance(value, str):
+        return value.translate(_LOAD_DATA_ESCAPES)
+    elif isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        # the session time zone is set to UTC by `begin`
+        utc = value.astimezone(datetime.timezone.utc)
+        return str(utc.replace(tzinfo=None))
+    else:
+        return str(value)
+
 
 class Backend(BaseAlchemyBackend):
     name = 'mysql'
@@ -30,6 +71,7 @@ class Backend(BaseAlchemyBackend):
         database: str | None = None,
         url: str | None = None,
         driver: Literal["pymysql"] = "pymysql",
+        pool_size: int = 5,
     ) -> None:
         """Create an Ibis client using the passed connection parameters.
 
@@ -50,6 +92,9 @@ class Backend(BaseAlchemyBackend):
             connection arguments are ignored.
         driver
             Python MySQL database driver
+        pool_size
+            Number of connections kept open for concurrent execution with
+            `execute_many` and `execute_async`
 
         Examples
         --------
@@ -102,7 +147,7 @@ class Backend(BaseAlchemyBackend):
         )
 
         self.database_name = alchemy_url.database
-        super().do_connect(sa.create_engine(alchemy_url))
+        super().do_connect(sa.create_engine(alchemy_url, pool_size=pool_size))
 
     @contextlib.contextmanager
     def begin(self):
@@ -119,6 +164,37 @@ class Backend(BaseAlchemyBackend):
                 query = "SET @@session.time_zone = '{}'"
                 bind.execute(query.format(previous_timezone))
 
+    def _insert_record_batches(
+        self, bind, table: sa.Table, reader: pa.RecordBatchReader
+    ) -> None:
+        from pymysql.constants import CLIENT
+
+        # LOAD DATA LOCAL has to be enabled explicitly by the user, e.g. by
+        # passing `local_infile=1` in the connection url
+        local_infile = bind.connection.client_flag & CLIENT.LOCAL_FILES
+        if not local_infile or not all(map(_is_text_encodable, reader.schema.types)):
+            return super()._insert_record_batches(bind, table, reader)
+
+        preparer = bind.dialect.identifier_preparer
+        columns = ", ".join(map(preparer.quote, reader.schema.names))
+        query = (
+            f"LOAD DATA LOCAL INFILE %s INTO TABLE {preparer.format_table(table)} "
+            f"CHARACTER SET utf8mb4 ({columns})"
+        )
+
+        for batch in reader:
+            rows = zip(*(column.to_pylist() for column in batch.columns))
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", newline="\n", suffix=".tsv", delete=False
+            ) as file:
+                for row in rows:
+                    file.write("\t".join(map(_to_load_data_field, row)))
+                    file.write("\n")
+            try:
+                bind.exec_driver_sql(query, (file.name,))
+            finally:
+                os.remove(file.name)
+
     def _get_schema_using_query(self, query: str) -> sch.Schema:
         """Infer the schema of `query`."""
         result = self.con.execute(f"SELECT * FROM ({query}) _ LIMIT 0")
@@ -1,27 +1,109 @@
 from __future__ import annotations
 
 import importlib
+import operator
+import os
 from functools import lru_cache
-from typing import TYPE_CHECKING, Any, Mapping, MutableMapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Mapping, MutableMapping, Sequence
 
 import pandas as pd
 
 import ibis.common.exceptions as com
+import ibis.common.graph as g
 import ibis.config
+import ibis.expr.analysis as an
 import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis.backends.base import BaseBackend
 from ibis.backends.pandas.client import (
     PandasDatabase,
+    PandasFileScan,
     PandasTable,
     ibis_schema_to_pandas,
 )
+from ibis.expr.timecontext import get_time_col
 
 if TYPE_CHECKING:
     import pyarrow as pa
 
 
+_SCAN_FILTER_OPS = {
+    ops.Equals: ("==", "=="),
+    ops.Less: ("<", ">"),
+    ops.LessEqual: ("<=", ">="),
+    ops.Greater: (">", "<"),
+    ops.GreaterEqual: (">=", "<="),
+}
+
+_SCAN_FILTER_COMPARISONS = {
+    "==": operator.eq,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def _scan_filter_value(op: ops.Node) -> Any:
+    if isinstance(op, ops.Literal) and isinstance(op.value, (bool, int, float, str)):
+        return op.value
+    return None
+
+
+def _scan_filter_column(op: ops.Node, table: ops.TableNode) -> str | None:
+    if not (isinstance(op, ops.TableColumn) and op.table == table):
+        return None
+
+    dtype = op.output_dtype
+    if dtype.is_boolean() or dtype.is_string():
+        return op.name
+    elif dtype.is_numeric() and not dtype.is_decimal():
+        return op.name
+    return None
+
+
+def _scan_filter(pred: ops.Value, table: ops.TableNode) -> tuple | None:
+    """Convert `pred` into a `(column, op, value)` filter on `table`.
+
+    Only predicates that evaluate to false for missing values, just like in
+    pandas, are converted.
+    """
+    if (ops_ := _SCAN_FILTER_OPS.get(type(pred))) is not None:
+        op, flipped = ops_
+        if (name := _scan_filter_column(pred.left, table)) is not None:
+            value = _scan_filter_value(pred.right)
+        elif (name := _scan_filter_column(pred.right, table)) is not None:
+            value = _scan_filter_value(pred.left)
+            op = flipped
+        else:
+            return None
+        return None if value is None else (name, op, value)
+    elif isinstance(pred, ops.Contains) and isinstance(pred.options, tuple):
+        name = _scan_filter_column(pred.value, table)
+        values = tuple(map(_scan_filter_value, pred.options))
+        if name is None or None in values:
+            return None
+        return name, "in", values
+    return None
+
+
+def _scan_filter_expression(filters: Sequence[tuple]) -> Any:
+    """Combine `(column, op, value)` filters into a pyarrow dataset expression."""
+    import pyarrow.dataset as ds
+
+    expression = None
+    for name, op, value in filters:
+        field = ds.field(name)
+        if op == "in":
+            term = field.isin(list(value))
+        else:
+            term = _SCAN_FILTER_COMPARISONS[op](field, value)
+        expression = term if expression is None else expression & term
+    return expression
+
+
 class BasePandasBackend(BaseBackend):
     """Base class for backends based on pandas."""
 
@@ -31,6 +113,11 @@ class BasePandasBackend(BaseBackend):
     class Options(ibis.config.Config):
         enable_trace: bool = False
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # tables registered from files, scanned when an expression is executed
+        self._file_sources: dict[str, Any] = {}
+
     def do_connect(
         self,
         dictionary: MutableMapping[str, pd.DataFrame],
@@ -54,6 +141,7 @@ class BasePandasBackend(BaseBackend):
 
         self.dictionary = dictionary
         self.schemas: MutableMapping[str, sch.Schema] = {}
+        self._file_sources = {}
 
     def from_dataframe(
         self,
@@ -95,13 +183,101 @@ class BasePandasBackend(BaseBackend):
         raise NotImplementedError('pandas backend does not support databases')
 
     def list_tables(self, like=None, database=None):
-        return self._filter_with_like(list(self.dictionary.keys()), like)
+        names = [*self.dictionary.keys(), *self._file_sources.keys()]
+        return self._filter_with_like(names, like)
 
     def table(self, name: str, schema: sch.Schema = None):
-        df = self.dictionary[name]
-        schema = sch.infer(df, schema=schema or self.schemas.get(name, None))
+        if name in self._file_sources:
+            schema = self.schemas[name]
+        else:
+            df = self.dictionary[name]
+            schema = sch.infer(df, schema=schema or self.schemas.get(name, None))
         return self.table_class(name, schema, self).to_expr()
 
+    def register(
+        self,
+        source: str | Path,
+        table_name: str | None = None,
+        **kwargs: Any,
+    ) -> ir.Table:
+        """Register a parquet file or a directory of parquet files as a table.
+
+        The files are read when an expression using the table is executed.
+        Only the columns the expression references are decoded, and simple
+        filters applied directly to the table are used to skip data that
+        can't match them.
+
+        Parameters
+        ----------
+        source
+            Path to a parquet file or to a directory of parquet files, which
+            may be hive-partitioned.
+        table_name
+            Name of the table. Defaults to the name of the file or directory.
+        kwargs
+            Keyword arguments passed to the function opening the files
+
+        Returns
+        -------
+        ir.Table
+            The just-registered table
+        """
+        path = Path(source).absolute()
+        if table_name is None:
+            base, *_ = path.name.partition(os.extsep)
+            table_name = base.replace("-", "_")
+
+        self._file_sources[table_name], self.schemas[table_name] = self._open_files(
+            path, **kwargs
+        )
+        return self.table(table_name)
+
+    def _open_files(self, path: Path, **kwargs: Any) -> tuple[Any, sch.Schema]:
+        """Open the parquet files at `path` and return them with their schema."""
+        raise NotImplementedError(
+            f"{self.name} backend does not support registering files"
+        )
+
+    def _scan_files(
+        self, name: str, columns: Sequence[str], filters: Sequence[tuple]
+    ) -> Any:
+        """Read `columns` of the table `name`, skipping data failing `filters`."""
+        raise NotImplementedError(
+            f"{self.name} backend does not support registering files"
+        )
+
+    def _push_down_scans(self, node: ops.Node) -> ops.Node:
+        """Replace the tables registered from files with scans of what `node` needs."""
+        if not self._file_sources:
+            return node
+
+        subs = {}
+        for table in g.Graph.from_bfs(node).nodes():
+            if (
+                not isinstance(table, self.table_class)
+                or table.source is not self
+                or table.name not in self._file_sources
+            ):
+                continue
+
+            columns, predicates = an.find_scan_pushdowns(node, table)
+            schema = table.schema
+            if columns is not None:
+                # the time column is needed to apply time contexts, and at
+                # least one column is read to know the number of rows
+                needed = {*columns, get_time_col()}
+                names = [name for name in schema.names if name in needed]
+                schema = sch.schema(
+                    (name, schema[name]) for name in names or schema.names[:1]
+                )
+
+            filters = tuple(
+                filter(None, (_scan_filter(pred, table) for pred in predicates))
+            )
+            subs[table] = self.file_scan_class(table.name, schema, self, filters)
+
+        return node.replace(subs) if subs else node
+
     def database(self, name=None):
         return self.database_class(name, self)
 
@@ -142,6 +318,14 @@ class BasePandasBackend(BaseBackend):
         if schema is not None:
             self.schemas[table_name] = schema
 
+    def _load_into_cache(self, name, expr):
+        self.dictionary[name] = self.execute(expr)
+        return self.table(name).op()
+
+    def _clean_up_cached_table(self, name):
+        del self.dictionary[name]
+        self.schemas.pop(name, None)
+
     @classmethod
     def _supports_conversion(cls, obj: Any) -> bool:
         return True
@@ -195,6 +379,30 @@ class Backend(BasePandasBackend):
     name = 'pandas'
     database_class = PandasDatabase
     table_class = PandasTable
+    file_scan_class = PandasFileScan
+
+    class Options(BasePandasBackend.Options):
+        """pandas options.
+
+        Attributes
+        ----------
+        enable_trace : bool
+            Log the call stack and timing of each executed operation.
+        max_workers : int
+            Number of threads used to execute independent subtrees of an
+            expression, such as the two sides of a join, concurrently. The
+            default of 1 executes everything in the calling thread.
+        arrow_strings : bool
+            Execute string operations on string columns with pyarrow compute
+            kernels when pyarrow is installed. Regular expressions are then
+            evaluated by RE2 unless they use features only python's engine
+            supports, or character classes and `$` on text that is not
+            printable ASCII; disable this option to always get python
+            semantics.
+        """
+
+        max_workers: int = 1
+        arrow_strings: bool = True
 
     def to_pyarrow(
         self,
@@ -212,6 +420,21 @@ class Backend(BasePandasBackend):
         else:
             return pa.scalar(output)
 
+    def _open_files(self, path, **kwargs):
+        import pyarrow.dataset as ds
+
+        from ibis.backends.pyarrow.datatypes import from_pyarrow_schema
+
+        kwargs.setdefault("partitioning", "hive")
+        dataset = ds.dataset(path, format="parquet", **kwargs)
+        return dataset, from_pyarrow_schema(dataset.schema)
+
+    def _scan_files(self, name, columns, filters):
+        table = self._file_sources[name].to_table(
+            columns=list(columns), filter=_scan_filter_expression(filters)
+        )
+        return table.to_pandas()
+
     def execute(self, query, params=None, limit='default', **kwargs):
         from ibis.backends.pandas.core import execute_and_reset
 
@@ -228,7 +451,7 @@ class Backend(BasePandasBackend):
                 )
             )
 
-        node = query.op()
+        node = self._push_down_scans(self._substitute_cached(query).op())
 
         if params is None:
             params = {}
@@ -475,6 +475,54 @@ def create_window_input_iter(
         yield data[lower_index:upper_index]
 
 
+def window_agg_udf_batched(
+    inputs: Tuple[Any, ...],
+    function: Callable,
+    lower_indices: np.ndarray,
+    upper_indices: np.ndarray,
+) -> np.ndarray:
+    """Apply a batched UDF to every window with one call per window size.
+
+    Windows of equal size are gathered from a strided view over each input
+    column, so that `function` receives 2-D arrays with one window per row
+    instead of being called once per window.
+    """
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    arrays = [
+        getattr(arg, 'obj', arg).values
+        if isinstance(arg, (pd.Series, SeriesGroupBy))
+        else None
+        for arg in inputs
+    ]
+    window_sizes = upper_indices - lower_indices
+
+    positions = []
+    results = []
+    for window_size in np.unique(window_sizes):
+        (batch,) = np.nonzero(window_sizes == window_size)
+        starts = lower_indices[batch]
+        # contiguous windows can be sliced out of the view without a copy
+        if len(starts) and starts[-1] - starts[0] + 1 == len(starts):
+            key = slice(starts[0], starts[-1] + 1)
+        else:
+            key = starts
+        batch_inputs = (
+            arg if array is None else sliding_window_view(array, window_size)[key]
+            for arg, array in zip(inputs, arrays)
+        )
+        positions.append(batch)
+        results.append(np.asarray(function(*batch_inputs)).reshape(len(batch)))
+
+    if not results:
+        return np.empty(0)
+
+    values = np.concatenate(results)
+    result = np.empty_like(values)
+    result[np.concatenate(positions)] = values
+    return result
+
+
 def window_agg_udf(
     grouped_data: SeriesGroupBy,
     function: Callable,
@@ -494,6 +542,9 @@ def window_agg_udf(
     using pandas's rolling function.
     This is because pandas's rolling function doesn't support
     multi param UDFs.
+
+    Batched UDFs are called once per distinct window size with all the
+    windows of that size, see `window_agg_udf_batched`.
     """
     assert len(window_lower_indices) == len(window_upper_indices)
     assert len(window_lower_indices) == len(mask)
@@ -518,21 +569,30 @@ def window_agg_udf(
     masked_window_lower_indices = window_lower_indices[mask].astype('i8')
     masked_window_upper_indices = window_upper_indices[mask].astype('i8')
 
-    input_iters = [
-        create_window_input_iter(
-            arg, masked_window_lower_indices, masked_window_upper_indices
+    if getattr(function, 'batched', False):
+        valid_result = pd.Series(
+            window_agg_udf_batched(
+                inputs,
+                function,
+                masked_window_lower_indices.values,
+                masked_window_upper_indices.values,
+            )
+        )
+    else:
+        input_iters = [
+            create_window_input_iter(
+                arg, masked_window_lower_indices, masked_window_upper_indices
+            )
+            if isinstance(arg, (pd.Series, SeriesGroupBy))
+            else itertools.repeat(arg)
+            for arg in inputs
+        ]
+
+        valid_result = pd.Series(
+            function(*(next(gen) for gen in input_iters))
+            for i in range(len(masked_window_lower_indices))
         )
-        if isinstance(arg, (pd.Series, SeriesGroupBy))
-        else itertools.repeat(arg)
-        for arg in inputs
-    ]
-
-    valid_result = pd.Series(
-        function(*(next(gen) for gen in input_iters))
-        for i in range(len(masked_window_lower_indices))
-    )
 
-    valid_result = pd.Series(valid_result)
     valid_result.index = masked_window_lower_indices.index
     result = pd.Series(index=mask.index, dtype=dtype)
     result[mask] = valid_result
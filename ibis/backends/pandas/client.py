@@ -1,5 +1,6 @@
 """The pandas client implementation."""
 
+import hashlib
 import json
 
 import numpy as np
@@ -168,7 +169,7 @@ def convert_json_to_series(in_, out, col: pd.Series):
 
 
 class DataFrameProxy(Immutable, util.ToFrame):
-    __slots__ = ('_df', '_hash')
+    __slots__ = ('_df', '_hash', '_fingerprint')
 
     def __init__(self, df):
         object.__setattr__(self, "_df", df)
@@ -184,6 +185,33 @@ class DataFrameProxy(Immutable, util.ToFrame):
     def to_frame(self):
         return self._df
 
+    def to_pyarrow(self):
+        import pyarrow as pa
+
+        return pa.Table.from_pandas(self._df, preserve_index=False)
+
+    @property
+    def fingerprint(self):
+        try:
+            return self._fingerprint
+        except AttributeError:
+            pass
+
+        df = self._df
+        digest = hashlib.sha256(
+            repr((list(df.columns), list(map(str, df.dtypes)))).encode()
+        )
+        try:
+            digest.update(pd.util.hash_pandas_object(df, index=False).values)
+        except TypeError:
+            # unhashable values like lists or dicts, the data is only
+            # considered equal to itself
+            digest.update(util.guid().encode())
+
+        fingerprint = digest.hexdigest()
+        object.__setattr__(self, "_fingerprint", fingerprint)
+        return fingerprint
+
 
 class PandasInMemoryTable(ops.InMemoryTable):
     data = rlz.instance_of(DataFrameProxy)
@@ -193,5 +221,15 @@ class PandasTable(ops.DatabaseTable):
     pass
 
 
+class PandasFileScan(PandasTable):
+    """Scan of a table registered from files.
+
+    Only the columns in `schema` are read, and data that can't satisfy the
+    conjunction of `filters` may be skipped.
+    """
+
+    filters = rlz.optional(rlz.tuple_of(rlz.instance_of(tuple)), default=())
+
+
 class PandasDatabase(Database):
     pass
@@ -27,12 +27,17 @@ expression against in-memory data.
 The general flow of execution is:
 
 ::
-       If the current operation is in scope:
-           return it
-       Else:
-           execute the arguments of the current node
+       For each operation, starting from the root:
+           If the current operation is in scope:
+               use it
+           Else:
+               plan the execution of the arguments of the current node
 
-       execute the current node with its executed arguments
+       For each planned operation, arguments first:
+           execute the current node with its executed arguments
+
+The second loop runs independent operations concurrently when
+``ibis.options.pandas.max_workers`` is greater than one.
 
 Specifically, execute is comprised of a series of steps that happen at
 different times during the loop.
@@ -105,9 +110,13 @@ See ibis.common.scope for details about the implementaion.
 
 from __future__ import annotations
 
+import collections
+import concurrent.futures
 import datetime
 import functools
 import numbers
+import threading
+import time
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -127,7 +136,7 @@ from ibis.backends.pandas.dispatch import (
     post_execute,
     pre_execute,
 )
-from ibis.backends.pandas.trace import trace
+from ibis.backends.pandas.trace import record_timing, trace
 from ibis.expr.scope import Scope
 from ibis.expr.timecontext import canonicalize_context
 
@@ -252,6 +261,18 @@ def execute_until_in_scope(
 ) -> Scope:
     """Execute until our op is in `scope`.
 
+    The operations needed to compute `node` are executed without recursion,
+    in two passes over the graph formed by each operation, its time context
+    and its computable arguments:
+
+    1. A top-down pass computes the time contexts of the arguments of each
+       operation and calls ``pre_execute``, stopping at operations that are
+       already in scope.
+    2. A bottom-up pass calls ``execute_node`` and ``post_execute`` on every
+       operation once its arguments are available. Results are kept in a
+       memo shared by the whole pass and dropped as soon as their last
+       consumer has run.
+
     Parameters
     ----------
     node : ibis.expr.operations.Node
@@ -260,6 +281,11 @@ def execute_until_in_scope(
     aggcontext : Optional[AggregationContext]
     clients : List[ibis.backends.base.BaseBackend]
     kwargs : Mapping
+
+    Returns
+    -------
+    Scope
+        A scope containing the result of `node`
     """
     # these should never be None
     assert aggcontext is not None, 'aggcontext is None'
@@ -270,109 +296,225 @@ def execute_until_in_scope(
     # return the corresponding value
     if scope.get_value(node, timecontext) is not None:
         return scope
-    if isinstance(node, ops.Literal):
-        # special case literals to avoid the overhead of dispatching
-        # execute_node
-        return Scope(
-            {
-                node: execute_literal(
-                    node,
-                    node.value,
-                    node.output_dtype,
-                    aggcontext=aggcontext,
-                    **kwargs,
-                )
-            },
-            timecontext,
-        )
 
-    # figure out what arguments we're able to compute on based on the
-    # expressions inputs. things like expressions, None, and scalar types are
-    # computable whereas ``list``s are not
-    computable_args = [
-        arg for arg in get_node_arguments(node) if is_computable_input(arg)
-    ]
-
-    # pre_executed_states is a list of states with same the length of
-    # computable_args, these states are passed to each arg
-    if timecontext:
-        arg_timecontexts = compute_time_context(
-            node,
-            num_args=len(computable_args),
-            timecontext=timecontext,
-            clients=clients,
+    # the results of pre_execute are accumulated into a private copy of the
+    # scope, so that it is only copied once per execution
+    scope = Scope().merge_scope(scope)
+    root = node, timecontext
+    # maps (op, timecontext) to the computed value of op
+    results = {}
+    # maps (op, timecontext) to (computable_args, arg_timecontexts, deps)
+    # for every op that needs to go through execute_node
+    plan = {}
+    # the keys of plan, in the order they can be executed
+    order = []
+
+    stack = [(root, False)]
+    while stack:
+        key, expanded = stack.pop()
+        if expanded:
+            order.append(key)
+            continue
+        if key in results or key in plan:
+            continue
+
+        op, op_timecontext = key
+        value = scope.get_value(op, op_timecontext)
+        if value is not None:
+            results[key] = value
+            continue
+        if isinstance(op, ops.Literal):
+            # special case literals to avoid the overhead of dispatching
+            # execute_node
+            results[key] = execute_literal(
+                op, op.value, op.output_dtype, aggcontext=aggcontext, **kwargs
+            )
+            continue
+
+        # figure out what arguments we're able to compute on based on the
+        # expressions inputs. things like expressions, None, and scalar types
+        # are computable whereas ``list``s are not
+        computable_args = [
+            arg for arg in get_node_arguments(op) if is_computable_input(arg)
+        ]
+
+        # arg_timecontexts is a list of time contexts with the same length as
+        # computable_args, these time contexts are passed to each arg
+        if op_timecontext:
+            arg_timecontexts = compute_time_context(
+                op,
+                num_args=len(computable_args),
+                timecontext=op_timecontext,
+                clients=clients,
+                scope=scope,
+            )
+        else:
+            arg_timecontexts = [None] * len(computable_args)
+
+        pre_executed_scope = pre_execute(
+            op,
+            *clients,
             scope=scope,
+            timecontext=op_timecontext,
+            aggcontext=aggcontext,
+            **kwargs,
         )
+        scope.update(pre_executed_scope)
+
+        # Short circuit: if pre_execute puts op in scope, then we don't need
+        # to execute its computable_args
+        value = scope.get_value(op, op_timecontext)
+        if value is not None:
+            results[key] = value
+            continue
+
+        if len(arg_timecontexts) != len(computable_args):
+            raise com.IbisError(
+                'arg_timecontexts differ with computable_arg in length '
+                f'for type:\n{type(op).__name__}.'
+            )
+
+        deps = [
+            (arg, arg_timecontext)
+            for arg, arg_timecontext in zip(computable_args, arg_timecontexts)
+            if isinstance(arg, ops.Node)
+        ]
+        plan[key] = computable_args, arg_timecontexts, deps
+        stack.append((key, True))
+        stack.extend((dep, False) for dep in reversed(deps))
+
+    consumers = collections.Counter(dep for _, _, deps in plan.values() for dep in deps)
+
+    def get_arguments(key):
+        computable_args, arg_timecontexts, _ = plan[key]
+        return [
+            results[arg, arg_timecontext] if isinstance(arg, ops.Node) else arg
+            for arg, arg_timecontext in zip(computable_args, arg_timecontexts)
+        ]
+
+    def execute_planned(key, data):
+        op, op_timecontext = key
+        start = time.perf_counter()
+        result = execute_node(
+            op,
+            *data,
+            scope=scope,
+            timecontext=op_timecontext,
+            aggcontext=aggcontext,
+            clients=clients,
+            **kwargs,
+        )
+        computed = post_execute_(
+            op, result, timecontext=op_timecontext, aggcontext=aggcontext, **kwargs
+        )
+        record_timing(op, op_timecontext, time.perf_counter() - start)
+        return computed
+
+    def store(key, value):
+        results[key] = value
+        # free the arguments that no other operation is going to consume
+        for dep in plan[key][2]:
+            consumers[dep] -= 1
+            if not consumers[dep]:
+                del results[dep]
+
+    max_workers = ibis.options.pandas.max_workers
+    if max_workers <= 1 or len(order) < 2 or getattr(_worker, 'active', False):
+        for key in order:
+            store(key, execute_planned(key, get_arguments(key)))
     else:
-        arg_timecontexts = [None] * len(computable_args)
+        execute_concurrently(
+            order, plan, execute_planned, get_arguments, store, max_workers
+        )
 
-    pre_executed_scope = pre_execute(
-        node,
-        *clients,
-        scope=scope,
-        timecontext=timecontext,
-        aggcontext=aggcontext,
-        **kwargs,
-    )
+    return Scope({node: results[root]}, timecontext)
 
-    new_scope = scope.merge_scope(pre_executed_scope)
 
-    # Short circuit: if pre_execute puts op in scope, then we don't need to
-    # execute its computable_args
-    if new_scope.get_value(node, timecontext) is not None:
-        return new_scope
-
-    # recursively compute each node's arguments until we've changed type.
-    # compute_time_context should return with a list with the same length
-    # as computable_args, the two lists will be zipping together for
-    # further execution
-    if len(arg_timecontexts) != len(computable_args):
-        raise com.IbisError(
-            'arg_timecontexts differ with computable_arg in length '
-            f'for type:\n{type(node).__name__}.'
-        )
+_worker = threading.local()
+_executors: dict[int, concurrent.futures.ThreadPoolExecutor] = {}
+_executors_lock = threading.Lock()
 
-    scopes = [
-        execute_until_in_scope(
-            arg,
-            new_scope,
-            timecontext=timecontext,
-            aggcontext=aggcontext,
-            post_execute_=post_execute_,
-            clients=clients,
-            **kwargs,
-        )
-        if isinstance(arg, ops.Node)
-        else Scope({arg: arg}, timecontext)
-        for (arg, timecontext) in zip(computable_args, arg_timecontexts)
-    ]
 
-    # if we're unable to find data then raise an exception
-    if not scopes and computable_args:
-        raise com.UnboundExpressionError(f'Unable to find data for node:\n{repr(node)}')
+def _get_executor(max_workers: int) -> concurrent.futures.ThreadPoolExecutor:
+    with _executors_lock:
+        try:
+            return _executors[max_workers]
+        except KeyError:
+            executor = _executors[max_workers] = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix='ibis-pandas'
+            )
+            return executor
 
-    # there should be exactly one dictionary per computable argument
-    assert len(computable_args) == len(scopes)
 
-    new_scope = new_scope.merge_scopes(scopes)
-    # pass our computed arguments to this node's execute_node implementation
-    data = [
-        new_scope.get_value(arg, timecontext) if isinstance(arg, ops.Node) else arg
-        for (arg, timecontext) in zip(computable_args, arg_timecontexts)
-    ]
-    result = execute_node(
-        node,
-        *data,
-        scope=scope,
-        timecontext=timecontext,
-        aggcontext=aggcontext,
-        clients=clients,
-        **kwargs,
-    )
-    computed = post_execute_(
-        node, result, timecontext=timecontext, aggcontext=aggcontext, **kwargs
-    )
-    return Scope({node: computed}, timecontext)
+def _execute_in_worker(execute_planned, key, data):
+    _worker.active = True
+    try:
+        return execute_planned(key, data)
+    finally:
+        _worker.active = False
+
+
+def execute_concurrently(
+    order, plan, execute_planned, get_arguments, store, max_workers: int
+) -> None:
+    """Execute planned operations on a thread pool as their inputs complete.
+
+    Operations are submitted as soon as all of their planned arguments have
+    been computed, so independent subtrees such as the two sides of a join
+    run concurrently. Results are collected and stored by the calling thread
+    only. Executions nested inside a worker, for example the column
+    expressions of a selection, run sequentially in that worker so that
+    they can never wait on the pool they are occupying.
+
+    Parameters
+    ----------
+    order : List[Tuple[ibis.expr.operations.Node, Optional[TimeContext]]]
+        The planned operations, in an order they can be executed in
+    plan : Mapping
+        Maps every key in `order` to its computable arguments, their time
+        contexts and the keys of the planned operations it depends on
+    execute_planned : Callable
+        Computes the value of a key given its arguments
+    get_arguments : Callable
+        Returns the computed arguments of a key
+    store : Callable
+        Records the value of a key
+    max_workers : int
+        Size of the thread pool
+    """
+    remaining = {}
+    dependents = collections.defaultdict(list)
+    for key in order:
+        deps = [dep for dep in plan[key][2] if dep in plan]
+        remaining[key] = len(deps)
+        for dep in deps:
+            dependents[dep].append(key)
+
+    executor = _get_executor(max_workers)
+    ready = [key for key in order if not remaining[key]]
+    running = {}
+    try:
+        while ready or running:
+            for key in ready:
+                future = executor.submit(
+                    _execute_in_worker, execute_planned, key, get_arguments(key)
+                )
+                running[future] = key
+            ready = []
+
+            done, _ = concurrent.futures.wait(
+                running, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                key = running.pop(future)
+                store(key, future.result())
+                for dependent in dependents[key]:
+                    remaining[dependent] -= 1
+                    if not remaining[dependent]:
+                        ready.append(dependent)
+    finally:
+        for future in running:
+            future.cancel()
 
 
 execute = Dispatcher('execute')
@@ -584,6 +726,17 @@ def get_node_arguments_aggregation(node):
     return (node.table,)
 
 
+@get_node_arguments.register(ops.Join)
+def get_node_arguments_join(node):
+    # the execution hint is read from the node by the join implementations
+    return (node.left, node.right, node.predicates)
+
+
+@get_node_arguments.register(ops.AsOfJoin)
+def get_node_arguments_asof_join(node):
+    return (node.left, node.right, node.by, node.tolerance, node.predicates)
+
+
 @get_node_arguments.register(ops.Window)
 def get_node_arguments_window(node):
     return (get_node_arguments(node.expr)[0], node.window)
@@ -24,7 +24,7 @@ import ibis.expr.operations as ops
 import ibis.expr.types as ir
 from ibis.backends.pandas import Backend as PandasBackend
 from ibis.backends.pandas import aggcontext as agg_ctx
-from ibis.backends.pandas.client import PandasTable
+from ibis.backends.pandas.client import PandasFileScan, PandasTable
 from ibis.backends.pandas.core import (
     boolean_types,
     date_types,
@@ -890,13 +890,6 @@ def execute_null_if_zero_series(op, data, **kwargs):
     return data.where(data != 0, np.nan)
 
 
-@execute_node.register(ops.StringSplit, pd.Series, (pd.Series, str))
-def execute_string_split(op, data, delimiter, **kwargs):
-    # Doing the iteration using `map` is much faster than doing the iteration
-    # using `Series.apply` due to Pandas-related overhead.
-    return pd.Series(map(lambda s: np.array(s.split(delimiter)), data))
-
-
 @execute_node.register(
     ops.Between,
     pd.Series,
@@ -1101,6 +1094,16 @@ def execute_database_table_client(
     op, client, timecontext: TimeContext | None, **kwargs
 ):
     df = client.dictionary[op.name]
+    return _filter_timecontext(op, df, timecontext)
+
+
+@execute_node.register(PandasFileScan, PandasBackend, tuple)
+def execute_file_scan(op, client, filters, timecontext: TimeContext | None, **kwargs):
+    df = client._scan_files(op.name, op.schema.names, filters)
+    return _filter_timecontext(op, df, timecontext)
+
+
+def _filter_timecontext(op, df, timecontext: TimeContext | None):
     if timecontext:
         begin, end = timecontext
         time_col = get_time_col()
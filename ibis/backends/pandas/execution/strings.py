@@ -1,4 +1,4 @@
-import itertools
+import functools
 import json
 import operator
 from functools import partial, reduce
@@ -7,6 +7,7 @@ import numpy as np
 import pandas as pd
 import regex as re
 import toolz
+from packaging.version import parse as vparse
 from pandas.core.groupby import SeriesGroupBy
 
 import ibis.expr.operations as ops
@@ -15,6 +16,88 @@ from ibis.backends.pandas.core import execute, integer_types, scalar_types
 from ibis.backends.pandas.dispatch import execute_node
 from ibis.backends.pandas.execution.util import get_grouping
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:  # pragma: no cover
+    pa = pc = None
+else:
+    # the kernels used below are all available from pyarrow 5 onwards
+    if vparse(pa.__version__) < vparse("5"):  # pragma: no cover
+        pa = pc = None
+
+# replacement strings that mean the same thing to python's re module and RE2:
+# no escapes other than literal backslashes and references to groups 1 to 9,
+# python reads `\0` as a null character and a digit after a reference as part
+# of the group number
+_ARROW_REPLACEMENT = re.compile(r'(?:[^\\]|\\\\|\\[1-9](?![0-9]))*')
+
+# pattern features that python's regex module and RE2 only agree on for
+# printable ASCII text: character classes, which python matches against
+# unicode, and `$`, which python also matches before a trailing newline
+_ASCII_ONLY_REGEX = re.compile(r'\\[wWbBdDsS]|\$')
+
+
+def to_arrow_strings(data):
+    """Convert `data` to an Arrow string array for use with Arrow kernels.
+
+    Returns None when Arrow string kernels should not be used: pyarrow is
+    missing, they are disabled with ``ibis.options.pandas.arrow_strings``,
+    `data` is not a pandas Series or it holds values other than strings.
+    """
+    if (
+        pa is None
+        or not isinstance(data, pd.Series)
+        or not ibis.options.pandas.arrow_strings
+    ):
+        return None
+    try:
+        return pa.array(data, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+
+
+@functools.lru_cache(maxsize=256)
+def is_arrow_regex(pattern: str) -> bool:
+    """Return whether `pattern` is accepted by Arrow's RE2 regex engine.
+
+    Patterns that use features RE2 lacks, such as backreferences and
+    lookarounds, are executed with python's regex module instead.
+    """
+    if pc is None:
+        return False
+    try:
+        # the pattern is only compiled when there is something to match
+        pc.match_substring_regex(pa.array([''], type=pa.string()), pattern)
+    except pa.ArrowInvalid:
+        return False
+    return True
+
+
+def to_arrow_regex_strings(data, pattern: str):
+    """Convert `data` to an Arrow string array for matching `pattern` with
+    Arrow's RE2 regex kernels.
+
+    Returns None when the match has to be done by python's regex module, see
+    `to_arrow_strings` and `is_arrow_regex`. Patterns whose meaning differs
+    between the two engines outside of printable ASCII are only matched by
+    RE2 when every string is printable ASCII.
+    """
+    if not is_arrow_regex(pattern) or (strings := to_arrow_strings(data)) is None:
+        return None
+    if _ASCII_ONLY_REGEX.search(pattern) is not None:
+        special = pc.match_substring_regex(strings, r'[^\t\x20-\x7e]')
+        if pc.any(special).as_py():
+            return None
+    return strings
+
+
+def from_arrow(array, data: pd.Series) -> pd.Series:
+    result = array.to_pandas()
+    result.index = data.index
+    result.name = data.name
+    return result
+
 
 @execute_node.register(ops.StringLength, pd.Series)
 def execute_string_length_series(op, data, **kwargs):
@@ -201,9 +284,21 @@ def sql_like_to_regex(pattern, escape=None):
     return '^{}$'.format(''.join(_sql_like_to_regex(pattern, escape)))
 
 
+@execute_node.register(ops.StringSplit, pd.Series, (pd.Series, str))
+def execute_string_split(op, data, delimiter, **kwargs):
+    if isinstance(delimiter, str) and (strings := to_arrow_strings(data)) is not None:
+        return from_arrow(pc.split_pattern(strings, delimiter), data)
+    # Doing the iteration using `map` is much faster than doing the iteration
+    # using `Series.apply` due to Pandas-related overhead.
+    return pd.Series(map(lambda s: np.array(s.split(delimiter)), data))
+
+
 @execute_node.register(ops.StringSQLLike, pd.Series, str, (str, type(None)))
 def execute_string_like_series_string(op, data, pattern, escape, **kwargs):
-    new_pattern = re.compile(sql_like_to_regex(pattern, escape=escape))
+    new_pattern = sql_like_to_regex(pattern, escape=escape)
+    if (strings := to_arrow_regex_strings(data, new_pattern)) is not None:
+        return from_arrow(pc.match_substring_regex(strings, new_pattern), data)
+    new_pattern = re.compile(new_pattern)
     return data.map(lambda x, pattern=new_pattern: pattern.search(x) is not None)
 
 
@@ -242,6 +337,12 @@ def execute_group_concat_series_gb_mask(op, data, sep, mask, aggcontext=None, **
 
 @execute_node.register(ops.StringAscii, pd.Series)
 def execute_string_ascii(op, data, **kwargs):
+    strings = to_arrow_strings(data)
+    if strings is not None and not strings.null_count:
+        first = pc.utf8_slice_codeunits(strings, 0, 1).to_numpy(zero_copy_only=False)
+        # a fixed width unicode array stores one UCS-4 code point per element
+        codes = first.astype('U1').view(np.int32)
+        return pd.Series(codes, index=data.index, name=data.name)
     return data.map(ord).astype('int32')
 
 
@@ -254,6 +355,8 @@ def execute_string_ascii_group_by(op, data, **kwargs):
 
 @execute_node.register(ops.RegexSearch, pd.Series, str)
 def execute_series_regex_search(op, data, pattern, **kwargs):
+    if (strings := to_arrow_regex_strings(data, pattern)) is not None:
+        return from_arrow(pc.match_substring_regex(strings, pattern), data)
     return data.map(
         lambda x, pattern=re.compile(pattern): pattern.search(x) is not None
     )
@@ -266,8 +369,29 @@ def execute_series_regex_search_gb(op, data, pattern, **kwargs):
     ).groupby(get_grouping(data.grouper.groupings), group_keys=False)
 
 
+def _arrow_regex_extract(strings, pattern, index):
+    # emulate re.match: the pattern is anchored at the start of the string,
+    # and the whole string is rewritten to the requested group
+    matched = pc.match_substring_regex(strings, f'^(?:{pattern})')
+    extracted = pc.replace_substring_regex(
+        strings, f'^({pattern})(?s:.*)', f'\\{index + 1}'
+    )
+    found = pc.and_(matched, pc.not_equal(extracted, ''))
+    return pc.if_else(found, extracted, pa.scalar(None, type=pa.string()))
+
+
 @execute_node.register(ops.RegexExtract, pd.Series, (pd.Series, str), integer_types)
 def execute_series_regex_extract(op, data, pattern, index, **kwargs):
+    if (
+        isinstance(pattern, str)
+        # RE2 rewrite strings can only reference groups \0 to \9
+        and index < 9
+        and (strings := to_arrow_regex_strings(data, f'^({pattern})(?s:.*)'))
+        is not None
+    ):
+        extracted = from_arrow(_arrow_regex_extract(strings, pattern, index), data)
+        return extracted.fillna(np.nan).infer_objects()
+
     def extract(x, pattern=re.compile(pattern), index=index):
         match = pattern.match(x)
         if match is not None:
@@ -287,6 +411,14 @@ def execute_series_regex_extract_gb(op, data, pattern, index, **kwargs):
 
 @execute_node.register(ops.RegexReplace, pd.Series, str, str)
 def execute_series_regex_replace(op, data, pattern, replacement, **kwargs):
+    if (
+        _ARROW_REPLACEMENT.fullmatch(replacement) is not None
+        and (strings := to_arrow_regex_strings(data, pattern)) is not None
+    ):
+        return from_arrow(
+            pc.replace_substring_regex(strings, pattern, replacement), data
+        )
+
     def replacer(x, pattern=re.compile(pattern)):
         return pattern.sub(replacement, x)
 
@@ -301,7 +433,7 @@ def execute_str_regex_replace(_, arg, pattern, replacement, **kwargs):
 @execute_node.register(ops.RegexReplace, SeriesGroupBy, str, str)
 def execute_series_regex_replace_gb(op, data, pattern, replacement, **kwargs):
     return execute_series_regex_replace(
-        data.obj, pattern, replacement, **kwargs
+        op, data.obj, pattern, replacement, **kwargs
     ).groupby(get_grouping(data.grouper.groupings), group_keys=False)
 
 
@@ -374,12 +506,17 @@ def haystack_to_series_of_lists(haystack, index=None):
 @execute_node.register(ops.FindInSet, pd.Series, tuple)
 def execute_series_find_in_set(op, needle, haystack, **kwargs):
     haystack = [execute(arg, **kwargs) for arg in haystack]
-    pieces = haystack_to_series_of_lists(haystack, index=needle.index)
-    return pieces.map(
-        lambda elements, needle=needle, index=itertools.count(): (
-            ibis.util.safe_index(elements, needle.iat[next(index)])
-        )
+    needles = needle.values
+    # compare every element of the haystack with the needle at once, then
+    # take the position of the first match in each row
+    matches = np.column_stack(
+        [
+            np.broadcast_to(getattr(piece, 'values', piece) == needles, needles.shape)
+            for piece in haystack
+        ]
     )
+    positions = np.where(matches.any(axis=1), matches.argmax(axis=1), -1)
+    return pd.Series(positions, index=needle.index)
 
 
 @execute_node.register(ops.FindInSet, SeriesGroupBy, list)
@@ -1,10 +1,12 @@
 from warnings import catch_warnings
 
 import numpy as np
+import pandas as pd
 import pandas.testing as tm
 import pytest
 from pytest import param
 
+import ibis
 from ibis.backends.pandas.execution.strings import sql_like_to_regex
 
 
@@ -128,3 +130,60 @@ def test_string_ops(t, df, case_func, expected_func):
 def test_sql_like_to_regex(pattern, expected):
     result = sql_like_to_regex(pattern, escape='^')
     assert result == f'^{expected}$'
+
+
+@pytest.mark.parametrize(
+    'case_func',
+    [
+        param(lambda s: s.like('%a_c%'), id='like'),
+        param(lambda s: s.like('abc'), id='like_end'),
+        param(lambda s: s.re_search(r'\s'), id='re_search'),
+        param(lambda s: s.re_search(r'\d'), id='re_search_digit'),
+        param(lambda s: s.re_search('c$'), id='re_search_end'),
+        param(lambda s: s.re_search(r'a(?=b)'), id='re_search_lookahead'),
+        param(lambda s: s.re_extract(r'(\w+) (\w+)', 0), id='re_extract_match'),
+        param(lambda s: s.re_extract(r'(\w+) (\w+)', 1), id='re_extract_word'),
+        param(lambda s: s.re_extract(r'(\w+) (\w+)', 2), id='re_extract_group'),
+        param(lambda s: s.re_extract(r'(a)|(b)', 2), id='re_extract_empty'),
+        param(lambda s: s.re_extract(r'\s', 0), id='re_extract_no_match'),
+        param(lambda s: s.re_replace(r'(\w)(\w)', r'\2\1'), id='re_replace'),
+        param(lambda s: s.re_replace(r'(\w)', r'\g<1>!'), id='re_replace_python'),
+        param(lambda s: s.re_replace('b', r'\0'), id='re_replace_group_zero'),
+        param(
+            lambda s: s.re_replace(r'(a)(b)(c)()()()()()()(x?)', r'\10'),
+            id='re_replace_two_digit_group',
+        ),
+        param(lambda s: s.find_in_set(['a', 'b c', 'abc']), id='find_in_set'),
+        param(lambda s: s.split(' '), id='split'),
+    ],
+)
+def test_arrow_string_ops_match_python(case_func):
+    strings = ['abc', 'b c', 'a bc d', 'ééé', 'x\ty', '', 'abcabc']
+    df = pd.DataFrame({'s': strings})
+    con = ibis.pandas.connect({'df': df})
+    expr = case_func(con.table('df').s)
+
+    with ibis.config.option_context('pandas.arrow_strings', False):
+        expected = expr.execute()
+    result = expr.execute()
+
+    tm.assert_series_equal(result, expected, check_names=False)
+
+    # classes and anchors match differently in RE2 outside of printable ASCII
+    df = pd.DataFrame({'s': [*strings, 'éa b', 'Straße x', 'abc\n', 'x٣']})
+    con = ibis.pandas.connect({'df': df})
+    expr = case_func(con.table('df').s)
+
+    with ibis.config.option_context('pandas.arrow_strings', False):
+        expected = expr.execute()
+    result = expr.execute()
+
+    tm.assert_series_equal(result, expected, check_names=False)
+
+
+def test_arrow_string_ascii():
+    df = pd.DataFrame({'s': ['abc', 'b c', 'ééé', '\tx', '𝔘']})
+    con = ibis.pandas.connect({'df': df})
+    result = con.table('df').s.ascii_str().execute()
+    expected = df.s.map(lambda s: ord(s[0])).astype('int32')
+    tm.assert_series_equal(result, expected, check_names=False)
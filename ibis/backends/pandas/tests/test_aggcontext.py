@@ -163,3 +163,35 @@ def test_window_agg_udf_different_freq():
     expected = pd.Series([data.iloc[0:5].mean(), data.iloc[4:7].mean()])
 
     tm.assert_series_equal(result, expected)
+
+
+def test_window_agg_udf_batched():
+    """Test that batched UDFs see every window of a given size at once."""
+
+    data = pd.Series([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    window_lower_indices = pd.Series([0, 0, 0, 3, 3, 4])
+    window_upper_indices = pd.Series([1, 2, 3, 4, 5, 6])
+    mask = pd.Series([True] * 6)
+    calls = []
+
+    def batched_mean(windows):
+        calls.append(windows.shape)
+        return windows.mean(axis=-1)
+
+    batched_mean.batched = True
+
+    result = window_agg_udf(
+        data,
+        batched_mean,
+        window_lower_indices,
+        window_upper_indices,
+        mask,
+        data.index,
+        'float',
+        None,
+    )
+
+    expected = pd.Series([1.0, 1.5, 2.0, 4.0, 4.5, 5.5])
+
+    tm.assert_series_equal(result, expected)
+    assert calls == [(2, 1), (3, 2), (1, 3)]
@@ -5,7 +5,9 @@ import pytest
 from pytest import param
 
 import ibis
-from ibis.backends.pandas.client import PandasTable
+import ibis.common.graph as g
+import ibis.expr.analysis as an
+from ibis.backends.pandas.client import PandasFileScan, PandasTable
 
 
 @pytest.fixture
@@ -93,3 +95,99 @@ def test_datetime64_infer(client, unit):
     expr = ibis.literal(value, type='timestamp')
     result = client.execute(expr)
     assert result == value
+
+
+def test_cache(client, table, mocker):
+    expr = table[table.a > 1]
+    spy = mocker.spy(client, "_load_into_cache")
+
+    cached = expr.cache()
+    assert isinstance(cached, ibis.expr.types.CachedTable)
+    assert expr.cache().op() is cached.op()
+    spy.assert_called_once()
+
+    name = cached.op().name
+    assert name in client.list_tables()
+    tm.assert_frame_equal(cached.execute(), expr.execute())
+
+    # expressions referencing the original table reuse the cached results
+    substitute = mocker.spy(client, "_substitute_cached")
+    client.execute(expr.a.sum())
+    (result,) = an.find_immediate_parent_tables(substitute.spy_return.op())
+    assert result is cached.op()
+
+    cached.release()
+    assert name not in client.list_tables()
+
+
+def test_cache_released_on_collection(client, table):
+    cached = table[table.a > 1].cache()
+    name = cached.op().name
+    assert name in client.list_tables()
+
+    del cached
+    assert name not in client.list_tables()
+
+
+def test_cache_context_manager(client, table):
+    with table.mutate(c=table.a * 2).cache() as cached:
+        name = cached.op().name
+        assert cached.c.sum().execute() == 12
+    assert name not in client.list_tables()
+
+
+@pytest.fixture
+def parquet_df():
+    return pd.DataFrame({"a": range(100), "b": list("xy") * 50, "k": [0, 1] * 50})
+
+
+@pytest.fixture
+def parquet_path(parquet_df, tmp_path):
+    path = tmp_path / "data.parquet"
+    parquet_df.to_parquet(path, row_group_size=10)
+    return path
+
+
+def test_register_parquet(parquet_df, parquet_path):
+    client = ibis.pandas.connect({})
+    t = client.register(parquet_path)
+    assert t.op().name == "data"
+    assert "data" in client.list_tables()
+    assert t.count().execute() == 100
+
+    expr = t.filter([t.a > 50, t.b == "y"]).a.sum()
+    (scan,) = an.find_immediate_parent_tables(client._push_down_scans(expr.op()))
+    scan = scan.table
+    assert isinstance(scan, PandasFileScan)
+    assert scan.schema.names == ("a", "b")
+    assert scan.filters == (("a", ">", 50), ("b", "==", "y"))
+
+    df = parquet_df
+    assert expr.execute() == df.a[(df.a > 50) & (df.b == "y")].sum()
+
+
+def test_register_parquet_reduction_over_unfiltered_rows(parquet_df, parquet_path):
+    client = ibis.pandas.connect({})
+    t = client.register(parquet_path)
+    result = t.mutate(s=t.a.sum()).filter(t.a > 95).execute()
+    assert result.s.tolist() == [parquet_df.a.sum()] * 4
+
+
+def test_register_parquet_directory(parquet_df, tmp_path):
+    parquet_df.to_parquet(tmp_path / "dataset", partition_cols=["k"])
+    client = ibis.pandas.connect({})
+    t = client.register(tmp_path / "dataset", table_name="dataset")
+    assert t.filter(t.k == 1).a.sum().execute() == sum(range(1, 100, 2))
+
+
+def test_register_parquet_table_used_twice(parquet_path):
+    client = ibis.pandas.connect({})
+    t = client.register(parquet_path)
+    expr = t.filter(t.a < 10).union(t)
+
+    node = client._push_down_scans(expr.op())
+    scans = {
+        op for op in g.Graph.from_bfs(node).nodes() if isinstance(op, PandasFileScan)
+    }
+    assert [scan.filters for scan in scans] == [()]
+    assert len(expr.execute()) == 110
@@ -1,3 +1,6 @@
+import gc
+import threading
+import weakref
 from typing import Any
 
 import pandas as pd
@@ -9,11 +12,13 @@ import ibis
 import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
-from ibis.backends.pandas import Backend
+from ibis.backends.pandas import Backend, trace
+from ibis.backends.pandas.client import PandasTable
 from ibis.backends.pandas.core import is_computable_input
 from ibis.backends.pandas.dispatch import execute_node, post_execute, pre_execute
 from ibis.backends.pandas.execution import execute
 from ibis.expr.scope import Scope
+from ibis.udf.vectorized import elementwise
 
 
 @pytest.fixture
@@ -182,3 +187,88 @@ def test_scope_look_up():
     scope = scope.merge_scope(Scope({one_day: 1}, None))
     assert scope.get_value(one_hour) is None
     assert scope.get_value(one_day) is not None
+
+
+def test_execute_independent_subtrees_concurrently(ibis_table, dataframe):
+    barrier = threading.Barrier(2, timeout=5)
+
+    @elementwise(input_type=[dt.int64], output_type=dt.int64)
+    def wait_for_sibling(series):
+        # both sides of the join must be executing at the same time to pass
+        barrier.wait()
+        return series
+
+    left = ibis_table.mutate(x=wait_for_sibling(ibis_table.plain_int64))
+    right = ibis_table.mutate(y=wait_for_sibling(ibis_table.plain_int64 + 1))
+    expr = left.join(right, 'plain_strings')[left.plain_strings, left.x, right.y]
+
+    with ibis.config.option_context('pandas.max_workers', 2):
+        result = expr.execute()
+
+    expected = pd.DataFrame(
+        {
+            'plain_strings': dataframe.plain_strings,
+            'x': dataframe.plain_int64,
+            'y': dataframe.plain_int64 + 1,
+        }
+    )
+    tm.assert_frame_equal(result, expected)
+
+
+def test_execute_with_max_workers_matches_sequential(ibis_table):
+    t = ibis_table
+    expr = t.union(t.mutate(plain_int64=t.plain_int64 * 2)).group_by('dup_strings')
+    expr = expr.aggregate(total=lambda t: t.plain_int64.sum()).order_by('dup_strings')
+
+    expected = expr.execute()
+    with ibis.config.option_context('pandas.max_workers', 4):
+        result = expr.execute()
+
+    tm.assert_frame_equal(result, expected)
+
+
+def test_execute_deep_expression(ibis_table, dataframe):
+    expr = ibis_table.plain_int64
+    for _ in range(400):
+        expr = expr + 1
+
+    result = expr.execute()
+    tm.assert_series_equal(result, dataframe.plain_int64 + 400)
+
+
+def test_intermediate_results_are_released(ibis_table, dataframe):
+    refs = []
+
+    @elementwise(input_type=[dt.int64], output_type=dt.int64)
+    def remember(series):
+        refs.append(weakref.ref(series))
+        return series * 2
+
+    @elementwise(input_type=[dt.int64], output_type=dt.int64)
+    def check_released(series):
+        # the input of remember has no consumer left at this point
+        gc.collect()
+        assert refs[0]() is None
+        return series
+
+    expr = check_released(remember(ibis_table.plain_int64 + 1) + 1)
+    result = expr.execute()
+    tm.assert_series_equal(
+        result, (dataframe.plain_int64 + 1) * 2 + 1, check_names=False
+    )
+
+
+def test_execution_timings(ibis_table):
+    expr = (ibis_table.plain_int64 + 1).sum()
+
+    with trace.timings() as timings:
+        expr.execute()
+
+    assert [type(node) for node, _, _ in timings] == [
+        PandasTable,
+        ops.TableColumn,
+        ops.Add,
+        ops.Sum,
+        ops.Alias,
+    ]
+    assert all(seconds >= 0 for _, _, seconds in timings)
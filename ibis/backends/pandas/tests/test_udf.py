@@ -7,6 +7,7 @@ import pytest
 from packaging.version import parse as vparse
 
 import ibis
+import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 import ibis.expr.types as ir
 from ibis.backends.pandas import Backend
@@ -267,6 +268,60 @@ def test_udaf_window(t2, df2):
     tm.assert_frame_equal(result, expected)
 
 
+def test_batched_udaf_window(t2, df2):
+    calls = []
+
+    @udf.reduction(['double', 'double'], 'double', batched=True)
+    def my_batched_wm(v, w):
+        calls.append(v.shape)
+        return np.average(v, weights=w, axis=-1)
+
+    window = ibis.trailing_window(2, order_by='a', group_by='key')
+    expr = t2.mutate(rolled=my_batched_wm(t2.b, t2.c + 1.0).over(window))
+    result = expr.execute().sort_values(['key', 'a'])
+
+    def rolling_wm(df):
+        values, weights = df.b.values, df.c.values + 1.0
+        return pd.Series(
+            [
+                np.average(
+                    values[max(i - 2, 0) : i + 1],
+                    weights=weights[max(i - 2, 0) : i + 1],
+                )
+                for i in range(len(df))
+            ],
+            index=df.index,
+        )
+
+    expected = df2.sort_values(['key', 'a'])
+    expected = expected.assign(
+        rolled=expected.groupby('key', group_keys=False).apply(rolling_wm)
+    )
+    tm.assert_frame_equal(result, expected)
+    # one call per distinct window size rather than one per window
+    assert sorted(calls) == [(1, 3), (3, 1), (3, 2)]
+
+
+def test_batched_udaf_group_by(t2, df2):
+    @udf.reduction(['double'], 'double', batched=True)
+    def my_batched_mean(v):
+        assert isinstance(v, np.ndarray)
+        return v.mean(axis=-1)
+
+    expr = t2.group_by('key').aggregate(mean=my_batched_mean(t2.b))
+    result = expr.execute().sort_values('key').reset_index(drop=True)
+    expected = df2.groupby('key').b.mean().rename('mean').reset_index()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_batched_udaf_requires_scalar_output():
+    with pytest.raises(com.IbisTypeError):
+
+        @udf.reduction(['double'], dt.Array(dt.double), batched=True)
+        def my_batched_quantiles(v):
+            return np.quantile(v, [0.25, 0.75], axis=-1)
+
+
 @pytest.mark.xfail(
     condition=vparse("1.4") <= vparse(pd.__version__) < vparse("1.4.2"),
     raises=ValueError,
@@ -1,5 +1,7 @@
+import contextlib
 import functools
 import logging
+import threading
 import traceback
 from datetime import datetime
 
@@ -81,6 +83,49 @@ _logger = logging.getLogger('ibis.backends.pandas.trace')
 _trace_funcs = set()
 
 
+_timings = []
+_timings_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def timings():
+    """Collect how long each operation takes to execute.
+
+    Yields a list that is filled with a ``(node, timecontext, seconds)``
+    tuple for every operation passed to ``execute_node`` while the context
+    is active, in the order the operations finish. The time includes
+    ``post_execute``.
+
+    Examples
+    --------
+    >>> import ibis
+    >>> import pandas as pd
+    >>> from ibis.backends.pandas import trace
+    >>> con = ibis.pandas.connect({"t": pd.DataFrame({"a": [1, 2, 3]})})
+    >>> t = con.table("t")
+    >>> with trace.timings() as timings:
+    ...     _ = t.a.sum().execute()
+    >>> [type(node).__name__ for node, _, _ in timings]
+    ['PandasTable', 'TableColumn', 'Sum', 'Alias']
+    """
+    collected = []
+    with _timings_lock:
+        _timings.append(collected)
+    try:
+        yield collected
+    finally:
+        with _timings_lock:
+            _timings.remove(collected)
+
+
+def record_timing(node, timecontext, seconds: float) -> None:
+    """Report the execution time of `node` to the active collectors."""
+    if _timings:
+        with _timings_lock:
+            for collected in _timings:
+                collected.append((node, timecontext, seconds))
+
+
 def enable():
     """Enable tracing."""
     if options.pandas is None:
@@ -40,9 +40,9 @@ class udf:
         return ibis.udf.vectorized.elementwise(input_type, output_type)
 
     @staticmethod
-    def reduction(input_type, output_type):
+    def reduction(input_type, output_type, batched=False):
         """Alias for ibis.udf.vectorized.reduction."""
-        return ibis.udf.vectorized.reduction(input_type, output_type)
+        return ibis.udf.vectorized.reduction(input_type, output_type, batched=batched)
 
     @staticmethod
     def analytic(input_type, output_type):
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import inspect
 import os
+import tempfile
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping, MutableMapping
@@ -28,6 +30,17 @@ def _name_from_path(path: Path) -> str:
 def _parquet(_, path, table_name=None, **kwargs):
     path = Path(path).absolute()
     table_name = table_name or _name_from_path(path)
+    if path.is_dir():
+        import pyarrow.dataset as ds
+
+        # scan hive-partitioned directories through a dataset so that
+        # predicates on partition keys skip whole files
+        dataset = ds.dataset(path, format="parquet", partitioning="hive")
+        # polars renamed `scan_ds` to `scan_pyarrow_dataset` in 0.16
+        method = (
+            "scan_pyarrow_dataset" if hasattr(pl, "scan_pyarrow_dataset") else "scan_ds"
+        )
+        return (method, dataset, table_name)
     return ("scan_parquet", path, table_name)
 
 
@@ -42,12 +55,15 @@ def _csv(_, path, table_name=None, **kwargs):
 def _file(raw, path, table_name=None, **kwargs):
     num_sep_chars = len(os.extsep)
     extension = "".join(Path(path).suffixes)[num_sep_chars:]
+    if not extension and Path(path).is_dir():
+        extension = "parquet"
     if not extension:
         raise ValueError(
             f"""Unrecognized file type or extension: {raw}
 
         Valid prefixes are parquet://, csv://, or file://
-        Supported file extensions are parquet and csv"""
+        Supported file extensions are parquet and csv, directories are read
+        as parquet datasets"""
         )
     return _register_file(f"{extension}://{path}", table_name=table_name, **kwargs)
 
@@ -57,12 +73,12 @@ class Backend(BaseBackend):
     builder = None
 
     def __init__(self, *args, **kwargs):
-        super().__init__(args, kwargs)
+        super().__init__(*args, **kwargs)
         self._tables = None
 
     def do_connect(
         self,
-        _tables: MutableMapping[str, pl.LazyFrame],
+        _tables: MutableMapping[str, pl.LazyFrame] | None = None,
         *args,
         **kwargs,
     ) -> None:
@@ -125,6 +141,13 @@ class Backend(BaseBackend):
     def get_schema(self, table_name, database=None):
         return self._tables[table_name].schema
 
+    def _load_into_cache(self, name, expr):
+        self._tables[name] = self.compile(expr).collect().lazy()
+        return self.table(name).op()
+
+    def _clean_up_cached_table(self, name):
+        del self._tables[name]
+
     @classmethod
     @lru_cache
     def _get_operations(cls):
@@ -148,7 +171,7 @@ class Backend(BaseBackend):
         params: Mapping[ir.Expr, object] = None,
         **kwargs: Any,
     ):
-        node = expr.op()
+        node = self._substitute_cached(expr).op()
         if params:
             node = node.replace({p.op(): v for p, v in params.items()})
             expr = node.to_expr()
@@ -175,9 +198,27 @@ class Backend(BaseBackend):
         expr: ir.Expr,
         params: Mapping[ir.Expr, object] = None,
         limit: str = 'default',
+        streaming: bool = False,
         **kwargs: Any,
     ):
-        df = self.compile(expr, params=params).collect()
+        """Execute an expression.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to execute
+        params
+            Mapping of scalar parameter expressions to value
+        limit
+            Ignored, the polars backend doesn't apply a default limit
+        streaming
+            Run the query with polars' streaming engine, which processes the
+            data in batches. This bounds the memory used by aggregations over
+            inputs larger than memory.
+        kwargs
+            Keyword arguments
+        """
+        df = _collect(self.compile(expr, params=params), streaming=streaming)
         if isinstance(expr, ir.Table):
             return df.to_pandas()
         elif isinstance(expr, ir.Column):
@@ -187,39 +228,45 @@ class Backend(BaseBackend):
         else:
             raise com.IbisError(f"Cannot execute expression of type: {type(expr)}")
 
+    @staticmethod
+    def _pyarrow_schema(expr: ir.Expr):
+        if isinstance(expr, ir.Table):
+            return expr.schema().to_pyarrow()
+        elif isinstance(expr, ir.Value):
+            schema = sch.schema({expr.get_name(): expr.type().to_pyarrow()})
+            return schema.to_pyarrow()
+        else:
+            raise com.IbisError(f"Cannot execute expression of type: {type(expr)}")
+
     def _to_pyarrow_table(
         self,
         expr: ir.Expr,
         params: Mapping[ir.Expr, object] = None,
         limit: int | None = None,
+        streaming: bool = False,
         **kwargs: Any,
     ):
+        schema = self._pyarrow_schema(expr)
         lf = self.compile(expr, params=params, **kwargs)
         if limit is not None:
-            df = lf.fetch(limit)
+            df = lf.fetch(limit, **_streaming_kwargs(pl.LazyFrame.fetch, streaming))
         else:
-            df = lf.collect()
+            df = _collect(lf, streaming=streaming)
 
-        table = df.to_arrow()
-        if isinstance(expr, ir.Table):
-            schema = expr.schema().to_pyarrow()
-            return table.cast(schema)
-        elif isinstance(expr, ir.Value):
-            schema = sch.schema({expr.get_name(): expr.type().to_pyarrow()})
-            schema = schema.to_pyarrow()
-            return table.cast(schema)
-        else:
-            raise com.IbisError(f"Cannot execute expression of type: {type(expr)}")
+        return df.to_arrow().cast(schema)
 
     def to_pyarrow(
         self,
         expr: ir.Expr,
         params: Mapping[ir.Expr, object] = None,
         limit: int | None = None,
+        streaming: bool = False,
         **kwargs: Any,
     ):
         pa = self._import_pyarrow()
-        result = self._to_pyarrow_table(expr, params=params, limit=limit, **kwargs)
+        result = self._to_pyarrow_table(
+            expr, params=params, limit=limit, streaming=streaming, **kwargs
+        )
         if isinstance(expr, ir.Table):
             return result
         elif isinstance(expr, ir.Column):
@@ -241,6 +288,109 @@ class Backend(BaseBackend):
         chunk_size: int = 1_000_000,
         **kwargs: Any,
     ):
-        self._import_pyarrow()
-        table = self._to_pyarrow_table(expr, params=params, limit=limit, **kwargs)
-        return table.to_reader(chunk_size)
+        """Execute expression and return a RecordBatchReader.
+
+        The query runs with polars' streaming engine. When the engine can
+        execute the whole query, its output is spilled to a temporary Arrow
+        IPC file that is read back one batch at a time, so results larger
+        than memory can be consumed. Otherwise the streaming engine computes
+        the parts of the query it supports and the result is collected
+        before being split into batches.
+
+        Parameters
+        ----------
+        expr
+            Ibis expression to export to pyarrow
+        params
+            Mapping of scalar parameter expressions to value.
+        limit
+            An integer to effect a specific row limit.
+        chunk_size
+            Maximum number of rows in each returned record batch.
+        kwargs
+            Keyword arguments
+
+        Returns
+        -------
+        RecordBatchReader
+            Collection of pyarrow `RecordBatch`s.
+        """
+        pa = self._import_pyarrow()
+        schema = self._pyarrow_schema(expr)
+        lf = self.compile(expr, params=params, **kwargs)
+        if isinstance(limit, int):
+            lf = lf.limit(limit)
+
+        if _is_streamable(lf):
+            batches = _sink_batches(lf, chunk_size)
+        else:
+            table = _collect(lf, streaming=True).to_arrow()
+            batches = table.to_batches(max_chunksize=chunk_size)
+
+        return pa.RecordBatchReader.from_batches(
+            schema,
+            (
+                cast_batch
+                for batch in batches
+                for cast_batch in pa.Table.from_batches([batch])
+                .cast(schema)
+                .to_batches()
+            ),
+        )
+
+
+@lru_cache
+def _streaming_kwargs(method, streaming: bool) -> dict[str, bool]:
+    """Return the keyword arguments running `method` on the streaming engine.
+
+    Polars renamed ``allow_streaming`` to ``streaming`` in 0.16, plans run
+    without the streaming engine on versions that support neither.
+    """
+    params = inspect.signature(method).parameters
+    kwargs = {}
+    for name in ("streaming", "allow_streaming"):
+        if name in params:
+            kwargs[name] = streaming
+            break
+    else:
+        return kwargs
+    # common subplan elimination isn't supported by the streaming engine, and
+    # polars warns about turning it off when it isn't disabled explicitly
+    if "common_subplan_elimination" in params:
+        kwargs["common_subplan_elimination"] = not streaming
+    return kwargs
+
+
+def _collect(lf: pl.LazyFrame, streaming: bool = False) -> pl.DataFrame:
+    return lf.collect(**_streaming_kwargs(pl.LazyFrame.collect, streaming))
+
+
+def _is_streamable(lf: pl.LazyFrame) -> bool:
+    """Return whether the streaming engine executes all of `lf`.
+
+    Only those plans can be written out with the ``sink_*`` methods; the
+    streamed part of a plan is reported as a pipeline by polars. Versions
+    without ``sink_ipc`` never stream plans out.
+    """
+    if not hasattr(lf, "sink_ipc"):
+        return False
+    plan = lf.explain(streaming=True, common_subplan_elimination=False)
+    return plan.lstrip().startswith("--- PIPELINE")
+
+
+def _sink_batches(lf: pl.LazyFrame, chunk_size: int):
+    """Stream the result of `lf` through a temporary Arrow IPC file.
+
+    The query only runs once the first batch is requested.
+    """
+    import pyarrow as pa
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "result.arrow")
+        lf.sink_ipc(path, compression=None)
+        with pa.OSFile(path) as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                batch = reader.get_batch(i)
+                for offset in range(0, batch.num_rows, chunk_size):
+                    yield batch.slice(offset, chunk_size)
@@ -12,6 +12,7 @@ import ibis.expr.datatypes as dt
 import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 from ibis.backends.polars.datatypes import to_polars_type
+from ibis.backends.pyarrow import PyArrowInMemoryTable
 
 
 def _assert_literal(op):
@@ -41,7 +42,17 @@ def table(op):
 @translate.register(ops.InMemoryTable)
 def pandas_in_memory_table(op):
     lf = pl.from_pandas(op.data.to_frame()).lazy()
+    return _cast_in_memory_table(op, lf)
 
+
+@translate.register(PyArrowInMemoryTable)
+def pyarrow_in_memory_table(op):
+    # keep the chunks of the arrow table, so its buffers aren't copied
+    lf = pl.from_arrow(op.data.to_pyarrow(), rechunk=False).lazy()
+    return _cast_in_memory_table(op, lf)
+
+
+def _cast_in_memory_table(op, lf):
     columns = []
     for name, current_dtype in sch.infer(lf).items():
         desired_dtype = op.schema[name]
@@ -0,0 +1,104 @@
+import pandas as pd
+import pandas.testing as tm
+import pytest
+
+import ibis
+
+pl = pytest.importorskip("polars")
+pa = pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def con():
+    df = pl.DataFrame(
+        {
+            "key": [i % 3 for i in range(100)],
+            "value": list(range(100)),
+        }
+    )
+    return ibis.polars.connect({"t": df.lazy()})
+
+
+def test_connect_tables(con):
+    assert con.list_tables() == ["t"]
+    assert con.execute(con.table("t").value.sum()) == sum(range(100))
+
+
+def test_connect_without_tables():
+    assert ibis.polars.connect().list_tables() == []
+
+
+def test_to_pyarrow_batches_streams_bounded_batches(con):
+    t = con.table("t")
+    expr = t.filter(t.value >= 10).mutate(double=t.value * 2)
+
+    reader = con.to_pyarrow_batches(expr, chunk_size=7)
+    assert reader.schema == expr.schema().to_pyarrow()
+
+    batches = list(reader)
+    assert all(batch.num_rows <= 7 for batch in batches)
+
+    result = pa.Table.from_batches(batches, schema=reader.schema).to_pandas()
+    expected = expr.execute()
+    tm.assert_frame_equal(result, expected)
+
+
+def test_to_pyarrow_batches_limit(con):
+    t = con.table("t")
+    reader = con.to_pyarrow_batches(t, limit=15, chunk_size=4)
+    batches = list(reader)
+    assert [batch.num_rows for batch in batches] == [4, 4, 4, 3]
+
+
+def test_to_pyarrow_batches_not_streamable(con):
+    # distinct can't be executed by the streaming engine, so the result is
+    # collected before being split into batches
+    t = con.table("t")
+    expr = t.distinct()
+
+    reader = con.to_pyarrow_batches(expr, chunk_size=30)
+    batches = list(reader)
+    assert [batch.num_rows for batch in batches] == [30, 30, 30, 10]
+
+    result = pa.Table.from_batches(batches).to_pandas().sort_values("value")
+    expected = expr.execute().sort_values("value")
+    tm.assert_frame_equal(
+        result.reset_index(drop=True), expected.reset_index(drop=True)
+    )
+
+
+def test_execute_streaming(con):
+    t = con.table("t")
+    expr = t.group_by("key").aggregate(total=t.value.sum())
+
+    result = con.execute(expr, streaming=True).sort_values("key")
+    expected = con.execute(expr).sort_values("key")
+    tm.assert_frame_equal(
+        result.reset_index(drop=True), expected.reset_index(drop=True)
+    )
+
+
+def test_to_pyarrow_batches_register_parquet(con, tmp_path):
+    path = tmp_path / "data.parquet"
+    pl.DataFrame({"x": list(range(50)), "y": ["a", "b"] * 25}).write_parquet(path)
+    t = con.register(path, table_name="data")
+
+    expr = t.filter(t.y == "a").select("x")
+    batches = list(con.to_pyarrow_batches(expr, chunk_size=10))
+    assert all(batch.num_rows <= 10 for batch in batches)
+    assert sum(batch.num_rows for batch in batches) == 25
+
+
+def test_execute_pyarrow_memtable(con):
+    t = ibis.memtable(pa.table({"x": [1, 2, 3], "y": ["a", "b", "a"]}))
+    expr = t.filter(t.y == "a").x.sum()
+    assert con.execute(expr) == 4
+
+
+def test_register_parquet_directory(con, tmp_path):
+    df = pd.DataFrame({"a": range(100), "k": [0, 1] * 50})
+    df.to_parquet(tmp_path / "dataset", partition_cols=["k"])
+
+    t = con.register(tmp_path / "dataset")
+    assert t.op().name == "dataset"
+    assert con.execute(t.filter(t.k == 1).a.sum()) == sum(range(1, 100, 2))
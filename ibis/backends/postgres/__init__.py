@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import contextlib
-from typing import Literal
+import io
+import itertools
+import operator
+from typing import TYPE_CHECKING, Literal
 
 import sqlalchemy as sa
 
@@ -14,6 +17,24 @@ from ibis.backends.postgres.compiler import PostgreSQLCompiler
 from ibis.backends.postgres.datatypes import _get_type
 from ibis.backends.postgres.udf import udf as _udf
 
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+
+def _is_csv_encodable(typ: pa.DataType) -> bool:
+    import pyarrow.types as pat
+
+    return (
+        pat.is_integer(typ)
+        or pat.is_floating(typ)
+        or pat.is_boolean(typ)
+        or pat.is_string(typ)
+        or pat.is_large_string(typ)
+        or pat.is_decimal(typ)
+        or pat.is_date(typ)
+        or pat.is_timestamp(typ)
+    )
+
 
 class Backend(BaseAlchemyBackend):
     name = 'postgres'
@@ -28,6 +49,7 @@ class Backend(BaseAlchemyBackend):
         database: str | None = None,
         url: str | None = None,
         driver: Literal["psycopg2"] = "psycopg2",
+        pool_size: int = 5,
     ) -> None:
         """Create an Ibis client connected to PostgreSQL database.
 
@@ -49,6 +71,9 @@ class Backend(BaseAlchemyBackend):
             If passed, the other connection arguments are ignored.
         driver
             Database driver
+        pool_size
+            Number of connections kept open for concurrent execution with
+            `execute_many` and `execute_async`
 
         Examples
         --------
@@ -101,7 +126,7 @@ class Backend(BaseAlchemyBackend):
             driver=f'postgresql+{driver}',
         )
         self.database_name = alchemy_url.database
-        super().do_connect(sa.create_engine(alchemy_url))
+        super().do_connect(sa.create_engine(alchemy_url, pool_size=pool_size))
 
     def list_databases(self, like=None):
         # http://dba.stackexchange.com/a/1304/58517
@@ -123,6 +148,52 @@ class Backend(BaseAlchemyBackend):
             finally:
                 bind.execute(f"SET TIMEZONE = '{previous_timezone}'")
 
+    def _table_versions(self, tables):
+        # the counters are updated when transactions end and only published
+        # periodically by the server, so changes can take up to a second to be
+        # visible, the file node of a table changes on `TRUNCATE`
+        query = sa.text(
+            "SELECT n_tup_ins, n_tup_upd, n_tup_del, pg_relation_filenode(relid) "
+            "FROM pg_stat_user_tables WHERE relid = to_regclass(:name)"
+        )
+        preparer = self.con.dialect.identifier_preparer
+        versions = []
+        with self.begin() as bind:
+            for table in tables:
+                name = preparer.format_table(table.sqla_table)
+                row = bind.execute(query, name=name).fetchone()
+                if row is None:
+                    # views and foreign tables don't have statistics
+                    return None
+                versions.append(tuple(row))
+        return tuple(versions)
+
+    def _insert_record_batches(
+        self, bind, table: sa.Table, reader: pa.RecordBatchReader
+    ) -> None:
+        import pyarrow.csv as pcsv
+
+        # nested and binary values have no faithful CSV representation
+        if not all(map(_is_csv_encodable, reader.schema.types)):
+            return super()._insert_record_batches(bind, table, reader)
+
+        preparer = bind.dialect.identifier_preparer
+        columns = ", ".join(map(preparer.quote, reader.schema.names))
+        query = (
+            f"COPY {preparer.format_table(table)} ({columns}) "
+            "FROM STDIN WITH (FORMAT csv)"
+        )
+        # strings are always quoted by the arrow CSV writer while nulls are
+        # written as unquoted empty fields, matching the NULL handling of COPY
+        options = pcsv.WriteOptions(include_header=False)
+
+        with contextlib.closing(bind.connection.cursor()) as cursor:
+            for batch in reader:
+                buffer = io.BytesIO()
+                pcsv.write_csv(batch, buffer, options)
+                buffer.seek(0)
+                cursor.copy_expert(query, buffer)
+
     def udf(
         self,
         pyfunc,
@@ -194,6 +265,34 @@ ORDER BY attnum
         tuples = [(col, _get_type(typestr)) for col, typestr in type_info]
         return sch.Schema.from_tuples(tuples)
 
+    def _get_table_schemas(self, schema: str | None = None) -> dict[str, sch.Schema]:
+        query = sa.text(
+            """\
+SELECT
+  c.relname,
+  a.attname,
+  format_type(a.atttypid, a.atttypmod),
+  NOT a.attnotnull
+FROM pg_attribute a
+JOIN pg_class c ON a.attrelid = c.oid
+JOIN pg_namespace n ON c.relnamespace = n.oid
+WHERE n.nspname = coalesce(:schema, current_schema())
+  AND c.relkind IN ('r', 'v', 'm', 'f', 'p')
+  AND a.attnum > 0
+  AND NOT a.attisdropped
+ORDER BY c.relname, a.attnum
+"""
+        )
+        with self.begin() as con:
+            rows = con.execute(query, schema=schema).fetchall()
+        return {
+            name: sch.Schema.from_tuples(
+                (column, _get_type(typestr)(nullable=nullable))
+                for _, column, typestr, nullable in columns
+            )
+            for name, columns in itertools.groupby(rows, key=operator.itemgetter(0))
+        }
+
     def _get_temp_view_definition(
         self,
         name: str,
@@ -0,0 +1,59 @@
+"""In-memory tables backed by pyarrow tables."""
+
+from __future__ import annotations
+
+import hashlib
+
+import pyarrow as pa
+
+import ibis.expr.operations as ops
+import ibis.expr.rules as rlz
+from ibis import util
+from ibis.common.grounds import Immutable
+
+
+class PyArrowTableProxy(Immutable, util.ToFrame):
+    __slots__ = ('_t', '_hash', '_fingerprint')
+
+    def __init__(self, t: pa.Table) -> None:
+        object.__setattr__(self, "_t", t)
+        object.__setattr__(self, "_hash", hash((type(t), id(t))))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        df_repr = util.indent(repr(self._t), spaces=2)
+        return f"{self.__class__.__name__}:\n{df_repr}"
+
+    def to_frame(self):
+        return self._t.to_pandas()
+
+    def to_pyarrow(self) -> pa.Table:
+        return self._t
+
+    @property
+    def fingerprint(self) -> str:
+        try:
+            return self._fingerprint
+        except AttributeError:
+            pass
+
+        # hash the arrow buffers in place, without serializing the table
+        digest = hashlib.sha256(str(self._t.schema).encode())
+        for column in self._t.columns:
+            for chunk in column.chunks:
+                digest.update(f"{chunk.offset}:{len(chunk)}".encode())
+                buffers = chunk.buffers()
+                if pa.types.is_dictionary(chunk.type):
+                    buffers += chunk.dictionary.buffers()
+                for buffer in filter(None, buffers):
+                    digest.update(buffer)
+
+        fingerprint = digest.hexdigest()
+        object.__setattr__(self, "_fingerprint", fingerprint)
+        return fingerprint
+
+
+class PyArrowInMemoryTable(ops.InMemoryTable):
+    data = rlz.instance_of(PyArrowTableProxy)
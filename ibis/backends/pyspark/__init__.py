@@ -149,6 +149,8 @@ class Backend(BaseSQLBackend):
         self._context = session.sparkContext
         self._session = session
         self._catalog = session.catalog
+        # fingerprints of the in-memory tables registered as temporary views
+        self._memtables = {}
 
         # Spark internally stores timestamps as UTC values, and timestamp data
         # that is brought in without a specified time zone is converted as
@@ -481,8 +483,13 @@ class Backend(BaseSQLBackend):
         return self.raw_sql(statement.compile())
 
     def _register_in_memory_table(self, table_op):
-        spark_df = self.compile(table_op.to_expr())
-        spark_df.createOrReplaceTempView(table_op.name)
+        # temporary views are visible to the whole session, so the data is
+        # only converted again when its contents change
+        fingerprint = table_op.data.fingerprint
+        if self._memtables.get(table_op.name) != fingerprint:
+            spark_df = self.compile(table_op.to_expr())
+            spark_df.createOrReplaceTempView(table_op.name)
+            self._memtables[table_op.name] = fingerprint
 
     def create_view(
         self,
@@ -17,6 +17,7 @@ import ibis.expr.types as ir
 from ibis import interval
 from ibis.backends.pandas.client import PandasInMemoryTable
 from ibis.backends.pandas.execution import execute
+from ibis.backends.pyarrow import PyArrowInMemoryTable
 from ibis.backends.pyspark.datatypes import (
     ibis_array_dtype_to_spark_dtype,
     ibis_dtype_to_spark_dtype,
@@ -1801,6 +1802,7 @@ def compile_random(*args, **kwargs):
 
 @compiles(ops.InMemoryTable)
 @compiles(PandasInMemoryTable)
+@compiles(PyArrowInMemoryTable)
 def compile_in_memory_table(t, op, session, **kwargs):
     fields = [
         pt.StructField(name, ibis_dtype_to_spark_dtype(dtype), dtype.nullable)
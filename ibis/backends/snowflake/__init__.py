@@ -21,6 +21,7 @@ if TYPE_CHECKING:
 
 
 _NATIVE_PANDAS = True
+_NATIVE_ARROW = True
 
 
 class SnowflakeExprTranslator(AlchemyExprTranslator):
@@ -60,6 +61,7 @@ class Backend(BaseAlchemyBackend):
         password: str,
         account: str,
         database: str,
+        pool_size: int = 5,
         **kwargs,
     ):
         dbparams = dict(zip(("database", "schema"), database.split("/", 1)))
@@ -76,7 +78,7 @@ class Backend(BaseAlchemyBackend):
             **kwargs,
         )
         self.database_name = dbparams["database"]
-        return super().do_connect(sa.create_engine(url))
+        return super().do_connect(sa.create_engine(url, pool_size=pool_size))
 
     def _get_sqla_table(
         self, name: str, schema: str | None = None, **_: Any
@@ -111,6 +113,22 @@ class Backend(BaseAlchemyBackend):
                 return schema.apply_to(df)
         return super().fetch_from_cursor(cursor, schema)
 
+    def _fetch_record_batches(self, cursor, schema: sch.Schema, chunk_size: int):
+        global _NATIVE_ARROW
+
+        if _NATIVE_ARROW:
+            try:
+                tables = cursor.cursor.fetch_arrow_batches()
+            except sfc.NotSupportedError:
+                _NATIVE_ARROW = False
+            else:
+                target = schema.to_pyarrow()
+                for table in tables:
+                    table = table.rename_columns(target.names).cast(target)
+                    yield from table.to_batches(max_chunksize=chunk_size)
+                return
+        yield from super()._fetch_record_batches(cursor, schema, chunk_size)
+
     def _get_schema_using_query(self, query):
         with self.begin() as bind:
             result = bind.execute(f"SELECT * FROM ({query}) t0 LIMIT 0")
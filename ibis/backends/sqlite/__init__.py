@@ -29,6 +29,7 @@ if TYPE_CHECKING:
 
 import ibis.expr.schema as sch
 from ibis.backends.base import Database
+from ibis.backends.base.sql import _file_version
 from ibis.backends.base.sql.alchemy import BaseAlchemyBackend, to_sqla_type
 from ibis.backends.sqlite import udf
 from ibis.backends.sqlite.compiler import SQLiteCompiler
@@ -120,9 +121,16 @@ class Backend(BaseAlchemyBackend):
 
         self.database_name = "main"
 
-        engine = sa.create_engine(
-            f"sqlite:///{database if database is not None else ':memory:'}"
-        )
+        if database is None or database == ":memory:":
+            # a single connection shared by all threads, otherwise every
+            # thread would see its own empty in-memory database
+            engine = sa.create_engine(
+                "sqlite:///:memory:",
+                connect_args=dict(check_same_thread=False),
+                poolclass=sa.pool.StaticPool,
+            )
+        else:
+            engine = sa.create_engine(f"sqlite:///{database}")
 
         if type_map:
             # Patch out ischema_names for the instantiated dialect. This
@@ -174,6 +182,29 @@ class Backend(BaseAlchemyBackend):
         quoted_name = self.con.dialect.identifier_preparer.quote(name)
         self.raw_sql(f"ATTACH DATABASE {path!r} AS {quoted_name}")
 
+    def _table_versions(self, tables):
+        quote = self.con.dialect.identifier_preparer.quote
+        with self.begin() as con:
+            files = [file for _, _, file in con.execute("PRAGMA database_list")]
+            for table in tables:
+                schema = quote(table.sqla_table.schema or "main")
+                sql = con.execute(
+                    sa.text(
+                        f"SELECT sql FROM {schema}.sqlite_master "
+                        "WHERE type = 'table' AND name = :name"
+                    ),
+                    dict(name=table.name),
+                ).scalar()
+                # views and virtual tables can read data that isn't stored in
+                # the database files
+                if sql is None or sql.upper().startswith("CREATE VIRTUAL"):
+                    return None
+        # in-memory and temporary databases have no file
+        if not all(files):
+            return None
+        versions = tuple(map(_file_version, files))
+        return None if None in versions else versions
+
     def _get_sqla_table(self, name, schema=None, autoload=True):
         return sa.Table(
             name,
@@ -197,7 +228,7 @@ class Backend(BaseAlchemyBackend):
         Table
             Table expression
         """
-        alch_table = self._get_sqla_table(name, schema=database)
+        alch_table = self._cached_sqla_table(name, schema=database)
         node = self.table_class(source=self, sqla_table=alch_table)
         return self.table_expr_class(node)
 
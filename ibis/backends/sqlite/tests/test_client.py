@@ -1,3 +1,4 @@
+import asyncio
 import uuid
 
 import numpy as np
@@ -105,3 +106,70 @@ def test_table_inequality(dbpath):
 
     assert batting.op() != functional_alltypes.op()
     assert not batting.equals(functional_alltypes)
+
+
+def test_to_pyarrow_batches_chunk_size():
+    pa = pytest.importorskip("pyarrow")
+    pd = pytest.importorskip("pandas")
+
+    con = ibis.sqlite.connect()
+    con.create_table(
+        "t", pd.DataFrame({"a": range(10), "b": list("abcdefghij"), "c": 0.5})
+    )
+    t = con.table("t")
+
+    reader = con.to_pyarrow_batches(t.filter(t.a >= 1), chunk_size=4)
+    assert reader.schema == t.schema().to_pyarrow()
+
+    batches = list(reader)
+    assert [batch.num_rows for batch in batches] == [4, 4, 1]
+
+    result = pa.Table.from_batches(batches)
+    assert result["a"].to_pylist() == list(range(1, 10))
+    assert result["b"].to_pylist() == list("bcdefghij")
+
+    empty = con.to_pyarrow_batches(t.filter(t.a > 100), chunk_size=4)
+    assert empty.read_all().num_rows == 0
+
+
+def test_result_cache(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "test.db"
+    with sqlite3.connect(path) as raw:
+        raw.execute("CREATE TABLE t (a INTEGER)")
+        raw.executemany("INSERT INTO t VALUES (?)", [(1,), (2,)])
+
+    options = {
+        "sql.result_cache.enabled": True,
+        "sql.result_cache.path": str(tmp_path / "results"),
+    }
+    with config.options(options):
+        con = ibis.sqlite.connect(path)
+        expr = con.table("t").a.sum()
+        assert con.execute(expr) == 3
+        assert con.execute(expr) == 3
+        assert con.result_cache_info().hits == 1
+
+        with sqlite3.connect(path) as raw:
+            raw.execute("INSERT INTO t VALUES (10)")
+        assert con.execute(expr) == 13
+
+        # views are only versioned through the tables they read
+        con.raw_sql("CREATE VIEW v AS SELECT * FROM t")
+        view = con.table("v")
+        currsize = con.result_cache_info().currsize
+        assert con.execute(view.a.sum()) == 13
+        assert con.result_cache_info().currsize == currsize
+
+
+def test_execute_many_in_memory():
+    con = ibis.sqlite.connect()
+    con.raw_sql("CREATE TABLE t (a INTEGER)")
+    con.raw_sql("INSERT INTO t VALUES (1), (2)")
+    t = con.table("t")
+
+    # all threads share the single connection to the in-memory database
+    assert con._max_concurrency() == 1
+    assert con.execute_many([t.a.sum(), t.a.max(), t.count()]) == [3, 2, 2]
+    assert asyncio.run(con.execute_async(t.a.min())) == 1
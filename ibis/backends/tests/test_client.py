@@ -63,6 +63,25 @@ def test_load_data_sqlalchemy(alchemy_backend, alchemy_con, alchemy_temp_table):
     alchemy_backend.assert_frame_equal(df, result)
 
 
+@pytest.mark.notimpl(["snowflake"])
+def test_load_data_sqlalchemy_record_batches(
+    alchemy_backend, alchemy_con, alchemy_temp_table
+):
+    pa = pytest.importorskip("pyarrow")
+
+    df = pd.DataFrame(
+        {
+            'first_name': ['A', 'B', None, 'D', ''],
+            'salary': [100.0, 200.0, 300.0, None, 500.0],
+        }
+    )
+    batches = pa.Table.from_pandas(df, preserve_index=False).to_batches(2)
+    alchemy_con.load_data(alchemy_temp_table, iter(batches))
+    result = alchemy_con.table(alchemy_temp_table).execute()
+
+    alchemy_backend.assert_frame_equal(df, result)
+
+
 @mark.parametrize(
     ('expr_fn', 'expected'),
     [
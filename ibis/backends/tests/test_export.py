@@ -39,7 +39,6 @@ limit = [
                     # limit not implemented for pandas backend execution
                     "bigquery",
                     "clickhouse",
-                    "dask",
                     "datafusion",
                     "impala",
                     "pandas",
@@ -59,7 +58,6 @@ no_limit = [
                 [
                     "bigquery",
                     "clickhouse",
-                    "dask",
                     "impala",
                     "pyspark",
                 ]
@@ -136,14 +134,14 @@ def test_scalar_to_pyarrow_scalar(limit, awards_players):
     assert isinstance(scalar, pa.Scalar)
 
 
-@pytest.mark.notimpl(["bigquery", "dask", "clickhouse", "impala", "pyspark"])
+@pytest.mark.notimpl(["bigquery", "clickhouse", "impala", "pyspark"])
 def test_table_to_pyarrow_table_schema(awards_players):
     table = awards_players.to_pyarrow()
     assert isinstance(table, pa.Table)
     assert table.schema == awards_players.schema().to_pyarrow()
 
 
-@pytest.mark.notimpl(["bigquery", "dask", "clickhouse", "impala", "pyspark"])
+@pytest.mark.notimpl(["bigquery", "clickhouse", "impala", "pyspark"])
 def test_column_to_pyarrow_table_schema(awards_players):
     expr = awards_players.awardID
     array = expr.to_pyarrow()
@@ -152,7 +150,7 @@ def test_column_to_pyarrow_table_schema(awards_players):
 
 
 @pytest.mark.notimpl(
-    ["bigquery", "pandas", "dask", "clickhouse", "impala", "pyspark", "datafusion"]
+    ["bigquery", "pandas", "clickhouse", "impala", "pyspark", "datafusion"]
 )
 def test_table_pyarrow_batch_chunk_size(awards_players):
     batch_reader = awards_players.to_pyarrow_batches(limit=2050, chunk_size=2048)
@@ -163,7 +161,7 @@ def test_table_pyarrow_batch_chunk_size(awards_players):
 
 
 @pytest.mark.notimpl(
-    ["bigquery", "pandas", "dask", "clickhouse", "impala", "pyspark", "datafusion"]
+    ["bigquery", "pandas", "clickhouse", "impala", "pyspark", "datafusion"]
 )
 def test_column_pyarrow_batch_chunk_size(awards_players):
     batch_reader = awards_players.awardID.to_pyarrow_batches(
@@ -176,7 +174,7 @@ def test_column_pyarrow_batch_chunk_size(awards_players):
 
 
 @pytest.mark.notimpl(
-    ["bigquery", "pandas", "dask", "clickhouse", "impala", "pyspark", "datafusion"]
+    ["bigquery", "pandas", "clickhouse", "impala", "pyspark", "datafusion"]
 )
 @pytest.mark.broken(
     ["sqlite"],
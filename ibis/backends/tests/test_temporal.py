@@ -791,7 +791,6 @@ def test_now(con):
     assert result_strftime == expected_strftime
 
 
-@pytest.mark.notimpl(["dask"], reason="Limit #2553")
 @pytest.mark.notimpl(["datafusion", "snowflake", "polars"])
 def test_now_from_projection(alltypes):
     n = 5
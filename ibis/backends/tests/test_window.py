@@ -532,9 +532,6 @@ def test_grouped_unbounded_window(
             lambda df: df.float_col.shift(1),
             True,
             id='ordered-lag',
-            marks=[
-                pytest.mark.notimpl(["dask"]),
-            ],
         ),
         param(
             lambda t, win: t.float_col.lag().over(win),
@@ -558,7 +555,7 @@ def test_grouped_unbounded_window(
             lambda df: df.float_col.shift(-1),
             True,
             id='ordered-lead',
-            marks=pytest.mark.notimpl(["dask", "clickhouse"]),
+            marks=pytest.mark.notimpl(["clickhouse"]),
         ),
         param(
             lambda t, win: t.float_col.lead().over(win),
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 import inspect
-from typing import Any
+import keyword
+from typing import Any, Callable
 
 from ibis.common.validators import option
 from ibis.util import DotDict
@@ -211,6 +212,56 @@ class Signature(inspect.Signature):
 
         return this
 
+    def compile(self) -> Callable[..., DotDict]:
+        """Generate a faster equivalent of `validate` for this signature.
+
+        The arguments are bound by a function generated with the same
+        parameters as the signature, so binding happens in the interpreter
+        instead of `inspect.Signature.bind`. The validators and defaults are
+        looked up once, when compiling. Calls which fail to bind are passed to
+        `validate` to raise the same errors.
+
+        Returns
+        -------
+        validate : callable
+            Function with the same semantics as `validate`.
+        """
+        params = tuple(self.parameters.values())
+        names = tuple(param.name for param in params)
+        if not all(
+            name.isidentifier() and not keyword.iskeyword(name) for name in names
+        ):
+            return self.validate
+
+        args = ", ".join(
+            name if param.default is EMPTY else f"{name}=_defaults[{i:d}]"
+            for i, (name, param) in enumerate(zip(names, params))
+        )
+        values = "".join(f"{name}, " for name in names)
+        source = f"def bind({args}):\n    return ({values})\n"
+        namespace = {"_defaults": tuple(param.default for param in params)}
+        exec(source, namespace)
+        bind = namespace["bind"]
+
+        fields = tuple((param.name, param.annotation) for param in params)
+        fallback = self.validate
+
+        def validate(*args, **kwargs):
+            try:
+                values = bind(*args, **kwargs)
+            except TypeError:
+                return fallback(*args, **kwargs)
+
+            this = DotDict()
+            for (name, validator), value in zip(fields, values):
+                if validator is None:
+                    this[name] = value
+                else:
+                    this[name] = validator(value, this=this)
+            return this
+
+        return validate
+
 
 # aliases for convenience
 attribute = Attribute
@@ -1,7 +1,18 @@
 from __future__ import annotations
 
+import contextlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
 import weakref
-from typing import MutableMapping
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+from typing import TYPE_CHECKING, MutableMapping
+
+if TYPE_CHECKING:
+    import pyarrow as pa
 
 
 class WeakCache(MutableMapping):
@@ -47,3 +58,281 @@ class WeakCache(MutableMapping):
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self._data})"
+
+
+CacheInfo = namedtuple("CacheInfo", ("hits", "misses", "maxsize", "currsize"))
+
+
+class LRUCache(MutableMapping):
+    """Bounded mapping evicting the least recently used entries.
+
+    Parameters
+    ----------
+    maxsize
+        Maximum number of entries to keep, `None` means unbounded.
+    ttl
+        Number of seconds after which an entry expires, `None` means entries
+        never expire.
+    """
+
+    __slots__ = ('_data', '_lock', 'maxsize', 'ttl', 'hits', 'misses')
+
+    def __init__(self, maxsize: int | None = 128, ttl: float | None = None):
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __iter__(self):
+        return iter(list(self._data))
+
+    def __contains__(self, key):
+        with self._lock:
+            try:
+                _, expires = self._data[key]
+            except KeyError:
+                return False
+            return expires is None or expires > time.monotonic()
+
+    def __getitem__(self, key):
+        with self._lock:
+            try:
+                value, expires = self._data[key]
+            except KeyError:
+                self.misses += 1
+                raise
+
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                raise KeyError(key)
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key, value):
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._data[key] = (value, expires)
+            self._data.move_to_end(key)
+            if self.maxsize is not None:
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the hit and miss statistics of the cache."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.info()})"
+
+
+class PersistentCache(MutableMapping):
+    """String keyed mapping persisted into an SQLite database file.
+
+    The file can be shared between processes, values are pickled. Entries
+    that fail to unpickle are treated as missing.
+
+    Parameters
+    ----------
+    path
+        Location of the database file, created if it doesn't exist.
+    ttl
+        Number of seconds after which an entry expires, `None` means entries
+        never expire.
+    """
+
+    def __init__(self, path: str | Path, ttl: float | None = None):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._con = sqlite3.connect(
+            str(self.path), isolation_level=None, check_same_thread=False
+        )
+        self._con.execute(
+            "CREATE TABLE IF NOT EXISTS entries "
+            "(key TEXT PRIMARY KEY, value BLOB, created REAL)"
+        )
+
+    def _is_expired(self, created):
+        return self.ttl is not None and created + self.ttl <= time.time()
+
+    def __len__(self):
+        (count,) = self._con.execute("SELECT count(*) FROM entries").fetchone()
+        return count
+
+    def __iter__(self):
+        rows = self._con.execute("SELECT key FROM entries").fetchall()
+        return (key for (key,) in rows)
+
+    def __getitem__(self, key: str):
+        row = self._con.execute(
+            "SELECT value, created FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(key)
+
+        value, created = row
+        if self._is_expired(created):
+            del self[key]
+            raise KeyError(key)
+        try:
+            return pickle.loads(value)
+        except Exception:
+            # written by an incompatible version of a library
+            del self[key]
+            raise KeyError(key)
+
+    def __setitem__(self, key: str, value):
+        self._con.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?)",
+            (key, pickle.dumps(value), time.time()),
+        )
+
+    def __delitem__(self, key: str):
+        self._con.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def clear(self):
+        self._con.execute("DELETE FROM entries")
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({str(self.path)!r})"
+
+
+class ArrowFileCache(MutableMapping):
+    """String keyed mapping of pyarrow tables stored as Arrow IPC files.
+
+    Tables are memory mapped when read back. Once the files take more than
+    `max_bytes` the least recently used ones are removed. Recency is tracked
+    through the modification time of the files, so the directory can be
+    shared between processes.
+
+    Parameters
+    ----------
+    path
+        Directory holding the files, created when the first table is stored.
+    max_bytes
+        Maximum total size of the files, `None` means unbounded.
+    """
+
+    suffix = ".arrow"
+
+    def __init__(self, path: str | Path, max_bytes: int | None = None):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}{self.suffix}"
+
+    def _entries(self) -> list[tuple[int, int, Path]]:
+        entries = []
+        for file in self.path.glob(f"*{self.suffix}"):
+            try:
+                stat = file.stat()
+            except FileNotFoundError:
+                # removed concurrently
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, file))
+        return entries
+
+    def __len__(self):
+        return len(self._entries())
+
+    def __iter__(self):
+        return (file.stem for *_, file in self._entries())
+
+    def __getitem__(self, key: str) -> pa.Table:
+        import pyarrow as pa
+
+        file = self._file(key)
+        try:
+            source = pa.memory_map(str(file))
+        except FileNotFoundError:
+            self.misses += 1
+            raise KeyError(key)
+
+        table = pa.ipc.open_file(source).read_all()
+        with contextlib.suppress(FileNotFoundError):
+            self._touch(file)
+        self.hits += 1
+        return table
+
+    def __setitem__(self, key: str, table: pa.Table):
+        import pyarrow as pa
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        file = self._file(key)
+        # write to a temporary file first so that readers never observe a
+        # partially written entry
+        tmp = file.with_name(f".{file.name}.{os.getpid()}.{threading.get_ident()}")
+        with pa.OSFile(str(tmp), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, file)
+        self._touch(file)
+        self._evict()
+
+    @staticmethod
+    def _touch(file: Path) -> None:
+        # mark the entry as recently used, the timestamp is set explicitly
+        # because file systems record modification times at a coarser grain
+        now = time.time_ns()
+        os.utime(file, ns=(now, now))
+
+    def __delitem__(self, key: str):
+        try:
+            self._file(key).unlink()
+        except FileNotFoundError:
+            raise KeyError(key)
+
+    def _evict(self):
+        if self.max_bytes is None:
+            return
+
+        with self._lock:
+            entries = sorted(self._entries(), key=lambda entry: entry[0])
+            total = sum(size for _, size, _ in entries)
+            for _, size, file in entries:
+                if total <= self.max_bytes:
+                    break
+                with contextlib.suppress(FileNotFoundError):
+                    file.unlink()
+                total -= size
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the stored tables in bytes."""
+        return sum(size for _, size, _ in self._entries())
+
+    def clear(self):
+        for *_, file in self._entries():
+            with contextlib.suppress(FileNotFoundError):
+                file.unlink()
+        self.hits = self.misses = 0
+
+    def info(self) -> CacheInfo:
+        """Return the hit and miss statistics of the cache.
+
+        `maxsize` and `currsize` are expressed in bytes.
+        """
+        return CacheInfo(self.hits, self.misses, self.max_bytes, self.nbytes)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({str(self.path)!r}, {self.info()})"
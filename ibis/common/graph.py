@@ -13,6 +13,9 @@ def _flatten_collections(node, filter):
     We treat common collection types inherently traversable (e.g. list, tuple, dict)
     but as undesired in a graph representation, so we traverse them implicitly.
 
+    The traversal uses an explicit stack instead of recursive generators, so the
+    cost doesn't grow with the nesting depth of the collections.
+
     Parameters
     ----------
     node : Any
@@ -24,17 +27,19 @@ def _flatten_collections(node, filter):
     -------
     Iterator : Any
     """
-    if isinstance(node, filter):
-        yield node
-    elif isinstance(node, (str, bytes)):
-        pass
-    elif isinstance(node, Sequence):
-        for item in node:
-            yield from _flatten_collections(item, filter)
-    elif isinstance(node, Mapping):
-        for key, value in node.items():
-            yield from _flatten_collections(key, filter)
-            yield from _flatten_collections(value, filter)
+    stack = [node]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, filter):
+            yield item
+        elif isinstance(item, (str, bytes)):
+            continue
+        elif isinstance(item, Sequence):
+            stack.extend(reversed(item))
+        elif isinstance(item, Mapping):
+            for key, value in reversed(list(item.items())):
+                stack.append(value)
+                stack.append(key)
 
 
 class Traversable(Hashable):
@@ -46,10 +51,17 @@ class Traversable(Hashable):
     def __children__(self) -> Sequence:
         ...
 
+    def __flattened_children__(self, filter) -> tuple:
+        """Return the flattened children of the node matching `filter`.
+
+        Subclasses may override this to cache the result.
+        """
+        return tuple(_flatten_collections(self.__children__, filter))
+
 
 def children(node, filter=Traversable):
     # TODO(kszucs): perhaps this should be a set instead of a tuple
-    return tuple(_flatten_collections(node.__children__, filter))
+    return node.__flattened_children__(filter)
 
 
 class Graph(Dict[Traversable, Sequence[Traversable]]):
@@ -104,8 +116,14 @@ class Graph(Dict[Traversable, Sequence[Traversable]]):
         return self.__class__({k: tuple(v) for k, v in result.items()})
 
     def toposort(self) -> Graph:
-        dependents = self.invert()
-        in_degree = {k: len(v) for k, v in self.items()}
+        # collect the dependents in plain lists rather than constructing a
+        # whole inverted graph
+        dependents = {node: [] for node in self.keys()}
+        in_degree = {}
+        for node, dependencies in self.items():
+            in_degree[node] = len(dependencies)
+            for dependency in dependencies:
+                dependents[dependency].append(node)
 
         queue = deque(node for node, count in in_degree.items() if not count)
         result = self.__class__()
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import contextlib
 from abc import ABCMeta, abstractmethod
+from collections.abc import Mapping
 from copy import copy
 from typing import Any
 from weakref import WeakValueDictionary
 
 from ibis.common.annotations import Argument, Attribute, Signature, attribute
 from ibis.common.caching import WeakCache
-from ibis.common.graph import Graph, Traversable
+from ibis.common.graph import Traversable, children
 from ibis.common.typing import evaluate_typehint
 from ibis.common.validators import Validator
 from ibis.util import frozendict, recursive_get
@@ -86,12 +88,21 @@ class AnnotableMeta(BaseMeta):
         signature = Signature.merge(*signatures, **arguments)
         argnames = tuple(signature.parameters.keys())
 
+        initializers = tuple(
+            (name, attrib)
+            for name, attrib in attributes.items()
+            if isinstance(attrib, Attribute)
+        )
+
         namespace.update(
             __argnames__=argnames,
             __attributes__=attributes,
+            __initializers__=initializers,
             __match_args__=argnames,
             __signature__=signature,
             __slots__=tuple(slots),
+            # compiled from the signature on the first instantiation
+            __validate__=None,
         )
         return super().__new__(metacls, clsname, bases, namespace, **kwargs)
 
@@ -102,9 +113,16 @@ class Annotable(Base, metaclass=AnnotableMeta):
     @classmethod
     def __create__(cls, *args, **kwargs) -> Annotable:
         # construct the instance by passing the validated keyword arguments
-        kwargs = cls.__signature__.validate(*args, **kwargs)
+        kwargs = cls.__validate_arguments__(*args, **kwargs)
         return super().__create__(**kwargs)
 
+    @classmethod
+    def __validate_arguments__(cls, *args, **kwargs):
+        if (validate := cls.__validate__) is None:
+            validate = cls.__signature__.compile()
+            cls.__validate__ = staticmethod(validate)
+        return validate(*args, **kwargs)
+
     def __init__(self, **kwargs) -> None:
         # set the already validated fields using object.__setattr__
         for name, value in kwargs.items():
@@ -113,11 +131,10 @@ class Annotable(Base, metaclass=AnnotableMeta):
         self.__post_init__()
 
     def __post_init__(self) -> None:
-        for name, field in self.__attributes__.items():
-            if isinstance(field, Attribute):
-                value = field.initialize(self)
-                if value is not None:
-                    object.__setattr__(self, name, value)
+        for name, field in self.__initializers__:
+            value = field.initialize(self)
+            if value is not None:
+                object.__setattr__(self, name, value)
 
     def __setattr__(self, name, value) -> None:
         if field := self.__attributes__.get(name):
@@ -230,9 +247,88 @@ class Comparable(Base):
         return result
 
 
+def set_interning(enabled: bool) -> bool:
+    """Enable or disable hash-consing of `Concrete` instances.
+
+    If enabled, constructing an instance equal to an already existing one
+    returns the existing instance, so equality checks of structurally equal
+    instances reduce to identity checks and repeated subtrees are stored only
+    once.
+
+    Parameters
+    ----------
+    enabled
+        Whether to intern the newly constructed instances.
+
+    Returns
+    -------
+    bool
+        Whether interning was enabled before the call.
+    """
+    previous = Concrete.__interned__ is not None
+    if enabled and not previous:
+        Concrete.__interned__ = WeakValueDictionary()
+    elif not enabled:
+        Concrete.__interned__ = None
+    return previous
+
+
+def _type_key(value: Any) -> Any:
+    """Return the types of `value` and of the values it's composed of."""
+    if isinstance(value, Concrete):
+        # interned instances are canonical, so their identity tells apart equal
+        # instances constructed from differently typed arguments
+        return id(value)
+    elif isinstance(value, (tuple, list, frozenset, set)):
+        return type(value), tuple(map(_type_key, value))
+    elif isinstance(value, Mapping):
+        items = tuple((_type_key(k), _type_key(v)) for k, v in value.items())
+        return type(value), items
+    return type(value)
+
+
+@contextlib.contextmanager
+def interning(enabled: bool = True):
+    """Context manager to temporarily enable or disable hash-consing."""
+    previous = set_interning(enabled)
+    try:
+        yield
+    finally:
+        set_interning(previous)
+
+
 class Concrete(Immutable, Comparable, Annotable, Traversable):
     """Opinionated base class for immutable data classes."""
 
+    __slots__ = ('__children_cache__',)
+
+    # table of the interned instances, None if hash-consing is disabled
+    __interned__ = None
+
+    @classmethod
+    def __create__(cls, *args, **kwargs) -> Concrete:
+        interned = Concrete.__interned__
+        if interned is None or issubclass(cls, Singleton):
+            return super().__create__(*args, **kwargs)
+
+        # the argument types are part of the key to prevent returning an
+        # instance constructed from equal but differently typed values, e.g.
+        # 1 and 1.0 or (1,) and (1.0,)
+        kwargs = cls.__validate_arguments__(*args, **kwargs)
+        if cls.__init__ is Annotable.__init__:
+            values = tuple(kwargs.values())
+            key = (cls, values, _type_key(values))
+            try:
+                return interned[key]
+            except KeyError:
+                pass
+
+        # custom __init__ methods may alter the arguments so the instance can
+        # only be looked up after construction
+        instance = type.__call__(cls, **kwargs)
+        args = instance.__args__
+        return interned.setdefault((cls, args, _type_key(args)), instance)
+
     @attribute.default
     def __args__(self):
         return tuple(getattr(self, name) for name in self.__argnames__)
@@ -256,6 +352,20 @@ class Concrete(Immutable, Comparable, Annotable, Traversable):
     def __children__(self):
         return self.__args__
 
+    def __flattened_children__(self, filter):
+        # the instances are immutable, so the flattened children can be
+        # computed once per filter type and reused by every traversal
+        try:
+            cache = self.__children_cache__
+        except AttributeError:
+            cache = {}
+            object.__setattr__(self, '__children_cache__', cache)
+        try:
+            return cache[filter]
+        except KeyError:
+            result = cache[filter] = super().__flattened_children__(filter)
+            return result
+
     @property
     def args(self):
         return self.__args__
@@ -269,10 +379,24 @@ class Concrete(Immutable, Comparable, Annotable, Traversable):
         if filter is None:
             filter = Concrete
 
+        # single pass post-order traversal, every node is visited after its
+        # children so the results of the children are available
         results = {}
-        for node in Graph.from_bfs(self, filter=filter).toposort():
-            kwargs = recursive_get(node.__getstate__(), results)
-            results[node] = fn(node, **kwargs)
+        stack = [(self, False)]
+        while stack:
+            node, expanded = stack.pop()
+            if node in results:
+                continue
+            if expanded:
+                kwargs = recursive_get(node.__getstate__(), results)
+                results[node] = fn(node, **kwargs)
+            else:
+                stack.append((node, True))
+                stack.extend(
+                    (child, False)
+                    for child in reversed(children(node, filter))
+                    if child not in results
+                )
 
         return results
 
@@ -154,3 +154,47 @@ def test_signature_unbind_with_empty_variadic(d):
 
     params_again = sig.validate(**kwargs)
     assert params_again == params
+
+
+@pytest.mark.parametrize(
+    ('args', 'kwargs'),
+    [
+        ((1, 2), {}),
+        ((1, 2, 3, (4,), 5), {}),
+        ((1,), {'b': 2, 'e': 5}),
+        ((), {'e': 5, 'd': [1], 'b': 2, 'a': 1}),
+    ],
+)
+def test_signature_compile(args, kwargs):
+    validate = sig.compile()
+    assert validate(*args, **kwargs) == sig.validate(*args, **kwargs)
+
+
+@pytest.mark.parametrize(
+    ('args', 'kwargs', 'message'),
+    [
+        ((1,), {}, "missing a required argument: 'b'"),
+        ((1, 2, 3, 4, 5, 6), {}, "too many positional arguments"),
+        ((1, 2), {'a': 1}, "multiple values for argument 'a'"),
+        ((1, 2), {'f': 1}, "got an unexpected keyword argument 'f'"),
+    ],
+)
+def test_signature_compile_errors(args, kwargs, message):
+    validate = sig.compile()
+    with pytest.raises(TypeError, match=message):
+        validate(*args, **kwargs)
+
+
+def test_signature_compile_validator_errors():
+    calls = []
+
+    def fail(x, this):
+        calls.append(x)
+        raise TypeError("invalid")
+
+    param = Parameter('a', annotation=Argument.mandatory(fail))
+    validate = Signature(parameters=[param]).compile()
+    with pytest.raises(TypeError, match="invalid"):
+        validate(1)
+    # errors raised by validators must not be retried as binding errors
+    assert calls == [1]
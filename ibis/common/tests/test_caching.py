@@ -0,0 +1,115 @@
+import pytest
+
+from ibis.common.caching import ArrowFileCache, LRUCache, PersistentCache
+
+
+def test_lru_cache_eviction():
+    cache = LRUCache(maxsize=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache["a"] == 1
+
+    # "b" is the least recently used entry
+    cache["c"] = 3
+    assert set(cache) == {"a", "c"}
+    assert len(cache) == 2
+
+
+def test_lru_cache_statistics():
+    cache = LRUCache(maxsize=4)
+    cache["a"] = 1
+
+    assert cache["a"] == 1
+    with pytest.raises(KeyError):
+        cache["b"]
+
+    info = cache.info()
+    assert info.hits == 1
+    assert info.misses == 1
+    assert info.maxsize == 4
+    assert info.currsize == 1
+
+    cache.clear()
+    assert cache.info() == (0, 0, 4, 0)
+
+
+def test_lru_cache_ttl(mocker):
+    monotonic = mocker.patch("time.monotonic", return_value=0.0)
+
+    cache = LRUCache(maxsize=None, ttl=10)
+    cache["a"] = 1
+    assert "a" in cache
+
+    monotonic.return_value = 11.0
+    assert "a" not in cache
+    with pytest.raises(KeyError):
+        cache["a"]
+    assert not len(cache)
+
+
+def test_persistent_cache(tmp_path):
+    path = tmp_path / "cache.db"
+
+    cache = PersistentCache(path)
+    cache["key"] = "SELECT 1"
+    assert cache["key"] == "SELECT 1"
+    assert list(cache) == ["key"]
+
+    # entries are visible from another instance using the same file
+    other = PersistentCache(path)
+    assert other["key"] == "SELECT 1"
+
+    del other["key"]
+    with pytest.raises(KeyError):
+        cache["key"]
+
+
+def test_persistent_cache_ttl(tmp_path, mocker):
+    time = mocker.patch("time.time", return_value=0.0)
+
+    cache = PersistentCache(tmp_path / "cache.db", ttl=10)
+    cache["key"] = 1
+    assert cache["key"] == 1
+
+    time.return_value = 11.0
+    with pytest.raises(KeyError):
+        cache["key"]
+    assert not len(cache)
+
+
+def test_arrow_file_cache(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+
+    cache = ArrowFileCache(tmp_path)
+    table = pa.table({"a": [1, 2, 3]})
+    cache["key"] = table
+    assert cache["key"].equals(table)
+    assert list(cache) == ["key"]
+
+    # entries are visible from another instance using the same directory
+    other = ArrowFileCache(tmp_path)
+    assert other["key"].equals(table)
+
+    with pytest.raises(KeyError):
+        cache["missing"]
+    assert cache.info()[:2] == (1, 1)
+
+    del cache["key"]
+    assert not len(cache)
+
+
+def test_arrow_file_cache_eviction(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+
+    table = pa.table({"a": list(range(1000))})
+    cache = ArrowFileCache(tmp_path)
+    cache["a"] = table
+    size = cache.nbytes
+
+    cache = ArrowFileCache(tmp_path, max_bytes=2 * size)
+    cache["b"] = table
+    # "b" is now the least recently used entry
+    cache["a"]
+    cache["c"] = table
+    assert set(cache) == {"a", "c"}
+    assert cache.nbytes <= cache.max_bytes
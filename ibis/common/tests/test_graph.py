@@ -91,3 +91,23 @@ def test_nested_children():
     e = Node(name="e", children=[[b, c], d])
 
     assert children(e) == (b, c, d)
+
+
+def test_deeply_nested_children():
+    a = Node(name="a", children=[])
+    b = Node(name="b", children=[])
+    nested = [a]
+    for _ in range(5000):
+        nested = [nested]
+
+    c = Node(name="c", children=[nested, {"key": b}, "string"])
+    assert children(c) == (a, b)
+
+
+def test_mapping_children():
+    a = Node(name="a", children=[])
+    b = Node(name="b", children=[])
+    c = Node(name="c", children=[])
+    d = Node(name="d", children=[{a: b, c: (a,)}])
+
+    assert children(d) == (a, b, c, a)
@@ -21,6 +21,8 @@ from ibis.common.grounds import (
     Concrete,
     Immutable,
     Singleton,
+    interning,
+    set_interning,
 )
 from ibis.common.validators import instance_of, one_of, tuple_of, validator
 from ibis.tests.util import assert_pickle_roundtrip
@@ -224,6 +226,26 @@ def test_signature_inheritance():
     )
 
 
+def test_compiled_validation_is_per_class():
+    class IntBinop(Annotable):
+        left = is_int
+        right = is_int
+
+    class FloatAddRhs(IntBinop):
+        right = is_float
+
+    # the parent is instantiated first, the subclass must not reuse its
+    # compiled validation
+    assert IntBinop(1, 2).right == 2
+    assert FloatAddRhs(1, 2.5).right == 2.5
+    with pytest.raises(TypeError):
+        IntBinop(1, 2.5)
+    with pytest.raises(TypeError):
+        FloatAddRhs(1, 2)
+
+    assert IntBinop.__validate__ is not FloatAddRhs.__validate__
+
+
 def test_positional_argument_reordering():
     class Farm(Annotable):
         ducks = is_int
@@ -721,7 +743,7 @@ def test_concrete():
         object,
     )
 
-    assert Between.__create__.__func__ is Annotable.__create__.__func__
+    assert Between.__create__.__func__ is Concrete.__create__.__func__
     assert Between.__eq__ is Comparable.__eq__
     assert Between.__argnames__ == ("value", "lower", "upper")
 
@@ -791,6 +813,43 @@ def test_concrete_with_traversable_children():
 
     copied = node.copy(arguments=(T, F))
     assert copied == All((T, F), strict=False)
+    assert children(copied) == (T, F)
+
+
+def test_concrete_children_are_cached():
+    class Leaf(Concrete):
+        value = is_int
+
+    class Parent(Concrete):
+        items = tuple_of(instance_of(Leaf))
+
+    a, b = Leaf(1), Leaf(2)
+    node = Parent((a, b))
+    assert children(node) == (a, b)
+    assert children(node) is children(node)
+    assert children(node, Leaf) == (a, b)
+
+
+def test_concrete_map_visits_in_post_order():
+    class Leaf(Concrete):
+        value = is_int
+
+    class Add(Concrete):
+        left = instance_of(Concrete)
+        right = instance_of(Concrete)
+
+    a, b, c = Leaf(1), Leaf(2), Leaf(3)
+    node = Add(Add(a, b), Add(b, c))
+
+    calls = []
+
+    def fn(node, **kwargs):
+        calls.append(node)
+        return node.value if isinstance(node, Leaf) else sum(kwargs.values())
+
+    results = node.map(fn)
+    assert results[node] == 8
+    assert calls == [a, b, Add(a, b), c, Add(b, c), node]
 
 
 def test_composition_of_concrete_and_singleton():
@@ -814,6 +873,66 @@ def test_composition_of_concrete_and_singleton():
     assert SingConc(3) is obj2
 
 
+class Atom(Concrete):
+    value = is_any
+
+
+def test_concrete_interning():
+    with interning():
+        obj = Between(10, lower=5, upper=15)
+        assert Between(10, lower=5, upper=15) is obj
+        assert Between(10, 5, 15) is obj
+        assert Between(11, lower=5, upper=15) is not obj
+
+        # equal but differently typed arguments are not merged
+        a = Atom(1)
+        b = Atom(1.0)
+        assert a == b
+        assert a is not b
+        assert Atom(1) is a
+        assert Atom(1.0) is b
+
+        # neither are nested ones
+        assert Atom((1,)) is not Atom((1.0,))
+        assert Atom(frozendict(a=1)) is not Atom(frozendict(a=1.0))
+        assert Atom(a) is not Atom(b)
+        assert Atom((a,)) is Atom((Atom(1),))
+
+    # instances constructed outside of the context are not interned
+    assert Between(10, lower=5, upper=15) is not obj
+
+
+def test_concrete_interning_custom_init():
+    class Normalized(Concrete):
+        value = is_int
+
+        def __init__(self, value):
+            super().__init__(value=abs(value))
+
+    with interning():
+        obj = Normalized(3)
+        assert Normalized(3) is obj
+        assert Normalized(-3) is obj
+
+
+def test_concrete_interning_garbage_collection():
+    with interning():
+        ref = weakref.ref(Between(10, lower=5, upper=15))
+        assert ref() is None
+
+
+def test_set_interning():
+    assert set_interning(True) is False
+    try:
+        assert set_interning(True) is True
+        with interning(False):
+            assert Between(1) is not Between(1)
+        assert Between(1) is Between(1)
+    finally:
+        assert set_interning(False) is True
+    assert Between(1) is not Between(1)
+
+
 # TODO(kszucs): test that annotable subclasses can use __init_subclass__ kwargs
 
 
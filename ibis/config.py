@@ -53,6 +53,66 @@ class ContextAdjustment(Config):
     time_col: str = "time"
 
 
+class CompileCache(Config):
+    """Options controlling the compiled query cache of SQL backends.
+
+    Attributes
+    ----------
+    maxsize : int
+        Maximum number of compiled queries kept in memory per backend. `0`
+        disables the cache.
+    ttl : float | None
+        Number of seconds after which a cached query is recompiled.
+        [`None`][None] means cached queries never expire.
+    path : str | None
+        Path to an on-disk store where compiled queries are spilled to,
+        allowing reuse across processes. Only used when `maxsize` is nonzero.
+        [`None`][None] means no on-disk store.
+    """
+
+    maxsize: PosInt = 0
+    ttl: Optional[float] = None
+    path: Optional[str] = None
+
+
+class MetadataCache(Config):
+    """Options controlling the table metadata cache of SQLAlchemy backends.
+
+    Attributes
+    ----------
+    ttl : float | None
+        Number of seconds after which the definition of a table is reflected
+        from the database again. [`None`][None] means definitions are kept
+        until they are invalidated.
+    """
+
+    ttl: Optional[float] = None
+
+
+class ResultCache(Config):
+    """Options controlling the query result cache of SQL backends.
+
+    Results are only cached by backends able to tell when the data of a table
+    changes, and never for expressions referencing in-memory tables.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether the results of `execute` and `to_pyarrow` are cached. Caching
+        can be bypassed for a single call by passing `cache=False`.
+    path : str | None
+        Directory where results are stored as Arrow IPC files. [`None`][None]
+        means an `ibis-results` directory in the system's temporary directory.
+    max_bytes : int
+        Maximum total size in bytes of the stored results, the least recently
+        used results are removed first.
+    """
+
+    enabled: bool = False
+    path: Optional[str] = None
+    max_bytes: PosInt = 1 << 30
+
+
 class SQL(Config):
     """SQL-related options.
 
@@ -63,10 +123,19 @@ class SQL(Config):
         explicit limit. [`None`][None] means no limit.
     default_dialect : str
         Dialect to use for printing SQL when the backend cannot be determined.
+    compile_cache : CompileCache
+        Options controlling the compiled query cache.
+    result_cache : ResultCache
+        Options controlling the query result cache.
+    metadata_cache : MetadataCache
+        Options controlling the table metadata cache.
     """
 
     default_limit: Optional[PosInt] = None
     default_dialect: str = "duckdb"
+    compile_cache: CompileCache = CompileCache()
+    result_cache: ResultCache = ResultCache()
+    metadata_cache: MetadataCache = MetadataCache()
 
 
 class Interactive(Config):
@@ -144,6 +213,8 @@ class Options(Config):
         Clickhouse specific options.
     dask : Config | None
         Dask specific options.
+    duckdb : Config | None
+        DuckDB specific options.
     impala : Config | None
         Impala specific options.
     pandas : Config | None
@@ -162,6 +233,7 @@ class Options(Config):
     sql: SQL = SQL()
     clickhouse: Optional[Config] = None
     dask: Optional[Config] = None
+    duckdb: Optional[Config] = None
     impala: Optional[Config] = None
     pandas: Optional[Config] = None
     pyspark: Optional[Config] = None
@@ -757,6 +757,100 @@ def find_predicates(node, flatten=True):
     return list(g.traverse(predicate, node))
 
 
+def _filters_before_reading(node: ops.Node) -> bool:
+    """Return whether every value `node` computes only sees the rows that
+    satisfy its predicates."""
+    if isinstance(node, ops.Aggregation):
+        values = node.predicates
+    elif isinstance(node, ops.Selection):
+        # selections are computed over the unfiltered table
+        values = (*node.predicates, *node.selections)
+    else:
+        return False
+    # reductions and window functions see every row of the table
+    return not any(is_analytic(value) for value in values)
+
+
+def find_scan_pushdowns(
+    node: ops.Node, table: ops.TableNode
+) -> tuple[frozenset[str] | None, tuple[ops.Value, ...]]:
+    """Find what `node` needs from `table`, so that scans of it can be pruned.
+
+    Parameters
+    ----------
+    node
+        The expression reading `table`
+    table
+        The table being scanned
+
+    Returns
+    -------
+    tuple
+        The names of the columns of `table` referenced by `node`, `None` if
+        every column is needed, and the predicates every row of `table` used
+        by `node` satisfies. The predicates still have to be applied after
+        the scan, they only allow skipping data that can't match.
+    """
+    graph = g.Graph.from_bfs(node)
+    if table not in graph:
+        return frozenset(), ()
+    parents = graph.invert()
+
+    def referenced_columns(table):
+        if table == node:
+            return None
+
+        columns = set()
+        for parent in parents[table]:
+            if isinstance(parent, ops.TableColumn):
+                columns.add(parent.name)
+            elif isinstance(parent, ops.CountStar):
+                # counting rows doesn't read any column
+                continue
+            elif isinstance(parent, ops.Selection) and parent.table == table:
+                if table in parent.selections:
+                    return None
+                elif not parent.selections:
+                    # filtering and sorting pass every column through, only
+                    # the ones referenced downstream are needed
+                    if (downstream := referenced_columns(parent)) is None:
+                        return None
+                    columns |= downstream
+            elif not (isinstance(parent, ops.Aggregation) and parent.table == table):
+                return None
+        return columns
+
+    columns = referenced_columns(table)
+    consumers = {
+        parent
+        for parent in parents[table]
+        if not isinstance(parent, (ops.TableColumn, ops.CountStar))
+    }
+
+    predicates = ()
+    if len(consumers) == 1:
+        (consumer,) = consumers
+        if _filters_before_reading(consumer):
+            # the rows of the table must not be visible anywhere else, check
+            # that everything derived from its columns stays in the consumer
+            inside = set(g.Graph.from_bfs(consumer))
+            stack = [parent for parent in parents[table] if parent != consumer]
+            seen = set()
+            while stack:
+                if (current := stack.pop()) in seen or current == consumer:
+                    continue
+                if current not in inside:
+                    break
+                seen.add(current)
+                stack.extend(parents[current])
+            else:
+                predicates = tuple(
+                    toolz.concat(map(flatten_predicate, consumer.predicates))
+                )
+
+    return (None if columns is None else frozenset(columns)), predicates
+
+
 def find_subqueries(node: ops.Node) -> Counter:
     counts = Counter()
 
@@ -6,6 +6,7 @@ import datetime
 import functools
 import itertools
 import operator
+import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Iterable, Literal, Mapping, Sequence
 from typing import Tuple as _Tuple
@@ -114,6 +115,7 @@ from ibis.expr.window import (
 
 if TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
 
 __all__ = (
     'aggregate',
@@ -389,7 +391,12 @@ def memtable(
     Parameters
     ----------
     data
-        Any data accepted by the `pandas.DataFrame` constructor.
+        Any data accepted by the `pandas.DataFrame` constructor, or a
+        `pyarrow.Table`.
+
+        A `pyarrow.Table` is used as is, so a table memory-mapped from an
+        Arrow IPC file is read lazily and handed to backends supporting Arrow
+        without copies.
 
         The use of `DataFrame` underneath should **not** be relied upon and is
         free to change across non-major releases.
@@ -450,6 +457,12 @@ def memtable(
              col0 col1
           0     1  foo
           1     2  baz
+
+    Create a table from an Arrow IPC file, memory-mapping its contents
+
+    >>> import pyarrow as pa
+    >>> with pa.memory_map("data.arrow") as source:  # doctest: +SKIP
+    ...     t = ibis.memtable(pa.ipc.open_file(source).read_all())
     """
     import pandas as pd
 
@@ -458,6 +471,10 @@ def memtable(
             "passing `columns` and schema` is ambiguous; "
             "pass one or the other but not both"
         )
+    if (pa := sys.modules.get("pyarrow")) is not None and isinstance(data, pa.Table):
+        return _memtable_from_pyarrow_table(
+            data, columns=columns, name=name, schema=schema
+        )
     df = pd.DataFrame(data, columns=columns)
     if df.columns.inferred_type != "string":
         cols = df.columns
@@ -489,6 +506,33 @@ def _memtable_from_dataframe(
     return op.to_expr()
 
 
+def _memtable_from_pyarrow_table(
+    data: pa.Table,
+    *,
+    columns: Iterable[str] | None = None,
+    name: str | None = None,
+    schema: SupportsSchema | None = None,
+) -> Table:
+    from ibis.backends.pyarrow import PyArrowInMemoryTable, PyArrowTableProxy
+    from ibis.backends.pyarrow.datatypes import from_pyarrow_schema
+
+    if columns is not None:
+        data = data.rename_columns(list(columns))
+    if schema is None:
+        schema = from_pyarrow_schema(data.schema)
+    else:
+        schema = sch.schema(schema)
+        if not (target := schema.to_pyarrow()).equals(data.schema):
+            data = data.rename_columns(schema.names).cast(target)
+
+    op = PyArrowInMemoryTable(
+        name=name if name is not None else next(_gen_memtable_name),
+        schema=schema,
+        data=PyArrowTableProxy(data),
+    )
+    return op.to_expr()
+
+
 def _sort_order(expr, order: Literal["desc", "asc"]):
     method = operator.methodcaller(order)
     if isinstance(expr, str):
@@ -9,7 +9,7 @@ import ibis.expr.operations as ops
 import ibis.expr.schema as sch
 import ibis.expr.types as ir
 from ibis.common.graph import Graph
-from ibis.util import experimental
+from ibis.util import experimental, recursive_get
 
 _method_overrides = {
     ops.CountDistinct: "nunique",
@@ -171,8 +171,10 @@ def aggregation(op, table, by, metrics, predicates, having, sort_keys):
 
 
 @translate.register(ops.Join)
-def join(op, left, right, predicates):
+def join(op, left, right, predicates, hint=None):
     method = _get_method_name(op)
+    if hint is not None:
+        return f"{left}.{method}({right}, {_try_unwrap(predicates)}, hint={hint!r})"
     return f"{left}.{method}({right}, {_try_unwrap(predicates)})"
 
 
@@ -375,7 +377,8 @@ def decompile(node, render_import=True, assign_result_to='result', format=False)
 
     out = io.StringIO()
     ctx = CodeContext(assign_result_to=assign_result_to)
-    dependents = Graph(node).invert()
+    graph = Graph(node)
+    dependents = graph.invert()
 
     def fn(node, *args, **kwargs):
         code = translate(node, *args, **kwargs)
@@ -387,7 +390,12 @@ def decompile(node, render_import=True, assign_result_to='result', format=False)
 
         return result
 
-    node.map(fn)
+    # the statements are emitted in topological order of the graph, so walk
+    # the toposorted graph instead of relying on the visiting order of map
+    results = {}
+    for node in graph.toposort():
+        kwargs = recursive_get(node.__getstate__(), results)
+        results[node] = fn(node, **kwargs)
 
     result = out.getvalue()
     if render_import:
@@ -142,6 +142,9 @@ class Join(TableNode):
     left = rlz.table
     right = rlz.table
     predicates = rlz.optional(lambda x, this: x, default=())
+    # how backends with several join algorithms should execute the join,
+    # ignored by the others
+    hint = rlz.optional(rlz.isin({"broadcast", "shuffle"}))
 
     def __init__(self, left, right, predicates, **kwargs):
         # TODO(kszucs): predicates should be already a list of operations, need
@@ -177,15 +177,28 @@ class Scope:
         for op in self:
             result._items[op] = self._items[op]
 
+        result.update(other_scope, overwrite)
+        return result
+
+    def update(self, other_scope: Scope, overwrite=False) -> None:
+        """Merge items in other_scope into this scope, in place.
+
+        Parameters
+        ----------
+        other_scope: Scope
+            Scope to be merged with
+        overwrite: bool
+            if set to be True, force overwrite `value` if `op` already
+            exists.
+        """
         for op in other_scope:
             # if get_scope returns a not None value, then data is already
             # cached in scope and it is at least a greater range than
             # the current timecontext, so we drop the item. Otherwise
             # add it into scope.
             v = other_scope._items[op]
-            if overwrite or result.get_value(op, v.timecontext) is None:
-                result._items[op] = v
-        return result
+            if overwrite or self.get_value(op, v.timecontext) is None:
+                self._items[op] = v
 
     def merge_scopes(self, other_scopes: Iterable[Scope], overwrite=False) -> Scope:
         """merge items in other_scopes into this scope.
@@ -58,6 +58,7 @@ def _regular_join_method(
             str | tuple[str | ir.Column, str | ir.Column] | ir.BooleanValue
         ] = (),
         suffixes: tuple[str, str] = ("_x", "_y"),
+        hint: Literal["broadcast", "shuffle"] | None = None,
     ) -> Table:
         f"""Perform a{'n' * how.startswith(tuple("aeiou"))} {how} join between two tables.
 
@@ -70,13 +71,16 @@ def _regular_join_method(
         suffixes
             Left and right suffixes that will be used to rename overlapping
             columns.
+        hint
+            How to execute the join on backends that support several join
+            algorithms, see [`Table.join`][ibis.expr.types.relations.Table.join].
 
         Returns
         -------
         Table
             Joined table
         """  # noqa: E501
-        return self.join(right, predicates, how=how, suffixes=suffixes)
+        return self.join(right, predicates, how=how, suffixes=suffixes, hint=hint)
 
     f.__name__ = name
     return f
@@ -1087,6 +1091,7 @@ class Table(Expr, JupyterMixin):
         ] = 'inner',
         *,
         suffixes: tuple[str, str] = ("_x", "_y"),
+        hint: Literal["broadcast", "shuffle"] | None = None,
     ) -> Table:
         """Perform a join between two tables.
 
@@ -1103,6 +1108,13 @@ class Table(Expr, JupyterMixin):
         suffixes
             Left and right suffixes that will be used to rename overlapping
             columns.
+        hint
+            How to execute the join on backends that support several join
+            algorithms, such as dask. `"broadcast"` sends the whole table
+            whose unmatched rows are dropped to every partition of the other
+            table, `"shuffle"` partitions both tables by the join keys.
+            Backends choose on their own when `None`, other backends ignore
+            the hint.
         """
 
         _join_classes = {
@@ -1119,7 +1131,7 @@ class Table(Expr, JupyterMixin):
         }
 
         klass = _join_classes[how.lower()]
-        expr = klass(left, right, predicates).to_expr()
+        expr = klass(left, right, predicates, hint=hint).to_expr()
 
         # semi/anti join only give access to the left table's fields, so
         # there's never overlap
@@ -1334,6 +1346,47 @@ class Table(Expr, JupyterMixin):
         )
         return op.to_expr()
 
+    def cache(self) -> Table:
+        """Cache the results of a table expression.
+
+        The expression is materialized on its backend, e.g. as a temporary
+        table for SQL backends or as an in-memory dataframe for pandas, dask
+        and polars. Subsequent executions of expressions referencing the
+        original expression reuse the materialized results instead of
+        recomputing them.
+
+        The materialized results are released once no expression references
+        the returned table anymore, or explicitly by calling `release()` on
+        it or by using it as a context manager.
+
+        Returns
+        -------
+        Table
+            Cached table
+
+        Examples
+        --------
+        >>> import ibis
+        >>> t = ibis.memtable({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+        >>> with t.filter(t.a > 1).cache() as cached:
+        ...     result = cached.b.execute()
+        """
+        current_backend = self._find_backend(use_default=True)
+        return current_backend._cached(self)
+
+
+@public
+class CachedTable(Table):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.release()
+
+    def release(self) -> None:
+        """Release the underlying expression from the cache."""
+        return self.op().source._release_cached(self)
+
 
 def _resolve_predicates(
     table: Table, predicates
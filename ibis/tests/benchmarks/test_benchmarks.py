@@ -11,9 +11,12 @@ from packaging.version import parse as vparse
 
 import ibis
 import ibis.expr.datatypes as dt
+import ibis.expr.operations as ops
 import ibis.expr.types as ir
 from ibis.backends.base import _get_backend_names
 from ibis.backends.pandas.udf import udf
+from ibis.common.graph import Graph
+from ibis.common.grounds import interning
 
 pytestmark = pytest.mark.benchmark
 
@@ -135,6 +138,28 @@ def test_construction(benchmark, construction_fn, t, base):
     benchmark(construction_fn, t, base)
 
 
+def make_expr_from_scratch():
+    return make_large_expr(make_base(make_t()))
+
+
+@pytest.mark.benchmark(group="interning")
+@pytest.mark.parametrize("interned", [False, True], ids=["plain", "interned"])
+def test_construction_interning(benchmark, interned):
+    with interning(interned):
+        benchmark(make_expr_from_scratch)
+
+
+@pytest.mark.benchmark(group="interning")
+@pytest.mark.parametrize("interned", [False, True], ids=["plain", "interned"])
+def test_equality_interning(benchmark, interned):
+    with interning(interned):
+        # keep the first expression alive so the second one is built from
+        # the already interned nodes
+        left = make_expr_from_scratch()
+        right = make_expr_from_scratch()
+        benchmark(ir.Expr.equals, left, right)
+
+
 @pytest.mark.benchmark(group="builtins")
 @pytest.mark.parametrize(
     "expr_fn",
@@ -285,6 +310,19 @@ def high_card_grouped_rolling_udf_mean(t):
     return my_mean(t.value).over(high_card_rolling_window(t))
 
 
+@udf.reduction(['double'], 'double', batched=True)
+def my_batched_mean(values):
+    return values.mean(axis=-1)
+
+
+def low_card_grouped_rolling_batched_udf_mean(t):
+    return my_batched_mean(t.value).over(low_card_rolling_window(t))
+
+
+def high_card_grouped_rolling_batched_udf_mean(t):
+    return my_batched_mean(t.value).over(high_card_rolling_window(t))
+
+
 @udf.analytic(['double'], 'double')
 def my_zscore(series):
     return (series - series.mean()) / series.std()
@@ -358,6 +396,16 @@ broken_pandas_grouped_rolling = pytest.mark.xfail(
             id="high_card_grouped_rolling_udf_mean",
             marks=[broken_pandas_grouped_rolling],
         ),
+        pytest.param(
+            low_card_grouped_rolling_batched_udf_mean,
+            id="low_card_grouped_rolling_batched_udf_mean",
+            marks=[broken_pandas_grouped_rolling],
+        ),
+        pytest.param(
+            high_card_grouped_rolling_batched_udf_mean,
+            id="high_card_grouped_rolling_batched_udf_mean",
+            marks=[broken_pandas_grouped_rolling],
+        ),
         pytest.param(low_card_window_analytics_udf, id="low_card_window_analytics_udf"),
         pytest.param(
             high_card_window_analytics_udf, id="high_card_window_analytics_udf"
@@ -526,6 +574,172 @@ def test_op_args(benchmark):
     benchmark(lambda op: op.args, expr.op())
 
 
+@pytest.fixture(scope="module")
+def node_args():
+    table = ibis.table([("a", "int64"), ("b", "string")], name="t").op()
+    column = ops.TableColumn(table, "a")
+    return table, column, ops.Literal(1, dt.int64)
+
+
+@pytest.mark.benchmark(group="node_construction")
+@pytest.mark.parametrize(
+    "construct",
+    [
+        pytest.param(lambda _t, _c, _l: ops.Literal(1, dt.int64), id="literal"),
+        pytest.param(lambda t, _c, _l: ops.TableColumn(t, "a"), id="table_column"),
+        pytest.param(lambda _t, c, _l: ops.Alias(c, "x"), id="alias"),
+        pytest.param(lambda _t, c, lit: ops.Add(c, lit), id="add"),
+        pytest.param(lambda _t, c, lit: ops.Greater(c, lit), id="greater"),
+        pytest.param(lambda _t, c, _l: ops.Sum(c), id="sum"),
+        pytest.param(lambda _t, c, _l: ops.Cast(c, dt.float64), id="cast"),
+        pytest.param(lambda t, c, _l: ops.Selection(t, [c]), id="selection"),
+    ],
+)
+def test_node_construction(benchmark, construct, node_args):
+    benchmark(construct, *node_args)
+
+
+def make_generated_expr(width):
+    t = ibis.table({f"c{i}": "int64" for i in range(width)}, name="t")
+    columns = [t[f"c{i}"] for i in range(width)]
+    exprs = [
+        (left + right * i).name(f"e{i}")
+        for i, (left, right) in enumerate(zip(columns, columns[1:] + columns[:1]))
+    ]
+    return t.select(exprs).filter(exprs[0] > 0)
+
+
+@pytest.fixture(scope="module")
+def generated_expr():
+    # results in a graph of roughly 3000 nodes
+    return make_generated_expr(600)
+
+
+@pytest.mark.benchmark(group="traversal")
+def test_generated_graph_bfs(benchmark, generated_expr):
+    benchmark(Graph.from_bfs, generated_expr.op())
+
+
+@pytest.mark.benchmark(group="traversal")
+def test_generated_graph_toposort(benchmark, generated_expr):
+    graph = Graph.from_bfs(generated_expr.op())
+    benchmark(graph.toposort)
+
+
+@pytest.mark.benchmark(group="traversal")
+def test_generated_graph_map(benchmark, generated_expr):
+    benchmark(generated_expr.op().map, lambda node, **_: node)
+
+
+@pytest.mark.benchmark(group="traversal")
+def test_generated_graph_replace(benchmark, generated_expr):
+    op = generated_expr.op()
+    subs = {op.table: ibis.table(op.table.schema, name="u").op()}
+    benchmark(op.replace, subs)
+
+
+@pytest.fixture(scope="module")
+def wide_duckdb_table():
+    pytest.importorskip("duckdb")
+    pytest.importorskip("duckdb_engine")
+
+    columns = ", ".join(
+        f"TIMESTAMP '2020-01-01' + INTERVAL (i) SECOND AS ts{j}, "
+        f"[i, i + {j}] AS arr{j}, i * {j} AS num{j}"
+        for j in range(10)
+    )
+    con = ibis.duckdb.connect()
+    con.raw_sql(f"CREATE TABLE wide AS SELECT {columns} FROM range(100000) t(i)")
+    return con.table("wide")
+
+
+@pytest.mark.benchmark(group="duckdb_fetch")
+@pytest.mark.parametrize(
+    "arrow_dtypes",
+    [
+        False,
+        pytest.param(
+            True,
+            marks=pytest.mark.skipif(
+                not hasattr(pd, "ArrowDtype"),
+                reason="pandas.ArrowDtype requires pandas>=1.5",
+            ),
+        ),
+    ],
+    ids=["numpy", "arrow"],
+)
+def test_duckdb_fetch_wide(benchmark, wide_duckdb_table, arrow_dtypes):
+    with ibis.config.option_context("duckdb.arrow_dtypes", arrow_dtypes):
+        benchmark(wide_duckdb_table.execute)
+
+
+@pytest.fixture(scope="module")
+def log_lines():
+    n = 200_000
+    levels = np.random.choice(["INFO", "WARN", "ERROR"], size=n)
+    codes = np.random.randint(100, 600, size=n)
+    lines = pd.Series(levels).str.cat(
+        [pd.Series(codes).astype(str), pd.Series(["request served"] * n)], sep=" "
+    )
+    return ibis.pandas.connect(dict(logs=pd.DataFrame({"line": lines}))).table("logs")
+
+
+@pytest.mark.benchmark(group="pandas_strings")
+@pytest.mark.parametrize("arrow_strings", [False, True], ids=["map", "arrow"])
+@pytest.mark.parametrize(
+    "expr_fn",
+    [
+        pytest.param(
+            lambda t: t.filter(t.line.re_search(r"^ERROR 5\d\d")), id="re_search"
+        ),
+        pytest.param(lambda t: t.line.re_extract(r"(\w+) (\d+)", 2), id="re_extract"),
+        pytest.param(lambda t: t.line.re_replace(r"\d", "#"), id="re_replace"),
+        pytest.param(lambda t: t.line.like("WARN 4%"), id="like"),
+        pytest.param(lambda t: t.line.split(" "), id="split"),
+    ],
+)
+def test_pandas_string_ops(benchmark, log_lines, expr_fn, arrow_strings):
+    expr = expr_fn(log_lines)
+    with ibis.config.option_context("pandas.arrow_strings", arrow_strings):
+        benchmark(expr.execute)
+
+
+@pytest.fixture(scope="module")
+def window_df():
+    n = 100_000
+    return pd.DataFrame(
+        {
+            "key": np.random.permutation(n),
+            "value": np.random.rand(n),
+            "group": np.random.randint(0, 100, size=n),
+        }
+    )
+
+
+@pytest.mark.benchmark(group="dask_window")
+@pytest.mark.parametrize("npartitions", [1, 4, 16])
+@pytest.mark.parametrize(
+    "window_fn",
+    [
+        pytest.param(
+            lambda t: ibis.trailing_window(10, order_by=t.key), id="ordered_rows"
+        ),
+        pytest.param(
+            lambda t: ibis.trailing_window(10, order_by=t.key, group_by=t.group),
+            id="grouped_rows",
+        ),
+    ],
+)
+def test_dask_window(benchmark, window_df, window_fn, npartitions):
+    dd = pytest.importorskip("dask.dataframe")
+
+    t = ibis.dask.connect(
+        {"t": dd.from_pandas(window_df, npartitions=npartitions)}
+    ).table("t")
+    expr = t.mutate(rolling=t.value.mean().over(window_fn(t)))
+    benchmark(expr.execute)
+
+
 @pytest.mark.benchmark(group="datatype")
 def test_complex_datatype_parse(benchmark):
     type_str = "array<struct<a: array<string>, b: map<string, array<int64>>>>"
@@ -0,0 +1,147 @@
+"""Benchmarks for expressions of increasing size.
+
+Every expression shape is generated at a small, medium and large size and
+measured for construction, `repr` and compilation with every SQL compiler.
+When benchmarks are enabled the peak memory allocated by construction and
+compilation is stored in each benchmark's `extra_info`, for
+`ci/benchmark_report.py` to compare against a baseline.
+"""
+
+from __future__ import annotations
+
+import functools
+import tracemalloc
+
+import pytest
+
+import ibis
+from ibis.backends.base import _get_backend_names
+
+pytestmark = pytest.mark.benchmark
+
+
+def make_table(num_columns, name="t"):
+    return ibis.table(
+        {"k": "int64", **{f"c{i:d}": "float64" for i in range(num_columns)}},
+        name=name,
+    )
+
+
+def wide_projection(num_columns):
+    t = make_table(num_columns)
+    return t.select(
+        t.k, *((t[f"c{i:d}"] * 2 + 1).name(f"c{i:d}") for i in range(num_columns))
+    )
+
+
+def cte_chain(depth):
+    expr = make_table(4)
+    for _ in range(depth):
+        agg = expr.group_by("k").aggregate(
+            c0=lambda t: t.c0.sum(),
+            c1=lambda t: t.c1.max(),
+            c2=lambda t: t.c2.min(),
+            c3=lambda t: t.c3.mean(),
+        )
+        # the scalar subquery references `agg` a second time, which turns
+        # every level of the chain into a common table expression
+        expr = agg.filter(agg.c0 > agg.c0.mean())
+    return expr
+
+
+def star_joins(num_joins):
+    fact = ibis.table(
+        {"id": "int64", **{f"k{i:d}": "int64" for i in range(num_joins)}},
+        name="fact",
+    )
+    expr = fact
+    columns = [fact.id]
+    for i in range(num_joins):
+        dim = ibis.table({f"k{i:d}": "int64", f"v{i:d}": "string"}, name=f"dim{i:d}")
+        expr = expr.left_join(dim, f"k{i:d}")
+        columns.append(dim[f"v{i:d}"])
+    return expr.select(columns)
+
+
+def large_union(num_tables):
+    t = make_table(4)
+    return ibis.union(
+        *(t.filter(t.k == i).mutate(source=ibis.literal(i)) for i in range(num_tables))
+    )
+
+
+def wide_case(num_cases):
+    t = make_table(1)
+    case = ibis.case()
+    for i in range(num_cases):
+        case = case.when(t.k == i, f"v{i:d}")
+    return t.select(t.k, case.else_("other").end().name("label"))
+
+
+_SHAPES = {
+    "wide_projection": (wide_projection, (10, 100, 500)),
+    "cte_chain": (cte_chain, (2, 8, 32)),
+    "star_joins": (star_joins, (2, 12, 24)),
+    "large_union": (large_union, (2, 20, 100)),
+    "wide_case": (wide_case, (10, 100, 500)),
+}
+
+_SIZES = [
+    pytest.param(make_expr, size, id=f"{shape}-{size:d}")
+    for shape, (make_expr, sizes) in _SHAPES.items()
+    for size in sizes
+]
+
+# backends that compile expressions to SQL; pyspark compiles to DataFrame
+# method calls and spark is an alias of it
+_SQL_BACKENDS = sorted(
+    set(_get_backend_names())
+    - {"dask", "datafusion", "pandas", "polars", "pyspark", "spark"}
+)
+
+
+@functools.cache
+def built_expr(make_expr, size):
+    """Build an expression once for every benchmark that only consumes it."""
+    return make_expr(size)
+
+
+def record_peak_memory(benchmark, fn, *args):
+    """Store the peak memory allocated by one call of `fn` in `benchmark`."""
+    if benchmark.disabled:
+        return
+
+    tracemalloc.start()
+    try:
+        fn(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_memory"] = peak
+
+
+@pytest.mark.benchmark(group="scale_construction")
+@pytest.mark.parametrize(("make_expr", "size"), _SIZES)
+def test_scale_construction(benchmark, make_expr, size):
+    benchmark(make_expr, size)
+    record_peak_memory(benchmark, make_expr, size)
+
+
+@pytest.mark.benchmark(group="scale_repr")
+@pytest.mark.parametrize(("make_expr", "size"), _SIZES)
+def test_scale_repr(benchmark, make_expr, size):
+    benchmark(repr, built_expr(make_expr, size))
+
+
+@pytest.mark.benchmark(group="scale_compile")
+@pytest.mark.parametrize("module", _SQL_BACKENDS)
+@pytest.mark.parametrize(("make_expr", "size"), _SIZES)
+def test_scale_compile(benchmark, module, make_expr, size):
+    try:
+        mod = getattr(ibis, module)
+    except (AttributeError, ImportError) as e:
+        pytest.skip(str(e))
+
+    expr = built_expr(make_expr, size)
+    benchmark(mod.compile, expr)
+    record_peak_memory(benchmark, mod.compile, expr)
@@ -322,3 +322,50 @@ def test_large_compile(num_joins):
         table = table.left_join(table, ["dummy"])[[table]]
         stop = time.time()
         assert stop - start < 1.0
+
+
+def test_find_scan_pushdowns():
+    t = ibis.table(dict(a="int64", b="string", c="float64"), name="t")
+
+    expr = t.filter([t.a > 1, t.b == "x"]).c.sum()
+    columns, predicates = L.find_scan_pushdowns(expr.op(), t.op())
+    assert columns == {"a", "b", "c"}
+    assert predicates == ((t.a > 1).op(), (t.b == "x").op())
+
+    expr = t.filter(t.a > 1).order_by("c").select("c")
+    columns, _ = L.find_scan_pushdowns(expr.op(), t.op())
+    assert columns == {"a", "c"}
+
+    columns, predicates = L.find_scan_pushdowns(t.filter(t.a > 1).op(), t.op())
+    assert columns is None
+    assert predicates == ((t.a > 1).op(),)
+
+    expr = t.filter(t.a > 1).b.value_counts()
+    columns, predicates = L.find_scan_pushdowns(expr.op(), t.op())
+    assert columns == {"a", "b"}
+    assert predicates == ((t.a > 1).op(),)
+
+
+@pytest.mark.parametrize(
+    "make_expr",
+    [
+        pytest.param(lambda t: t.mutate(s=t.a.sum()).filter(t.a > 95), id="reduction"),
+        pytest.param(lambda t: t.mutate(r=t.a.rank()).filter(t.a > 95), id="analytic"),
+        pytest.param(
+            lambda t: t.filter([t.a > t.a.mean(), t.b == "x"]), id="predicate"
+        ),
+    ],
+)
+def test_find_scan_pushdowns_values_over_whole_table(make_expr):
+    t = ibis.table(dict(a="int64", b="string"), name="t")
+    expr = make_expr(t)
+    _, predicates = L.find_scan_pushdowns(expr.op(), t.op())
+    assert predicates == ()
+
+
+def test_find_scan_pushdowns_table_used_twice():
+    t = ibis.table(dict(a="int64", b="string"), name="t")
+    expr = t.filter(t.a > 1).union(t)
+    columns, predicates = L.find_scan_pushdowns(expr.op(), t.op())
+    assert columns is None
+    assert predicates == ()
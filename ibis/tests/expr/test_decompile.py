@@ -30,6 +30,11 @@ population_density_per_country = asian_countries.group_by('name').aggregate(
     _.population.sum() / _.area_km2.sum()
 )
 
+capitals = ibis.table([('country', 'string'), ('capital', 'string')], name='capitals')
+broadcast_join = asian_countries.left_join(
+    capitals, asian_countries.name == capitals.country, hint='broadcast'
+)
+
 one = ibis.literal(1)
 two = ibis.literal(2)
 three = one + two
@@ -58,6 +63,7 @@ def test_schema():
         (top_with_highest_population, top_with_highest_population),
         (overall_population_density, overall_population_density),
         (population_density_per_country, population_density_per_country),
+        (broadcast_join, broadcast_join),
         (three, 3),
         (nine, nine_),
     ],
@@ -65,6 +71,7 @@ def test_schema():
         "top_with_highest_population",
         "overall_population_density",
         "population_density_per_country",
+        "broadcast_join",
         "three",
         "nine",
     ],
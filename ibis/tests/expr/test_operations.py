@@ -142,12 +142,13 @@ def test_node_base():
     results = values.map(record)
 
     assert results == returns
+    # nodes are visited in post-order, children before their parents
     assert calls == [
         (Name("one"), (), {"name": "one"}),
-        (Name("two"), (), {"name": "two"}),
-        (Name("three"), (), {"name": "three"}),
         (one, (), {"value": 1, "name": "Name_one"}),
+        (Name("two"), (), {"name": "two"}),
         (two, (), {"value": 2, "name": "Name_two"}),
+        (Name("three"), (), {"name": "three"}),
         (three, (), {"value": 3, "name": "Name_three"}),
         (
             values,
@@ -802,6 +802,20 @@ def test_join_deferred(con):
     assert_equal(res, exp)
 
 
+def test_join_hint(con):
+    region = con.table("tpch_region")
+    nation = con.table("tpch_nation")
+    pred = region.r_regionkey == nation.n_regionkey
+
+    joined = region.left_join(nation, pred, hint="broadcast")
+    assert joined.op().hint == "broadcast"
+    assert region.join(nation, pred).op().hint is None
+    assert not joined.equals(region.left_join(nation, pred))
+
+    with pytest.raises(ValueError, match="not in"):
+        region.join(nation, pred, hint="nested_loop")
+
+
 def test_asof_join():
     left = ibis.table([('time', 'int32'), ('value', 'double')])
     right = ibis.table([('time', 'int32'), ('value2', 'double')])
@@ -1613,6 +1627,44 @@ def test_memtable_filter():
     assert expr.columns == ["x", "y"]
 
 
+def test_memtable_pyarrow():
+    pa = pytest.importorskip("pyarrow")
+    from ibis.backends.pyarrow import PyArrowInMemoryTable
+
+    data = pa.table({"x": [1, 2, 3], "y": ["a", "b", None]})
+    t = ibis.memtable(data)
+    assert isinstance(t.op(), PyArrowInMemoryTable)
+    assert t.op().data.to_pyarrow() is data
+    assert t.schema() == ibis.schema(dict(x="int64", y="string"))
+
+    t = ibis.memtable(data, columns=["a", "b"])
+    assert t.columns == ["a", "b"]
+
+    t = ibis.memtable(data, schema=dict(a="float64", b="string"))
+    assert t.schema() == ibis.schema(dict(a="float64", b="string"))
+    assert t.op().data.to_pyarrow()["a"].type == pa.float64()
+
+
+def test_memtable_fingerprint(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+
+    data = pa.table({"x": [1, 2, 3], "y": ["a", "b", None]})
+    path = tmp_path / "data.arrow"
+    with pa.ipc.new_file(path, data.schema) as writer:
+        writer.write_table(data)
+    with pa.memory_map(str(path)) as source:
+        mapped = pa.ipc.open_file(source).read_all()
+
+    fingerprint = ibis.memtable(data).op().data.fingerprint
+    assert ibis.memtable(mapped).op().data.fingerprint == fingerprint
+    assert ibis.memtable(data.slice(1)).op().data.fingerprint != fingerprint
+
+    df = data.to_pandas()
+    fingerprint = ibis.memtable(df).op().data.fingerprint
+    assert ibis.memtable(df.copy()).op().data.fingerprint == fingerprint
+    assert ibis.memtable(df.iloc[1:]).op().data.fingerprint != fingerprint
+
+
 def test_default_backend_with_unbound_table():
     t = ibis.table(dict(a="int"), name="t")
     expr = t.a.sum()
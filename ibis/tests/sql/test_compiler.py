@@ -1,7 +1,9 @@
 import datetime
 
 import ibis
+from ibis.backends.base.sql import BaseSQLBackend
 from ibis.backends.base.sql.compiler import Compiler
+from ibis.tests.expr.mocks import MockBackend
 from ibis.tests.sql.conftest import to_sql
 from ibis.tests.util import assert_decompile_roundtrip
 
@@ -218,3 +220,51 @@ def test_column_expr_default_name(snapshot):
     expr = t.int_col + 4
     snapshot.assert_match(to_sql(expr), "out.sql")
     assert_decompile_roundtrip(expr, snapshot)
+
+
+class CachingMockBackend(MockBackend):
+    # the mock backend compiles without going through the compiled query cache
+    compile = BaseSQLBackend.compile
+
+
+def test_compile_cache_follows_options():
+    t = ibis.table([('a', 'int64')], name='t')
+    expr = t.filter(t.a > 1)
+    con = CachingMockBackend()
+
+    con.compile(expr)
+    assert con.compile_cache_info().currsize == 0
+
+    with ibis.config.option_context('sql.compile_cache.maxsize', 8):
+        con.compile(expr)
+        con.compile(expr)
+        assert con.compile_cache_info().hits == 1
+        assert con.compile_cache_info().currsize == 1
+
+    con.compile(expr)
+    assert con.compile_cache_info().currsize == 0
+
+
+def test_compile_cache_on_disk(tmp_path):
+    t = ibis.table([('a', 'int64'), ('b', 'string')], name='t')
+    expr = t.filter(t.a > 1).group_by('b').aggregate(total=t.a.sum())
+
+    options = {
+        'sql.compile_cache.maxsize': 8,
+        'sql.compile_cache.path': str(tmp_path / 'queries.db'),
+    }
+    with ibis.config.options(options):
+        sql = CachingMockBackend().compile(expr)
+        assert isinstance(sql, str)
+
+        con = CachingMockBackend()
+        assert con.compile(expr) == sql
+        # the query is read from the store and kept in memory afterwards
+        assert con.compile_cache_info()[:2] == (0, 1)
+        assert con.compile_cache_info().currsize == 1
+
+        query_ast, compiled = con._to_compiled_query(expr)
+        assert query_ast is not None
+        assert compiled == sql
+        assert con.compile(expr) == sql
+        assert con.compile_cache_info()[:2] == (2, 1)
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
+import ibis.common.exceptions as com
 import ibis.expr.datatypes as dt
 import ibis.udf.validate as v
 from ibis.expr.operations import (
@@ -191,7 +192,7 @@ class UserDefinedFunction:
     UDF.
     """
 
-    def __init__(self, func, func_type, input_type, output_type):
+    def __init__(self, func, func_type, input_type, output_type, batched=False):
         v.validate_input_type(input_type, func)
         v.validate_output_type(output_type)
 
@@ -199,8 +200,14 @@ class UserDefinedFunction:
         self.func_type = func_type
         self.input_type = list(map(dt.dtype, input_type))
         self.output_type = dt.dtype(output_type)
+        self.batched = batched
         self.coercion_fn = self._get_coercion_function()
 
+        if batched and self.coercion_fn is not None:
+            raise com.IbisTypeError(
+                'Batched UDFs must be reductions with a scalar output type'
+            )
+
     def _get_coercion_function(self):
         """Return the appropriate function to coerce the result of the UDF,
         according to the func type and output type of the UDF."""
@@ -237,6 +244,10 @@ class UserDefinedFunction:
         def func(*args):
             # If cols are pd.Series, then we save and restore the index.
             saved_index = getattr(args[0], 'index', None)
+            if self.batched:
+                # batched functions always operate on numpy arrays, whether
+                # they are given a single group or a batch of windows
+                args = tuple(getattr(arg, 'values', arg) for arg in args)
             result = self.func(*args, **kwargs)
             if self.coercion_fn:
                 # coercion function signature must take result, output type,
@@ -244,6 +255,9 @@ class UserDefinedFunction:
                 result = self.coercion_fn(result, self.output_type, saved_index)
             return result
 
+        # consulted by the pandas backend when computing bounded windows
+        func.batched = self.batched
+
         op = self.func_type(
             func=func,
             func_args=args,
@@ -254,9 +268,9 @@ class UserDefinedFunction:
         return op.to_expr()
 
 
-def _udf_decorator(node_type, input_type, output_type):
+def _udf_decorator(node_type, input_type, output_type, **kwargs):
     def wrapper(func):
-        return UserDefinedFunction(func, node_type, input_type, output_type)
+        return UserDefinedFunction(func, node_type, input_type, output_type, **kwargs)
 
     return wrapper
 
@@ -346,7 +360,7 @@ def elementwise(input_type, output_type):
     return _udf_decorator(ElementWiseVectorizedUDF, input_type, output_type)
 
 
-def reduction(input_type, output_type):
+def reduction(input_type, output_type, batched=False):
     """Define a user-defined reduction function that takes N pandas Series or
     scalar values as inputs and produces one row of output.
 
@@ -358,6 +372,13 @@ def reduction(input_type, output_type):
         function. Variadic arguments are not yet supported.
     output_type : ibis.expr.datatypes.DataType
         The return type of the function.
+    batched : bool
+        Whether the function can reduce many windows in a single call.
+        Batched functions receive numpy arrays instead of pandas Series: 1-D
+        arrays when reducing a single group, and 2-D arrays holding one
+        window per row when evaluated over a bounded window, in which case
+        they must return one value per row. Reducing along ``axis=-1``
+        handles both. Only scalar output types are supported.
 
     Examples
     --------
@@ -381,5 +402,14 @@ def reduction(input_type, output_type):
     >>> table = table.group_by('key').aggregate(
     ...     mean_and_std(table['v']).destructure()
     ... )
+
+    Define a reduction that computes every window of a rolling window at
+    once:
+
+    >>> @reduction(input_type=[dt.double], output_type=dt.double, batched=True)
+    ... def my_mean(v):
+    ...     return v.mean(axis=-1)
     """
-    return _udf_decorator(ReductionVectorizedUDF, input_type, output_type)
+    return _udf_decorator(
+        ReductionVectorizedUDF, input_type, output_type, batched=batched
+    )
@@ -30,6 +30,7 @@ import toolz
 
 if TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
 
     import ibis.expr.operations as ops
 
@@ -505,6 +506,15 @@ class ToFrame(abc.ABC):
     def to_frame(self) -> pd.DataFrame:
         ...
 
+    @abc.abstractmethod
+    def to_pyarrow(self) -> pa.Table:
+        ...
+
+    @property
+    @abc.abstractmethod
+    def fingerprint(self) -> str:
+        """Digest of the contents, used to avoid registering data twice."""
+
 
 def backend_entry_points() -> list[importlib.metadata.EntryPoint]:
     """Get the list of installed `ibis.backend` entrypoints."""